@@ -0,0 +1,393 @@
+import argparse
+import datetime
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import otaku_hang_man as game
+
+# ============================================================
+#  OTAKU HANGMAN - ROUND JOURNAL ANALYTICS
+#
+#  Streams round journals (otaku_save.rounds.jsonl, saves/<name>.rounds.jsonl) one
+#  line at a time and keeps only bounded aggregates, so a year of history costs the
+#  same memory as a day:
+#    - online mean / variance (Welford) for guesses, misses and sigil triggers
+#    - count-min sketches + a small top-k table for per-word / per-franchise counts
+#    - exact tables only where the key space is tiny (modes, streak lengths, days)
+#
+#    python otaku_analytics.py                          (the local save's journal)
+#    python otaku_analytics.py saves/ --since 2024-02-01 --top 15
+#    cat *.rounds.jsonl | python otaku_analytics.py - --json
+# ============================================================
+
+DEFAULT_TOP = 10
+DEFAULT_DAYS = 7
+SKETCH_WIDTH = 4096
+SKETCH_DEPTH = 4
+
+
+class RunningStats:
+    """Welford's online mean / variance, plus min and max."""
+
+    __slots__ = ("n", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return self.variance ** 0.5
+
+    def as_dict(self):
+        return {"n": self.n, "mean": round(self.mean, 3), "stdev": round(self.stdev, 3),
+                "min": self.min, "max": self.max}
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimates: never under-counts, over-counts by ~total/width."""
+
+    def __init__(self, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def add(self, key, n=1):
+        """Count `key` and return its new estimate."""
+        est = None
+        for row, i in zip(self.rows, _cells(key, self.width, self.depth)):
+            row[i] += n
+            if est is None or row[i] < est:
+                est = row[i]
+        return est
+
+    def estimate(self, key):
+        return min(row[i] for row, i in zip(self.rows, _cells(key, self.width, self.depth)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cells(key, width, depth):
+    """One column per sketch row; journals repeat the same words, so the hashes are cached."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * depth).digest()
+    return tuple(int.from_bytes(digest[4 * d:4 * d + 4], "little") % width for d in range(depth))
+
+
+class HeavyHitters:
+    """Count-min sketch plus the k keys with the highest estimates seen so far."""
+
+    def __init__(self, k=DEFAULT_TOP, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.top = {}
+        self._floor = 0  # smallest estimate in `top` once it is full
+
+    def add(self, key, n=1):
+        est = self.sketch.add(key, n)
+        top = self.top
+        if key in top or len(top) < self.k:
+            top[key] = est
+        elif est > self._floor:
+            del top[min(top, key=top.get)]
+            top[key] = est
+        else:
+            return est
+        if len(top) >= self.k:
+            self._floor = min(top.values())
+        return est
+
+    def estimate(self, key):
+        return self.sketch.estimate(key)
+
+    def most_common(self):
+        return sorted(self.top.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+# ======================
+#  Aggregator
+# ======================
+
+class JournalStats:
+    """Feed journal records with add(); everything is updated in O(1)."""
+
+    def __init__(self, top=DEFAULT_TOP, since=None, until=None):
+        self.since = since
+        self.until = until
+        self.records = 0
+        self.skipped = 0
+        self.bad = 0
+        self.rounds = 0
+        self.wins = 0
+        self.guesses = RunningStats()
+        self.wrong = RunningStats()
+        self.win_guesses = RunningStats()
+        self.sigils = RunningStats()
+        self.sigil_rounds = 0
+        self.modes = {}                      # mode -> [rounds, wins, RunningStats(guesses)]
+        self.days = {}                       # "YYYY-MM-DD" -> [rounds, wins]
+        self.words = HeavyHitters(top)
+        self.word_wins = CountMinSketch()
+        self.word_losses = HeavyHitters(top)
+        self.franchises = HeavyHitters(top)
+        self.franchise_wins = CountMinSketch()
+        self.streaks = {}                    # streak length -> runs ending there
+        self.streak_len = RunningStats()
+        self.streak_clears = 0
+
+    def add_line(self, line):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            record = json.loads(line)
+        except ValueError:
+            self.bad += 1
+            return
+        if not isinstance(record, dict):
+            self.bad += 1
+            return
+        self.add(record)
+
+    def add(self, record):
+        """Count one record; a record with a malformed field counts as bad, not fatal."""
+        self.records += 1
+        try:
+            date = _text(record.get("date"), "")
+            if (self.since and date < self.since) or (self.until and date > self.until):
+                self.skipped += 1
+                return
+            kind = record.get("kind")
+            if kind == "round":
+                self._add_round(record, date)
+            elif kind == "streak":
+                self._add_streak(record)
+            else:
+                self.skipped += 1
+        except (TypeError, ValueError):
+            self.bad += 1
+
+    def _add_streak(self, record):
+        length = _count(record.get("length"))
+        cleared = bool(record.get("cleared"))
+        self.streaks[length] = self.streaks.get(length, 0) + 1
+        self.streak_len.add(length)
+        self.streak_clears += cleared
+
+    def _add_round(self, record, date):
+        # validate every field before touching any aggregate
+        won = bool(record.get("won"))
+        guesses = _count(record.get("guesses"))
+        wrong = _count(record.get("wrong"))
+        sigils = _count(record.get("sigils"))
+        name = _text(record.get("mode"), "play")
+        word = _text(record.get("word"), "?")
+        franchise = _text(record.get("franchise"), "")
+
+        self.rounds += 1
+        self.wins += won
+        self.guesses.add(guesses)
+        self.wrong.add(wrong)
+        self.sigils.add(sigils)
+        self.sigil_rounds += sigils > 0
+        if won:
+            self.win_guesses.add(guesses)
+
+        mode = self.modes.get(name)
+        if mode is None:
+            mode = self.modes[name] = [0, 0, RunningStats()]
+        mode[0] += 1
+        mode[1] += won
+        mode[2].add(guesses)
+
+        day = self.days.get(date)
+        if day is None:
+            day = self.days[date] = [0, 0]
+        day[0] += 1
+        day[1] += won
+
+        self.words.add(word)
+        if won:
+            self.word_wins.add(word)
+        else:
+            self.word_losses.add(word)
+        if franchise:
+            self.franchises.add(franchise)
+            if won:
+                self.franchise_wins.add(franchise)
+
+    # -------------------------
+    # Output
+    # -------------------------
+    def _rated(self, hitters, wins):
+        return [(key, plays, min(wins.estimate(key), plays)) for key, plays in hitters.most_common()]
+
+    def as_dict(self, days=DEFAULT_DAYS):
+        return {
+            "records": self.records,
+            "skipped": self.skipped,
+            "bad_lines": self.bad,
+            "rounds": self.rounds,
+            "wins": self.wins,
+            "win_rate": _rate(self.wins, self.rounds),
+            "guesses": self.guesses.as_dict(),
+            "guesses_when_won": self.win_guesses.as_dict(),
+            "wrong": self.wrong.as_dict(),
+            "sigils": {**self.sigils.as_dict(), "rounds_triggered": self.sigil_rounds,
+                       "trigger_rate": _rate(self.sigil_rounds, self.rounds)},
+            "modes": {m: {"rounds": r, "wins": w, "win_rate": _rate(w, r), "guesses": g.as_dict()}
+                      for m, (r, w, g) in sorted(self.modes.items())},
+            "days": {d: {"rounds": r, "wins": w} for d, (r, w) in sorted(self.days.items())[-days:]},
+            "words": [{"word": k, "plays": p, "wins": w, "win_rate": _rate(w, p)}
+                      for k, p, w in self._rated(self.words, self.word_wins)],
+            "hardest_words": [{"word": k, "losses": n} for k, n in self.word_losses.most_common()],
+            "franchises": [{"franchise": k, "plays": p, "wins": w, "win_rate": _rate(w, p)}
+                           for k, p, w in self._rated(self.franchises, self.franchise_wins)],
+            "streaks": {"runs": self.streak_len.n, "clears": self.streak_clears,
+                        "lengths": {str(k): v for k, v in sorted(self.streaks.items())},
+                        "length": self.streak_len.as_dict()},
+        }
+
+    def report(self, days=DEFAULT_DAYS):
+        lines = [
+            f"rounds {self.rounds}  wins {self.wins}  win rate {_pct(self.wins, self.rounds)}"
+            f"  (records {self.records}, filtered {self.skipped}, bad lines {self.bad})",
+            f"guesses/round  {_stats(self.guesses)}",
+            f"  when won     {_stats(self.win_guesses)}",
+            f"misses/round   {_stats(self.wrong)}",
+            f"sigil triggers {_stats(self.sigils)}  rounds with one: {_pct(self.sigil_rounds, self.rounds)}",
+        ]
+        if self.modes:
+            lines.append("\nby mode:")
+            for mode, (r, w, g) in sorted(self.modes.items()):
+                lines.append(f"  {mode:<10} {r:>7} rounds  win {_pct(w, r):>6}  guesses {g.mean:.1f}")
+        if self.days:
+            lines.append(f"\nlast {days} days:")
+            for date, (r, w) in sorted(self.days.items())[-days:]:
+                lines.append(f"  {date or '?':<10} {r:>7} rounds  win {_pct(w, r):>6}")
+        if self.words.top:
+            lines.append("\nmost played words (estimated):")
+            for word, plays, wins in self._rated(self.words, self.word_wins):
+                lines.append(f"  {word:<24} {plays:>7}  win {_pct(wins, plays):>6}")
+        if self.word_losses.top:
+            lines.append("\nmost lost words (estimated):")
+            for word, losses in self.word_losses.most_common():
+                lines.append(f"  {word:<24} {losses:>7}")
+        if self.franchises.top:
+            lines.append("\nby franchise (estimated):")
+            for name, plays, wins in self._rated(self.franchises, self.franchise_wins):
+                lines.append(f"  {name:<24} {plays:>7}  win {_pct(wins, plays):>6}")
+        if self.streaks:
+            lines.append(f"\nchallenge streaks: {self.streak_len.n} runs, {self.streak_clears} reached "
+                         f"{game.WINS_IN_A_ROW_TO_CLEAR}, mean length {self.streak_len.mean:.2f}")
+            peak = max(self.streaks.values())
+            for length, n in sorted(self.streaks.items()):
+                bar = "#" * max(1, round(30 * n / peak))
+                lines.append(f"  {length:>2} {n:>7} {bar}")
+        return "\n".join(lines)
+
+
+def _count(value):
+    """Journal count field -> int >= 0. Raises ValueError / TypeError on anything else."""
+    if value is None:
+        return 0
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f"not a count: {value!r}")
+    n = int(value)
+    if n < 0:
+        raise ValueError(f"negative count: {n}")
+    return n
+
+
+def _text(value, default):
+    """Journal string field (None / "" -> default). Raises TypeError on non-strings."""
+    if value is None or value == "":
+        return default
+    if not isinstance(value, str):
+        raise TypeError(f"not a string: {value!r}")
+    return value
+
+
+def _rate(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+def _pct(part, whole):
+    return f"{100 * part / whole:.1f}%" if whole else "-"
+
+
+def _stats(s):
+    if not s.n:
+        return "-"
+    return f"mean {s.mean:.2f}  sd {s.stdev:.2f}  min {s.min}  max {s.max}"
+
+
+def find_journals(paths):
+    """Files as given ('-' = stdin); directories are searched for *.rounds.jsonl."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                found.extend(os.path.join(root, f) for f in files if f.endswith(game.JOURNAL_SUFFIX))
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def _date_arg(text):
+    return datetime.date.fromisoformat(text).isoformat()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Streaming stats over Otaku Hangman round journals")
+    ap.add_argument("paths", nargs="*", help="journal files or directories ('-' = stdin; default: local save's journal)")
+    ap.add_argument("--since", type=_date_arg, default=None, help="first day to count (YYYY-MM-DD)")
+    ap.add_argument("--until", type=_date_arg, default=None, help="last day to count (YYYY-MM-DD)")
+    ap.add_argument("--top", type=int, default=DEFAULT_TOP, help="words / franchises to list")
+    ap.add_argument("--days", type=int, default=DEFAULT_DAYS, help="daily rows to list")
+    ap.add_argument("--json", action="store_true", help="print the aggregates as JSON")
+    args = ap.parse_args(argv)
+
+    paths = args.paths or [os.path.splitext(game.SAVE_FILE)[0] + game.JOURNAL_SUFFIX]
+    stats = JournalStats(top=args.top, since=args.since, until=args.until)
+    for path in find_journals(paths):
+        if path == "-":
+            for line in sys.stdin:
+                stats.add_line(line)
+            continue
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    stats.add_line(line)
+        except OSError as e:
+            print(f"skipped {path}: {e}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(stats.as_dict(args.days), ensure_ascii=False, indent=2))
+    else:
+        print(stats.report(args.days))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+import argparse
+import datetime
+import difflib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+
+import otaku_hang_man as game
+
+# ============================================================
+#  OTAKU HANGMAN - BATCH TRANSCRIPT DRIVER
+#
+#  Regression corpora: each transcript is fed to the game in-process (same
+#  GameSession + run_blocking host as main()) and its output is diffed against
+#  a golden file. A worker pool spreads transcripts across cores.
+#
+#    python otaku_batch.py run tests/transcripts [--jobs 8] [--update]
+#    python otaku_batch.py generate tests/transcripts --count 1000 [--seed 1]
+#
+#  Transcript  <name>.in : one input line per line (what the player types).
+#              Optional header lines at the top:
+#                #seed 42                      random seed (default: crc32 of name)
+#                #date 2024-02-14              pinned date (default 2000-01-01)
+#                #save {"dazy_unlocked": true} starting save (default: fresh save)
+#  Golden      <name>.out: expected output. Prompts are followed by the typed
+#              line, like a terminal shows them. Pauses are skipped and the
+#              save file path is printed as <save>.
+# ============================================================
+
+TRANSCRIPT_EXT = ".in"
+GOLDEN_EXT = ".out"
+DEFAULT_DATE = datetime.date(2000, 1, 1)
+MAX_DIFF_LINES = 40
+SAVE_PATH_MARK = "<save>"
+
+
+def parse_transcript(text, name=""):
+    """-> (header dict, input lines). Header lines only count before the first input line."""
+    header = {"seed": zlib.crc32(name.encode("utf-8")), "date": DEFAULT_DATE, "save": None}
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    i = 0
+    while i < len(lines) and lines[i].startswith("#"):
+        key, _, value = lines[i][1:].partition(" ")
+        value = value.strip()
+        if key == "seed":
+            header["seed"] = int(value)
+        elif key == "date":
+            header["date"] = datetime.date.fromisoformat(value)
+        elif key == "save":
+            header["save"] = json.loads(value)
+        else:
+            raise ValueError(f"unknown transcript header #{key}")
+        i += 1
+    return header, lines[i:]
+
+
+def find_transcripts(paths):
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                found.extend(os.path.join(root, f) for f in files if f.endswith(TRANSCRIPT_EXT))
+        elif path.endswith(TRANSCRIPT_EXT):
+            found.append(path)
+    return sorted(found)
+
+
+# ======================
+#  Worker
+# ======================
+
+class _Worker:
+    """Per-process state: one output buffer and one save file, reused for every transcript."""
+
+    def __init__(self, saves_dir):
+        self.buf = io.StringIO()
+        self.saves_dir = tempfile.mkdtemp(prefix="w", dir=saves_dir)
+        self.save_path = os.path.join(self.saves_dir, "save" + game.SAVE_EXT)
+        self.journal_path = os.path.splitext(self.save_path)[0] + game.JOURNAL_SUFFIX
+        self.pacing = game.Pacing("skip", auto_ack=False)
+
+    def run(self, header, inputs):
+        """Play one transcript; returns its full output."""
+        buf = self.buf
+        buf.seek(0)
+        buf.truncate()
+
+        for path in [self.save_path, self.save_path + ".bad", self.journal_path] + game.save_generations(self.save_path):
+            if os.path.exists(path):
+                os.remove(path)
+        if header["save"] is not None:
+            with open(self.save_path, "wb") as f:
+                f.write(game.encode_save(game.migrate_save(header["save"])))
+
+        lines = iter(inputs)
+
+        def read(prompt):
+            buf.write(prompt)
+            try:
+                line = next(lines)
+            except StopIteration:
+                raise EOFError
+            buf.write(line + "\n")
+            return line
+
+        random.seed(header["seed"])
+        session = game.GameSession(write=buf.write, save_path=self.save_path,
+                                   pacing=self.pacing, today=header["date"])
+        try:
+            game.run_blocking(session, read=read)
+        finally:
+            session.close()
+        # the stats screen prints the save path; keep goldens independent of the temp dir
+        return buf.getvalue().replace(self.save_path, SAVE_PATH_MARK)
+
+
+_worker = None
+
+
+def _init_worker(saves_dir):
+    global _worker
+    _worker = _Worker(saves_dir)
+
+
+def run_one(job):
+    """(path, update) -> result dict. Runs inside a worker (or inline with --jobs 1)."""
+    path, update = job
+    name = os.path.splitext(path)[0]
+    golden_path = name + GOLDEN_EXT
+    t0 = time.perf_counter()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            header, inputs = parse_transcript(f.read(), os.path.basename(name))
+        output = _worker.run(header, inputs)
+    except Exception as e:
+        return {"path": path, "status": "error", "detail": repr(e), "seconds": time.perf_counter() - t0}
+    elapsed = time.perf_counter() - t0
+
+    expected = None
+    if os.path.exists(golden_path):
+        with open(golden_path, "r", encoding="utf-8", newline="") as f:
+            expected = f.read()
+    if expected == output:
+        return {"path": path, "status": "pass", "seconds": elapsed}
+    if update:
+        with open(golden_path, "w", encoding="utf-8", newline="") as f:
+            f.write(output)
+        return {"path": path, "status": "updated", "seconds": elapsed}
+    if expected is None:
+        return {"path": path, "status": "fail", "detail": "missing golden " + golden_path, "seconds": elapsed}
+    diff = difflib.unified_diff(
+        expected.splitlines(), output.splitlines(), golden_path, "actual", lineterm="", n=2
+    )
+    detail = "\n".join(line for _, line in zip(range(MAX_DIFF_LINES), diff))
+    return {"path": path, "status": "fail", "detail": detail, "seconds": elapsed}
+
+
+def run_batch(paths, jobs=None, update=False):
+    """Run every transcript under `paths`. Returns (results, wall seconds)."""
+    transcripts = find_transcripts(paths)
+    work = [(p, update) for p in transcripts]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(work) or 1))
+    # pool workers exit without running atexit hooks: the parent owns the temp dir
+    saves_dir = tempfile.mkdtemp(prefix="otaku_batch_")
+    t0 = time.perf_counter()
+    try:
+        if jobs == 1:
+            _init_worker(saves_dir)
+            results = [run_one(w) for w in work]
+        else:
+            import multiprocessing
+            chunk = max(1, len(work) // (jobs * 8))
+            with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(saves_dir,)) as pool:
+                results = list(pool.imap_unordered(run_one, work, chunksize=chunk))
+    finally:
+        shutil.rmtree(saves_dir, ignore_errors=True)
+    return results, time.perf_counter() - t0
+
+
+# ======================
+#  Corpus generator
+# ======================
+
+def generate(out_dir, count, seed=None, rounds=3):
+    """Write `count` random-play transcripts (goldens come from `run --update`)."""
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for i in range(count):
+        lines = [f"#seed {rng.randrange(1 << 31)}"]
+        if rng.random() < 0.2:
+            lines.append('#save {"dazy_unlocked": true}')
+        for _ in range(rng.randint(1, rounds)):
+            pick = rng.random()
+            if pick < 0.7:
+                lines += ["1"] + rng.sample(letters, len(letters)) + [""] * 3
+            elif pick < 0.8:
+                lines += ["2", "", rng.choice(["tomoe", "nope"]), ""] + rng.sample(letters, len(letters))
+            elif pick < 0.9:
+                lines += ["3", ""]
+            else:
+                lines += [rng.choice(["9", "x", ""])]
+        lines.append("4")
+        with open(os.path.join(out_dir, f"t{i:05d}{TRANSCRIPT_EXT}"), "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    return count
+
+
+# ======================
+#  Main
+# ======================
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Otaku Hangman batch transcript driver")
+    sub = ap.add_subparsers(dest="mode", required=True)
+    run = sub.add_parser("run", help="run transcripts and diff against goldens")
+    run.add_argument("paths", nargs="+", help="transcript files or directories")
+    run.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    run.add_argument("--update", action="store_true", help="rewrite golden files that differ")
+    run.add_argument("--show", type=int, default=5, help="failures to print in full")
+    gen = sub.add_parser("generate", help="write random-play transcripts")
+    gen.add_argument("out_dir")
+    gen.add_argument("--count", type=int, default=100)
+    gen.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    if args.mode == "generate":
+        print(f"wrote {generate(args.out_dir, args.count, args.seed)} transcripts to {args.out_dir}")
+        return 0
+
+    results, wall = run_batch(args.paths, args.jobs, args.update)
+    counts = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    bad = sorted((r for r in results if r["status"] in ("fail", "error")), key=lambda r: r["path"])
+    for r in bad[:args.show]:
+        print(f"--- {r['status'].upper()}: {r['path']}\n{r['detail']}\n")
+    for r in bad[args.show:]:
+        print(f"--- {r['status'].upper()}: {r['path']}")
+    play = sum(r["seconds"] for r in results)
+    print(f"transcripts={len(results)} " + " ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+          + f" elapsed={wall:.2f}s transcripts/s={len(results) / wall if wall else 0:.1f}"
+          + f" (play {play:.2f}s)")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,19 @@
 # --- standard imports
+# (rarely-used modules -- subprocess, traceback, codecs, audio/wav helpers -- are imported
+#  where they are used, to keep cold start short; see --profile-startup / --bench-startup)
+import atexit
 import sys
 import os
 import time
-import subprocess
+
+_T0 = time.perf_counter()
+
 import threading
 import queue
+import heapq
 import tkinter as tk
 import tkinter.font as tkfont
 import re
-import traceback
-import codecs
-import json
-# Needed for in-process runner
-import runpy
-import builtins
 # fcntl is Unix-only (not available on Windows)
 try:
     import fcntl
@@ -21,7 +21,6 @@ try:
 except ImportError:
     fcntl = None
     HAS_FCNTL = False
-import select
 try:
     import winsound  # Windows-only
     HAS_WINSOUND = True
@@ -31,14 +30,36 @@ except Exception:
 
 LOG_PATH = "otaku_gui.log"
 
+# Log lines are held in memory until the window is up (flush_log), so startup
+# doesn't touch the disk before Tk exists.
+_log_pending = []
+
 def log(*args):
     msg = " ".join(str(a) for a in args)
+    if _log_pending is not None:
+        _log_pending.append(msg)
+    else:
+        try:
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(msg + "\n")
+        except Exception:
+            pass
+    print(msg, flush=True)
+
+def flush_log():
+    """Write deferred log lines (once) and switch log() to direct writes."""
+    global _log_pending
+    pending, _log_pending = _log_pending, None
+    if not pending:
+        return
     try:
         with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(msg + "\n")
+            f.write("\n".join(pending) + "\n")
     except Exception:
         pass
-    print(msg, flush=True)
+
+# Headless runs, early exits and --bench-startup children may never map a window.
+atexit.register(flush_log)
 
 def log_exc(prefix: str, exc: Exception):
     try:
@@ -46,8 +67,128 @@ def log_exc(prefix: str, exc: Exception):
     except Exception:
         pass
 
+def format_exc(exc_type, exc, tb) -> str:
+    import traceback
+    return "".join(traceback.format_exception(exc_type, exc, tb))
+
+def new_stdout_decoder():
+    """Incremental UTF-8 decoder for child stdout (non-blocking reads split characters)."""
+    import codecs
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+# Kiosk fast mode: shorter animation pauses for the in-process game and any
+# subprocess child (both read OTAKU_PACING, see Pacing in otaku_hang_man.py).
+if "--fast" in sys.argv[1:]:
+    os.environ.setdefault("OTAKU_PACING", "fast")
+
+# =====================
+#  Startup profiling
+# =====================
+# Cold start (process spawn) -> visible window budget, checked by --bench-startup
+# and reported by --profile-startup. OTAKU_STARTUP_BUDGET_MS overrides it.
+DEFAULT_STARTUP_BUDGET_MS = 600.0
+STARTUP_BUDGET_MS = float(os.environ.get("OTAKU_STARTUP_BUDGET_MS", DEFAULT_STARTUP_BUDGET_MS))
+# START click -> first game menu on screen (warm standby child / imported module).
+# OTAKU_START_BUDGET_MS overrides it.
+DEFAULT_START_BUDGET_MS = 20.0
+START_BUDGET_MS = float(os.environ.get("OTAKU_START_BUDGET_MS", DEFAULT_START_BUDGET_MS))
+# --bench-startup: time after the window is up before START is clicked (standby warm-up)
+BENCH_START_DELAY_MS = 1500
+MENU_PROMPT = "Option:"
+PROFILE_STARTUP = ("--profile-startup" in sys.argv[1:]) or bool(os.environ.get("OTAKU_PROFILE_STARTUP"))
+
+_phases = []  # (name, ms since module start)
+
+def mark_phase(name):
+    _phases.append((name, (time.perf_counter() - _T0) * 1000.0))
+
+def startup_report() -> dict:
+    phases = {name: round(ms, 2) for name, ms in _phases}
+    report = {"phases_ms": phases, "budget_ms": STARTUP_BUDGET_MS}
+    if "visible" in phases:
+        # in-process time only; --bench-startup adds interpreter start
+        report["ok"] = phases["visible"] <= STARTUP_BUDGET_MS
+    return report
+
+def importtime_report(top=15) -> list:
+    """`python -X importtime` for this module: the slowest imports by cumulative time (ms)."""
+    if getattr(sys, "frozen", False):
+        return []
+    import subprocess
+    here = os.path.dirname(os.path.abspath(__file__))
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import otaku_gui"],
+        cwd=here, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60,
+    )
+    rows = []
+    for line in r.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            head, cum, name = line[len("import time:"):].split("|", 2)
+            rows.append((int(cum.strip()) / 1000.0, int(head.strip()) / 1000.0, name.strip()))
+        except ValueError:
+            continue
+    rows.sort(reverse=True)
+    return [{"module": n, "cumulative_ms": round(c, 2), "self_ms": round(s_, 2)} for c, s_, n in rows[:top]]
+
+def bench_startup(runs=5) -> int:
+    """Launch the GUI `runs` times and click START in each; fail if the median
+    spawn->visible or START->first menu time exceeds its budget."""
+    import json
+    import subprocess
+    import statistics
+    here = os.path.abspath(__file__)
+    totals = []
+    menus = []
+    report = {}
+    for _ in range(runs):
+        t = time.perf_counter()
+        p = subprocess.Popen(
+            [sys.executable, here, "--profile-startup", "--exit-after-menu"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        line = menu = None
+        elapsed = None
+        for raw in p.stdout:
+            if raw.startswith("STARTUP "):
+                # measured here: the child can't see its own interpreter start
+                elapsed = (time.perf_counter() - t) * 1000.0
+                line = raw
+            elif raw.startswith("MENU "):
+                menu = json.loads(raw[len("MENU "):])
+                break
+        try:
+            p.wait(timeout=10)
+        except Exception:
+            p.kill()
+        if line is None or menu is None:
+            what = "a visible window" if line is None else "the first menu after START"
+            print(json.dumps({"error": f"GUI did not report {what}", "returncode": p.returncode}))
+            return 2
+        report = json.loads(line[len("STARTUP "):])
+        totals.append(elapsed)
+        menus.append(menu["start_to_menu_ms"])
+    median = statistics.median(totals)
+    menu_median = statistics.median(menus)
+    result = {
+        "runs": runs,
+        "budget_ms": STARTUP_BUDGET_MS,
+        "median_visible_ms": round(median, 1),
+        "max_visible_ms": round(max(totals), 1),
+        "start_budget_ms": START_BUDGET_MS,
+        "median_start_to_menu_ms": round(menu_median, 1),
+        "max_start_to_menu_ms": round(max(menus), 1),
+        "last_phases_ms": report.get("phases_ms", {}),
+        "ok": median <= STARTUP_BUDGET_MS and menu_median <= START_BUDGET_MS,
+    }
+    print(json.dumps(result, indent=2))
+    return 0 if result["ok"] else 1
+
 log("[otaku_gui] RUNNING:", sys.executable)
 log("[otaku_gui] cwd:", os.getcwd())
+mark_phase("imports")
 # macOS: Tk uses Cocoa; forking a child process can crash unless fork safety is disabled.
 # This must be set in the parent before spawning the child.
 if sys.platform == "darwin":
@@ -147,6 +288,74 @@ def console_text(s: str) -> str:
         pass
     return s
 
+def _tag_chunks(text: str, tagged: bool = True):
+    """Split text into Text.insert() args, one highlight tag tuple per matching line.
+
+    Mirrors HIGHLIGHT_RULES: a keyword anywhere on a line colors the whole line.
+    Untagged runs are merged so plain output stays a single chunk.
+    """
+    if not text:
+        return []
+    if not tagged:
+        return [text, ()]
+    args = []
+    plain = []
+    for line in text.splitlines(keepends=True):
+        low = line.lower()
+        tags = tuple(tag for tag, keys in HIGHLIGHT_RULES if any(kw in low for kw in keys))
+        if not tags:
+            plain.append(line)
+            continue
+        if plain:
+            args.extend(("".join(plain), ()))
+            plain = []
+        args.extend((line, tags))
+    if plain:
+        args.extend(("".join(plain), ()))
+    return args
+
+# =====================
+#  Game module (imported once; frames for the render cache, in-proc runner)
+# =====================
+_GAME_MODULE = None
+
+def _load_game_module():
+    """Import otaku_hang_man.py from next to this file (also works in PyInstaller onefile)."""
+    global _GAME_MODULE
+    if _GAME_MODULE is not None:
+        return _GAME_MODULE
+    mod = sys.modules.get("otaku_hang_man")
+    if mod is None:
+        import importlib.util
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "otaku_hang_man.py")
+        spec = importlib.util.spec_from_file_location("otaku_hang_man", script_path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules["otaku_hang_man"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("otaku_hang_man", None)
+            raise
+    _GAME_MODULE = mod
+    return mod
+
+_WORD_PACK_TRIED = False
+
+def _use_word_pack(mod):
+    """Load OTAKU_WORDPACK into the imported game once, on the first in-proc game.
+
+    Subprocess mode only needs the frames from the module (the child loads its own pack),
+    so a big pack is never parsed on the Tk thread at startup.
+    """
+    global _WORD_PACK_TRIED
+    if _WORD_PACK_TRIED:
+        return
+    _WORD_PACK_TRIED = True
+    try:
+        mod.use_word_pack_from_env()
+    except Exception as e:
+        log_exc("[otaku_gui] word pack not loaded:", e)
+
 def _init_fonts():
     """Initialize FONT_* after Tk root exists (fixes Windows glyph/garble issues)."""
     global FONT_FAMILY, FONT_MONO, FONT_MONO_BOLD_10, FONT_MONO_BOLD_12, FONT_MONO_BOLD_20
@@ -186,46 +395,336 @@ def _init_fonts():
         FONT_MONO_BOLD_12 = (FONT_FAMILY, 12, "bold")
         FONT_MONO_BOLD_20 = (FONT_FAMILY, 20, "bold")
 
-class OtakuGUI:
-    def _beep_hit(self):
+# =====================
+#  Audio cues (played on a worker thread, never on the Tk thread)
+# =====================
+# cue name -> [(frequency Hz, duration ms), ...]
+AUDIO_CUES = {
+    "hit": [(440, 70)],
+    "win": [(880, 90)],
+    "sparkle": [(660, 60), (990, 60)],
+}
+# winsound.MessageBeep fallback when Beep() is unavailable
+_CUE_MESSAGE_BEEP = {"hit": "MB_ICONHAND", "win": "MB_ICONASTERISK", "sparkle": "MB_OK"}
+
+class AudioCues:
+    """Non-blocking cue player.
+
+    Cues go through a small bounded queue to one daemon worker. When the queue is
+    full the oldest cue is dropped, and cues that waited longer than `stale_after`
+    are skipped, so sound never lags behind the screen.
+
+    Backends: winsound on Windows; elsewhere, cue WAVs rendered once into a temp dir
+    and played by a local helper process (aplay/paplay/pw-play/afplay).
+    Set OTAKU_AUDIO=off to mute, or OTAKU_AUDIO=bell to force the Tk bell.
+    The backend is picked on the first cue (the PATH probe stays out of startup).
+    """
+
+    WAV_PLAYERS = ("aplay", "paplay", "pw-play", "afplay")
+
+    def __init__(self, maxsize=4, stale_after=0.25):
+        self._q = queue.Queue(maxsize=maxsize)
+        self.stale_after = stale_after
+        self._thread = None
+        self._wav_dir = None
+        self._wav_paths = {}
+        self.player = None
+        self._backend = None
+        self._picked = False
+
+    @property
+    def backend(self):
+        if not self._picked:
+            self._backend = self._pick_backend()
+            self._picked = True
+        return self._backend
+
+    def _pick_backend(self):
+        mode = os.environ.get("OTAKU_AUDIO", "").strip().lower()
+        if mode == "off":
+            return "off"
+        if mode == "bell":
+            return None
+        if sys.platform == "win32" and HAS_WINSOUND:
+            return "winsound"
+        import shutil
+        for name in self.WAV_PLAYERS:
+            path = shutil.which(name)
+            if path:
+                self.player = path
+                return "wav"
+        return None
+
+    def play(self, cue) -> bool:
+        """Queue `cue`; returns False if there is no backend (caller falls back to the bell)."""
+        if self.backend is None:
+            return False
+        if self.backend == "off":
+            return True
+        item = (cue, time.perf_counter())
         try:
-            if sys.platform == "win32" and HAS_WINSOUND:
-                # short, low beep
+            self._q.put_nowait(item)
+        except queue.Full:
+            # backed up: drop the oldest cue, keep the newest
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._q.put_nowait(item)
+            except queue.Full:
+                pass
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="otaku-audio", daemon=True)
+            self._thread.start()
+        return True
+
+    def close(self):
+        """Stop the worker (best-effort) and remove rendered WAVs."""
+        if self._thread is not None:
+            while True:
                 try:
-                    winsound.Beep(440, 70)
-                except Exception:
-                    winsound.MessageBeep(winsound.MB_ICONHAND)
-            else:
-                self.root.bell()
-        except Exception:
-            pass
+                    self._q.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self._q.put_nowait((None, 0.0))
+            except queue.Full:
+                pass
+        if self._wav_dir is not None:
+            import shutil
+            shutil.rmtree(self._wav_dir, ignore_errors=True)
+            self._wav_dir = None
 
-    def _beep_win(self):
+    def _worker(self):
+        while True:
+            cue, ts = self._q.get()
+            if cue is None:
+                return
+            if (time.perf_counter() - ts) > self.stale_after:
+                continue
+            try:
+                self._play_now(cue)
+            except Exception:
+                pass
+
+    def _play_now(self, cue):
+        tones = AUDIO_CUES.get(cue)
+        if not tones:
+            return
+        if self.backend == "winsound":
+            try:
+                for freq, ms in tones:
+                    winsound.Beep(freq, ms)
+            except Exception:
+                winsound.MessageBeep(getattr(winsound, _CUE_MESSAGE_BEEP.get(cue, "MB_OK")))
+        elif self.backend == "wav":
+            import subprocess
+            path = self._wav_for(cue, tones)
+            subprocess.run(
+                [self.player, path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2.0,
+            )
+
+    def _wav_for(self, cue, tones, rate=22050, volume=0.25):
+        """Render a cue to a 16-bit mono WAV once (soft square wave, short fade)."""
+        path = self._wav_paths.get(cue)
+        if path is not None:
+            return path
+        import array
+        import tempfile
+        import wave
+        if self._wav_dir is None:
+            self._wav_dir = tempfile.mkdtemp(prefix="otaku_audio_")
+        samples = array.array("h")
+        amp = int(32767 * volume)
+        fade = int(rate * 0.004)
+        for freq, ms in tones:
+            n = int(rate * ms / 1000)
+            period = rate / float(freq)
+            for i in range(n):
+                v = amp if (i % period) < (period / 2) else -amp
+                edge = min(i, n - 1 - i)
+                if edge < fade:
+                    v = v * edge // fade
+                samples.append(v)
+        if sys.byteorder == "big":
+            samples.byteswap()
+        path = os.path.join(self._wav_dir, f"{cue}.wav")
+        with wave.open(path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(rate)
+            w.writeframes(samples.tobytes())
+        self._wav_paths[cue] = path
+        return path
+
+
+# =====================
+#  FX scheduler (one Tk timer for every screen effect)
+# =====================
+class FxScheduler:
+    """Frame-budgeted animation scheduler for hit/win/sparkle effects.
+
+    - one `after` tick at a fixed frame rate, only while effects are active
+    - effects run in priority order (lower number first) until the frame budget is spent;
+      the rest are deferred to the next frame (their timing is elapsed-based, so they catch up)
+    - adding an effect with a key that is already running restarts it (coalescing)
+    - effects sharing a channel (e.g. the screen outline) preempt by priority
+    - gate()/suppress() replace the ad-hoc debounce timestamps
+    """
+
+    class _Effect:
+        __slots__ = ("key", "priority", "channel", "duration", "step", "end", "started", "seq")
+
+    def __init__(self, root, fps=60, budget_ms=6.0):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / fps))
+        self.budget = budget_ms / 1000.0
+        self._effects = {}      # key -> _Effect
+        self._channels = {}     # channel -> key
+        self._suppressed = {}   # key -> until (perf_counter)
+        self._last_gate = {}    # key -> last accepted (perf_counter)
+        self._seq = 0
+        self._after_id = None
+        self.closed = False
+
+    # ---- gating / debounce
+    def suppress(self, key, seconds):
+        """Reject gate(key) for the next `seconds`."""
+        until = time.perf_counter() + seconds
+        self._suppressed[key] = max(until, self._suppressed.get(key, 0.0))
+
+    def is_suppressed(self, key):
+        return time.perf_counter() < self._suppressed.get(key, 0.0)
+
+    def gate(self, key, min_interval=0.0):
+        """True if an effect burst for `key` may start now (not suppressed, not debounced)."""
+        now = time.perf_counter()
+        if now < self._suppressed.get(key, 0.0):
+            return False
+        if (now - self._last_gate.get(key, -1e9)) < min_interval:
+            return False
+        self._last_gate[key] = now
+        return True
+
+    # ---- effects
+    def add(self, key, duration, step=None, end=None, priority=5, channel=None):
+        """Start (or restart) an effect. step(elapsed) runs each frame; end() runs once when done.
+
+        Returns False if a higher-priority effect owns the channel.
+        """
+        if self.closed:
+            return False
+        if channel is not None:
+            owner = self._channels.get(channel)
+            if owner is not None and owner != key:
+                other = self._effects.get(owner)
+                if other is not None and other.priority < priority:
+                    return False
+                # preempted: the new effect takes over the visual, no end() for the old one
+                self._effects.pop(owner, None)
+            self._channels[channel] = key
+
+        fx = self._effects.get(key)
+        if fx is None:
+            fx = self._Effect()
+            self._effects[key] = fx
+        fx.key = key
+        fx.priority = priority
+        fx.channel = channel
+        fx.duration = duration
+        fx.step = step
+        fx.end = end
+        fx.started = time.perf_counter()
+        self._seq += 1
+        fx.seq = self._seq
+
+        self._schedule()
+        return True
+
+    def cancel_all(self, run_end=True):
+        effects = list(self._effects.values())
+        self._effects.clear()
+        self._channels.clear()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if run_end:
+            for fx in effects:
+                self._finish(fx)
+
+    def _schedule(self):
+        if self._after_id is not None or self.closed or not self._effects:
+            return
         try:
-            if sys.platform == "win32" and HAS_WINSOUND:
-                # single, softer higher beep
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+        except Exception:
+            self._after_id = None
+
+    def _finish(self, fx):
+        if fx.channel is not None and self._channels.get(fx.channel) == fx.key:
+            self._channels.pop(fx.channel, None)
+        if fx.end is not None:
+            try:
+                fx.end()
+            except Exception:
+                pass
+
+    def _tick(self):
+        self._after_id = None
+        t0 = time.perf_counter()
+        queue_ = [(fx.priority, fx.seq, fx.key) for fx in self._effects.values()]
+        heapq.heapify(queue_)
+        while queue_:
+            _prio, _seq, key = heapq.heappop(queue_)
+            fx = self._effects.get(key)
+            if fx is None:
+                continue
+            now = time.perf_counter()
+            elapsed = now - fx.started
+            if elapsed >= fx.duration:
+                # always finish expired effects so visuals are restored even when over budget
+                del self._effects[key]
+                self._finish(fx)
+                continue
+            if (now - t0) > self.budget:
+                continue  # deferred to the next frame
+            if fx.step is not None:
                 try:
-                    winsound.Beep(880, 90)
+                    fx.step(elapsed)
                 except Exception:
-                    winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            else:
-                self.root.bell()
-        except Exception:
-            pass
+                    pass
+        self._schedule()
+
+
+class OtakuGUI:
+    def _beep_hit(self):
+        # short, low beep
+        self._play_cue("hit")
+
+    def _beep_win(self):
+        # single, softer higher beep
+        self._play_cue("win")
 
     def _beep_sparkle(self):
+        # two tiny chirps, different from hit/win
+        self._play_cue("sparkle")
+
+    def _play_cue(self, cue):
+        """Queue a cue on the audio worker; Tk bell only when no backend exists."""
         try:
-            if sys.platform == "win32" and HAS_WINSOUND:
-                # two tiny chirps, different from hit/win
-                try:
-                    winsound.Beep(660, 60)
-                    winsound.Beep(990, 60)
-                except Exception:
-                    winsound.MessageBeep(winsound.MB_OK)
-            else:
+            if not self._audio.play(cue):
                 self.root.bell()
         except Exception:
             pass
+
     def __init__(self, root):
         self.root = root
         self.root.title("OTAKU HANGMAN — Pocket Edition")
@@ -255,16 +754,19 @@ class OtakuGUI:
         self.proc = None
         self.out_queue = queue.Queue()
         # in-proc game runner (for frozen/Windows builds)
-        self.in_queue = queue.Queue()
-        self._game_thread = None
-        self._orig_input = None
-        self._stop_requested = False
-        self._orig_stdin = None
-        self._stdin_proxy = None
+        # (a GameSession stepped on the Tk thread: no game thread, no input polling)
+        self._session = None
+        self._pause_after_id = None
+        # in-proc screen model: console rows are replaced only where they changed
+        # (row i starts at Text mark "scr<i>")
+        self._screen_buf = None
+        self._console_rows = 0
         # stdout decoding (incremental, for non-blocking reads)
-        self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stdout_decoder = new_stdout_decoder()
         self._reader_thread = None
         self._grad_after_id = None
+        self._grad_item = None
+        self._grad_cache = {}
 
         # shutdown / scheduled-job tracking (prevents macOS Tk crashes on close)
         self._closing = False
@@ -272,12 +774,26 @@ class OtakuGUI:
         self._drain_after_id = None
         self._boot_after_ids = []
 
+        # warm standby child for instant START (subprocess mode only)
+        self._standby = None
+        self._standby_after_id = None
+        # child stdout fd watched by a Tk file handler (POSIX), see _watch_stdout
+        self._stdout_fd = None
+
+        # START -> first menu timing (see _note_menu); on_first_menu(ms) is a hook for the bench
+        self._start_clicked_at = None
+        self.start_to_menu_ms = None
+        self.on_first_menu = None
+
         # macOS stability mode: reduce Tk churn and disable heavy features
         self._safe_mode = (sys.platform == "darwin")
 
         # parse / highlight state
         self._parse_buf = ""
-        self._tag_scan_index = "1.0"
+
+        # render cache: (frame id, console cols, ASCII mode) -> Text.insert() args
+        self._frames = None
+        self._frame_cache = {}
 
         # HUD state
         self._hud_hp = "--/--"
@@ -290,15 +806,10 @@ class OtakuGUI:
         # screen FX state (safe: short flash + tiny shake)
         self._base_x = 0
         self._base_y = 0
-        self._shaking = False
-        self._flash_job = None
-        self._shake_jobs = []
-        # FX timing (avoid overlap between hit and sparkle)
-        self._last_hit_ts = 0.0
-        self._last_sparkle_ts = 0.0
-        self._last_win_ts = 0.0
-        # Suppress hit FX briefly during win/dazy/challenge-clear sequences
-        self._suppress_hit_until = 0.0
+        # FX scheduler (created once Tk exists); owns flash/shake timing + debounce
+        self._fx = FxScheduler(self.root)
+        # audio cues play on a worker thread (see AudioCues)
+        self._audio = AudioCues()
 
         self._screen_outline_normal = "#5a3a66"
         self._screen_outline_flash = "#ff86b7"      # rose hit flash (negative)
@@ -306,6 +817,9 @@ class OtakuGUI:
         self._screen_outline_win = ACCENT_MINT       # mint green (normal correct guess)
         self._screen_outline = self._screen_outline_normal
         self._screen_outline_width = 1
+        # retained screen scene (see _create_screen_items / _redraw_screen)
+        self._screen_items = None
+        self._screen_size = None
 
         # Initialize fonts now that Tk exists (important on Windows)
         try:
@@ -322,7 +836,7 @@ class OtakuGUI:
                 fallback = tk.Text(self.root, bg=BG_TOP, fg=TITLE_FG, relief="flat", highlightthickness=0)
                 fallback.pack(fill="both", expand=True, padx=16, pady=16)
                 fallback.insert("end", "[GUI] build_ui() failed.\n\n")
-                fallback.insert("end", "".join(traceback.format_exception(type(e), e, e.__traceback__)))
+                fallback.insert("end", format_exc(type(e), e, e.__traceback__))
                 fallback.configure(state="disabled")
             except Exception:
                 pass
@@ -337,12 +851,12 @@ class OtakuGUI:
         def _tk_exc_handler(exc, val, tb):
             try:
                 log("[otaku_gui] Tk callback exception:", repr(val))
-                log("".join(traceback.format_exception(exc, val, tb)))
+                log(format_exc(exc, val, tb))
             except Exception:
                 pass
             try:
                 # also show inside the console if possible
-                self._append_output("\n[GUI] ERROR (Tk callback):\n" + "".join(traceback.format_exception(exc, val, tb)) + "\n")
+                self._append_output("\n[GUI] ERROR (Tk callback):\n" + format_exc(exc, val, tb) + "\n")
             except Exception:
                 pass
 
@@ -351,6 +865,43 @@ class OtakuGUI:
         except Exception:
             pass
 
+    def _gradient_image(self, w, h):
+        """Background gradient as a PhotoImage, cached per window size.
+
+        Colors are computed for a 1px-wide column (6px bands, one bulk put()),
+        then zoomed horizontally to the full width.
+        """
+        key = (w, h)
+        img = self._grad_cache.get(key)
+        if img is not None:
+            return img
+
+        band = 6
+        r1, g1, b1 = self.root.winfo_rgb(BG_TOP)
+        r2, g2, b2 = self.root.winfo_rgb(BG_BOTTOM)
+        steps = max(1, h // band)
+        r_ratio = float(r2 - r1) / steps
+        g_ratio = float(g2 - g1) / steps
+        b_ratio = float(b2 - b1) / steps
+
+        rows = []
+        for y in range(h):
+            s = y // band
+            nr = int(r1 + (r_ratio * s))
+            ng = int(g1 + (g_ratio * s))
+            nb = int(b1 + (b_ratio * s))
+            rows.append(f"{{#{nr//256:02x}{ng//256:02x}{nb//256:02x}}}")
+
+        column = tk.PhotoImage(master=self.root, width=1, height=h)
+        column.put(" ".join(rows), to=(0, 0))
+        img = column.zoom(w, 1)
+
+        # a handful of sizes is plenty (the window is fixed-size; this covers DPI/startup jitter)
+        if len(self._grad_cache) >= 4:
+            self._grad_cache.pop(next(iter(self._grad_cache)))
+        self._grad_cache[key] = img
+        return img
+
     def _cancel_boot_jobs(self):
         """Cancel any scheduled boot/loading callbacks."""
         try:
@@ -408,26 +959,13 @@ class OtakuGUI:
                 if w <= 2 or h <= 2:
                     return
 
-                self.bg_canvas.delete("grad")
-
-                band = 6
-                r1, g1, b1 = self.root.winfo_rgb(BG_TOP)
-                r2, g2, b2 = self.root.winfo_rgb(BG_BOTTOM)
-                steps = max(1, h // band)
-                r_ratio = float(r2 - r1) / steps
-                g_ratio = float(g2 - g1) / steps
-                b_ratio = float(b2 - b1) / steps
-
-                for s in range(steps + 1):
-                    nr = int(r1 + (r_ratio * s))
-                    ng = int(g1 + (g_ratio * s))
-                    nb = int(b1 + (b_ratio * s))
-                    color = f"#{nr//256:02x}{ng//256:02x}{nb//256:02x}"
-                    y1 = s * band
-                    y2 = min(h, y1 + band)
-                    self.bg_canvas.create_rectangle(0, y1, w, y2, tags=("grad",), outline=color, fill=color)
-
-                self.bg_canvas.tag_lower("grad")
+                # One image item for the whole background; resize just swaps the image
+                img = self._gradient_image(w, h)
+                if self._grad_item is None:
+                    self._grad_item = self.bg_canvas.create_image(0, 0, anchor="nw", image=img, tags=("grad",))
+                    self.bg_canvas.tag_lower("grad")
+                else:
+                    self.bg_canvas.itemconfigure(self._grad_item, image=img)
                 target_w = 600 if sys.platform == "win32" else 520
                 self._base_x = max(0, (w - target_w) // 2)
                 self._base_y = 0
@@ -591,7 +1129,7 @@ class OtakuGUI:
             tags=("console",)
         )
 
-        # initial draw (bezel + scanlines)
+        # initial layout (bezel + scanlines)
         self.root.after(40, self._redraw_screen)
 
         # Controls
@@ -701,11 +1239,10 @@ class OtakuGUI:
                 # If HP decreased since last time, treat it as a wrong guess and trigger hit FX
                 try:
                     if (self._last_hp_cur is not None) and (cur < self._last_hp_cur):
-                        # Skip hit FX during win/dazy/challenge-clear sequences
+                        # Skip hit FX during win/dazy/challenge-clear sequences (the scheduler gates it)
                         try:
-                            if time.time() >= getattr(self, "_suppress_hit_until", 0.0):
-                                if (not self._closing) and self.root.winfo_exists():
-                                    self.root.after(0, self._trigger_hit_fx)
+                            if not self._closing:
+                                self._trigger_hit_fx()
                         except Exception:
                             pass
                 except Exception:
@@ -733,62 +1270,96 @@ class OtakuGUI:
         except Exception:
             pass
 
-    def _scan_and_tag_new_text(self):
-        """Scan newly appended text and apply highlight tags to full lines."""
-        try:
-            txt = self.console
-            end = txt.index("end-1c")
-            start = self._tag_scan_index
-            if txt.compare(start, ">=", end):
-                return
-
-            for tag, keys in HIGHLIGHT_RULES:
-                for kw in keys:
-                    pos = start
-                    while True:
-                        found = txt.search(kw, pos, stopindex=end, nocase=True)
-                        if not found:
-                            break
-                        line_start = txt.index(f"{found} linestart")
-                        line_end = txt.index(f"{found} lineend")
-                        txt.tag_add(tag, line_start, line_end)
-                        pos = txt.index(f"{found}+1c")
-
-            self._tag_scan_index = end
-        except Exception:
-            # never crash UI due to highlight
-            try:
-                self._tag_scan_index = self.console.index("end-1c")
-            except Exception:
-                pass
-
     # ---------------------
     # Screen styling (pixel border + scanlines)
     # ---------------------
+    def _create_screen_items(self):
+        """Create the retained screen scene once (coordinates are set by _redraw_screen)."""
+        c = self.screen_canvas
+        items = {}
+
+        # Outer bezel with subtle highlight edge
+        items["bezel"] = c.create_rectangle(0, 0, 0, 0, outline=PANEL_BORDER, width=2, fill="#09050a", tags=("screen",))
+
+        # Subtle plastic highlight edge
+        items["edge_top"] = c.create_line(0, 0, 0, 0, fill="#6a4a78", tags=("screen",))
+        items["edge_left"] = c.create_line(0, 0, 0, 0, fill="#6a4a78", tags=("screen",))
+        items["edge_bottom"] = c.create_line(0, 0, 0, 0, fill="#1a0f1f", tags=("screen",))
+        items["edge_right"] = c.create_line(0, 0, 0, 0, fill="#1a0f1f", tags=("screen",))
+
+        # Inner viewport (the only item flashes touch)
+        items["viewport"] = c.create_rectangle(
+            0, 0, 0, 0,
+            outline=self._screen_outline, width=self._screen_outline_width, fill="#09050a", tags=("screen",)
+        )
+
+        # Pixel-corner cutouts (tiny squares) to fake rounded corners
+        corner_color = BG_TOP  # match shell
+        items["corners"] = [
+            c.create_rectangle(0, 0, 0, 0, outline=corner_color, fill=corner_color, tags=("screen",))
+            for _ in range(4)
+        ]
+
+        # Scanlines / speaker holes are pooled: count depends on size, see _pool_items
+        items["scanlines"] = []
+        items["holes"] = []
+
+        # Handheld decorations on bezel (safe, simple)
+        items["screws"] = [
+            c.create_oval(0, 0, 0, 0, fill="#0f0a10", outline="#6a4a78", tags=("screen",))
+            for _ in range(4)
+        ]
+
+        # Small label plate
+        items["label"] = c.create_text(
+            0, 0, anchor="w", text="BIFROST MICRO ✦ OTAKU", fill="#6a4a78",
+            font=(FONT_MONO[0], 9, "bold"), tags=("screen",)
+        )
+
+        # Keep the drawing behind the embedded Text widget
+        c.tag_lower("screen")
+        self._screen_items = items
+        return items
+
+    def _pool_items(self, pool, count, create, below):
+        """Grow a pooled item list to `count`, hide the surplus; returns the visible items."""
+        c = self.screen_canvas
+        while len(pool) < count:
+            item = create()
+            c.tag_lower(item, below)
+            pool.append(item)
+        for i, item in enumerate(pool):
+            c.itemconfigure(item, state=("normal" if i < count else "hidden"))
+        return pool[:count]
+
     def _redraw_screen(self, event=None):
-        """Redraw the faux handheld screen (border + pixel corners + scanlines)."""
+        """Lay out the faux handheld screen (border + pixel corners + scanlines).
+
+        The scene is retained: items are created once and only moved when the canvas
+        size actually changes. Flashes go through _set_screen_outline().
+        """
         try:
             c = self.screen_canvas
             w = c.winfo_width()
             h = c.winfo_height()
             if w <= 4 or h <= 4:
                 return
+            if self._screen_size == (w, h):
+                return
+            self._screen_size = (w, h)
 
-            c.delete("screen")
-
-            # Outer bezel with subtle highlight edge
-            c.create_rectangle(0, 0, w, h, outline=PANEL_BORDER, width=2, fill="#09050a", tags=("screen",))
+            items = self._screen_items or self._create_screen_items()
 
-            # Subtle plastic highlight edge
-            c.create_line(2, 2, w - 2, 2, fill="#6a4a78", tags=("screen",))
-            c.create_line(2, 2, 2, h - 2, fill="#6a4a78", tags=("screen",))
-            c.create_line(2, h - 2, w - 2, h - 2, fill="#1a0f1f", tags=("screen",))
-            c.create_line(w - 2, 2, w - 2, h - 2, fill="#1a0f1f", tags=("screen",))
+            c.coords(items["bezel"], 0, 0, w, h)
+            c.coords(items["edge_top"], 2, 2, w - 2, 2)
+            c.coords(items["edge_left"], 2, 2, 2, h - 2)
+            c.coords(items["edge_bottom"], 2, h - 2, w - 2, h - 2)
+            c.coords(items["edge_right"], w - 2, 2, w - 2, h - 2)
 
             # Inner viewport
             pad = 10
             ix1, iy1, ix2, iy2 = pad, pad, w - pad, h - pad
-            c.create_rectangle(ix1, iy1, ix2, iy2, outline=self._screen_outline, width=self._screen_outline_width, fill="#09050a", tags=("screen",))
+            c.coords(items["viewport"], ix1, iy1, ix2, iy2)
 
             # Resize embedded HUD/console windows to fit the inner viewport
             inner_w = max(100, int(w - 2 * pad - 8))
@@ -814,150 +1385,118 @@ class OtakuGUI:
             except Exception:
                 pass
 
-            # Pixel-corner cutouts (tiny squares) to fake rounded corners
             cut = 6
-            corner_color = BG_TOP  # match shell
-            # top-left
-            c.create_rectangle(ix1, iy1, ix1 + cut, iy1 + cut, outline=corner_color, fill=corner_color, tags=("screen",))
-            # top-right
-            c.create_rectangle(ix2 - cut, iy1, ix2, iy1 + cut, outline=corner_color, fill=corner_color, tags=("screen",))
-            # bottom-left
-            c.create_rectangle(ix1, iy2 - cut, ix1 + cut, iy2, outline=corner_color, fill=corner_color, tags=("screen",))
-            # bottom-right
-            c.create_rectangle(ix2 - cut, iy2 - cut, ix2, iy2, outline=corner_color, fill=corner_color, tags=("screen",))
+            tl, tr, bl, br = items["corners"]
+            c.coords(tl, ix1, iy1, ix1 + cut, iy1 + cut)
+            c.coords(tr, ix2 - cut, iy1, ix2, iy1 + cut)
+            c.coords(bl, ix1, iy2 - cut, ix1 + cut, iy2)
+            c.coords(br, ix2 - cut, iy2 - cut, ix2, iy2)
 
             # Scanlines (subtle, behind the text)
             line_color = "#0b070c"  # slightly darker than screen bg
-            step = 7
-            for y in range(int(iy1) + 2, int(iy2) - 2, step):
-                c.create_line(ix1 + 2, y, ix2 - 2, y, fill=line_color, tags=("screen",))
+            ys = list(range(int(iy1) + 2, int(iy2) - 2, 7))
+            lines = self._pool_items(
+                items["scanlines"], len(ys),
+                lambda: c.create_line(0, 0, 0, 0, fill=line_color, tags=("screen",)),
+                items["screws"][0],
+            )
+            for item, y in zip(lines, ys):
+                c.coords(item, ix1 + 2, y, ix2 - 2, y)
 
-            # Handheld decorations on bezel (safe, simple)
-            screw_fill = "#0f0a10"
-            screw_outline = "#6a4a78"
             r = 3
-            for sx, sy in [(8, 8), (w - 8, 8), (8, h - 8), (w - 8, h - 8)]:
-                c.create_oval(sx - r, sy - r, sx + r, sy + r, fill=screw_fill, outline=screw_outline, tags=("screen",))
+            for item, (sx, sy) in zip(items["screws"], [(8, 8), (w - 8, 8), (8, h - 8), (w - 8, h - 8)]):
+                c.coords(item, sx - r, sy - r, sx + r, sy + r)
 
             # Speaker holes (right bezel)
-            hole_fill = "#060406"
-            hole_outline = "#2a1b31"
             hx = w - 14
-            for yy in range(84, min(h - 36, 210), 14):
-                c.create_oval(hx - 2, yy - 2, hx + 2, yy + 2, fill=hole_fill, outline=hole_outline, tags=("screen",))
-
-            # Small label plate
-            c.create_text(18, h - 18, anchor="w", text="BIFROST MICRO ✦ OTAKU", fill="#6a4a78", font=(FONT_MONO[0], 9, "bold"), tags=("screen",))
-
-            # Keep the drawing behind the embedded Text widget
-            c.tag_lower("screen")
+            hys = list(range(84, min(h - 36, 210), 14))
+            holes = self._pool_items(
+                items["holes"], len(hys),
+                lambda: c.create_oval(0, 0, 0, 0, fill="#060406", outline="#2a1b31", tags=("screen",)),
+                items["label"],
+            )
+            for item, yy in zip(holes, hys):
+                c.coords(item, hx - 2, yy - 2, hx + 2, yy + 2)
+
+            c.coords(items["label"], 18, h - 18)
         except Exception as e:
             log_exc("[otaku_gui] redraw_screen error:", e)
 
+    def _set_screen_outline(self, color, width=1):
+        """Recolor the inner viewport border (one itemconfigure; used by all flashes)."""
+        self._screen_outline = color
+        self._screen_outline_width = width
+        try:
+            item = self._screen_items.get("viewport") if self._screen_items else None
+            if item is not None:
+                self.screen_canvas.itemconfigure(item, outline=color, width=width)
+        except Exception:
+            pass
+
     # ---------------------
     # Hit feedback (flash + shake)
     # ---------------------
-    def _flash_screen(self):
-        """Briefly flash the inner screen border to simulate a hit."""
-        try:
-            if self._flash_job is not None:
-                try:
-                    self.root.after_cancel(self._flash_job)
-                except Exception:
-                    pass
-                self._flash_job = None
+    def _outline_fx(self, key, color, width, duration, priority):
+        """Flash the inner screen border; all flashes share the "outline" channel."""
+        def _on(_elapsed):
+            if self._screen_outline != color or self._screen_outline_width != width:
+                self._set_screen_outline(color, width)
 
-            self._screen_outline = self._screen_outline_flash
-            self._redraw_screen()
+        def _off():
+            self._set_screen_outline(self._screen_outline_normal)
 
-            def _reset():
-                self._screen_outline = self._screen_outline_normal
-                self._screen_outline_width = 1
-                self._redraw_screen()
-                self._flash_job = None
-
-            self._flash_job = self.root.after(120, _reset)
+        try:
+            if self._fx.add(key, duration, step=_on, end=_off, priority=priority, channel="outline"):
+                _on(0.0)  # show immediately; the tick only keeps it alive
         except Exception:
             # never crash the UI due to FX
-            self._screen_outline = self._screen_outline_normal
+            self._set_screen_outline(self._screen_outline_normal)
+
+    def _flash_screen(self):
+        """Briefly flash the inner screen border to simulate a hit."""
+        self._outline_fx("flash_hit", self._screen_outline_flash, 1, 0.12, priority=2)
 
     def _sparkle_screen(self):
         """Brief gold sparkle flash (positive feedback)."""
-        try:
-            if self._flash_job is not None:
-                try:
-                    self.root.after_cancel(self._flash_job)
-                except Exception:
-                    pass
-                self._flash_job = None
-
-            self._screen_outline = self._screen_outline_sparkle
-            self._redraw_screen()
+        # slightly longer than hit flash for a "shiny" feel
+        self._outline_fx("flash_sparkle", self._screen_outline_sparkle, 1, 0.17, priority=0)
 
-            def _reset():
-                self._screen_outline = self._screen_outline_normal
-                self._screen_outline_width = 1
-                self._redraw_screen()
-                self._flash_job = None
-
-            # slightly longer than hit flash for a "shiny" feel
-            self._flash_job = self.root.after(170, _reset)
-        except Exception:
-            self._screen_outline = self._screen_outline_normal
+    def _win_screen(self):
+        """Mint green flash (correct guess feedback): thicker + longer for clear visibility."""
+        # slightly longer than hit; strong but not DAZY-long
+        self._outline_fx("flash_win", self._screen_outline_win, 3, 0.22, priority=1)
 
     def _shake_window(self):
-        """Tiny shake (no loops). Always retriggers by canceling any in-flight shake."""
-        # If already shaking, cancel scheduled steps and restart so every hit feels responsive
-        if self._shaking:
-            for jid in list(self._shake_jobs):
+        """Tiny shake. Re-adding restarts it, so every hit feels responsive."""
+        seq = [2, -2, 1, -1, 0]
+        step_s = 0.03
+        last = [None]
+
+        def _apply(elapsed):
+            dx = seq[min(int(elapsed / step_s), len(seq) - 1)]
+            if dx != last[0]:
+                last[0] = dx
                 try:
-                    self.root.after_cancel(jid)
+                    self.bg_canvas.coords(self.container_id, self._base_x + dx, self._base_y)
                 except Exception:
                     pass
-            self._shake_jobs.clear()
-            try:
-                self.bg_canvas.coords(self.container_id, self._base_x, self._base_y)
-            except Exception:
-                pass
-
-        self._shaking = True
-
-        seq = [2, -2, 1, -1, 0]
-        step_ms = 30
-
-        def _apply(dx):
-            try:
-                self.bg_canvas.coords(self.container_id, self._base_x + dx, self._base_y)
-            except Exception:
-                pass
 
         def _end():
             try:
                 self.bg_canvas.coords(self.container_id, self._base_x, self._base_y)
             except Exception:
                 pass
-            self._shaking = False
 
-        for i, dx in enumerate(seq):
-            jid = self.root.after(step_ms * i, lambda d=dx: _apply(d))
-            self._shake_jobs.append(jid)
-        jid_end = self.root.after(step_ms * len(seq) + 10, _end)
-        self._shake_jobs.append(jid_end)
+        if self._fx.add("shake", step_s * len(seq) + 0.01, step=_apply, end=_end, priority=3, channel="shake"):
+            _apply(0.0)
 
     def _trigger_hit_fx(self):
         """Run both flash + shake safely, with a small sound. Avoid overlap with sparkle."""
         try:
-            now = time.time()
-            # Suppress hit feedback during win/dazy/challenge-clear sequences
-            if now < getattr(self, "_suppress_hit_until", 0.0):
-                return
-            # If sparkle fired very recently, don't stack hit FX/sound on top
-            if (now - getattr(self, "_last_sparkle_ts", 0.0)) < 0.35:
-                return
+            # suppressed during win/dazy/challenge-clear sequences and right after sparkle;
             # debounce: if another hit fired very recently, skip
-            if (now - getattr(self, "_last_hit_ts", 0.0)) < 0.08:
+            if not self._fx.gate("hit", min_interval=0.08):
                 return
-            self._last_hit_ts = now
             self._flash_screen()
             self._shake_window()
             # small sound
@@ -965,43 +1504,11 @@ class OtakuGUI:
         except Exception:
             pass
 
-    def _win_screen(self):
-        """Mint green flash (correct guess feedback): thicker + longer for clear visibility."""
-        try:
-            if self._flash_job is not None:
-                try:
-                    self.root.after_cancel(self._flash_job)
-                except Exception:
-                    pass
-                self._flash_job = None
-
-            self._screen_outline = self._screen_outline_win
-            self._screen_outline_width = 3
-            self._redraw_screen()
-
-            def _reset():
-                self._screen_outline = self._screen_outline_normal
-                self._screen_outline_width = 1
-                self._redraw_screen()
-                self._flash_job = None
-
-            # slightly longer than hit; strong but not DAZY-long
-            self._flash_job = self.root.after(220, _reset)
-        except Exception:
-            self._screen_outline = self._screen_outline_normal
-            self._screen_outline_width = 1
-
     def _trigger_win_fx(self):
         """Correct guess feedback: green flash + win chime. Avoid overlap with DAZY."""
         try:
-            now = time.time()
-            # If DAZY sparkle fired very recently, don't stack win FX on top
-            if (now - getattr(self, "_last_sparkle_ts", 0.0)) < 0.35:
+            if not self._fx.gate("win", min_interval=0.08):
                 return
-            # debounce
-            if (now - getattr(self, "_last_win_ts", 0.0)) < 0.08:
-                return
-            self._last_win_ts = now
             self._win_screen()
             # Win sound: single chime (less loud)
             self._beep_win()
@@ -1011,33 +1518,25 @@ class OtakuGUI:
     def _trigger_sparkle_fx(self):
         """Positive sigil feedback: sparkle flash. Prevent hit overlap."""
         try:
-            self._last_sparkle_ts = time.time()
+            # If DAZY sparkle fired, don't stack hit/win FX on top of it
+            self._fx.suppress("hit", 0.35)
+            self._fx.suppress("win", 0.35)
             self._sparkle_screen()
             # tiny chime: delayed so it doesn't feel like the hit sound
-            try:
-                self.root.after(40, self._beep_sparkle)
-            except Exception:
-                pass
+            self._fx.add("beep_sparkle", 0.04, end=self._beep_sparkle, priority=9)
         except Exception:
             pass
 
     # ---------------------
     # Terminal helpers
     # ---------------------
-    def _wrap_to_console_width(self, s: str) -> str:
-        """Hard-wrap long lines to the current console width on Windows.
-
-        IMPORTANT: Preserve menu/frame borders like `║ ... ║` by wrapping the *inside* and
-        re-applying borders on each wrapped line. This avoids the "missing vertical border"
-        look and restores the original menu layout.
-        """
+    def _console_cols(self) -> int:
+        """Current console width in columns (Windows only; 0 means "no wrapping")."""
         try:
-            if not s:
-                return s
             if sys.platform != "win32":
-                return s
+                return 0
             if not hasattr(self, "console") or self.console is None:
-                return s
+                return 0
 
             # Ensure geometry is up to date
             try:
@@ -1052,14 +1551,30 @@ class OtakuGUI:
 
             # Compute max columns from pixel width using current font
             if wpx <= 0:
-                max_cols = 70
-            else:
-                try:
-                    f = tkfont.Font(font=self.console.cget("font"))
-                    ch = max(6, int(f.measure("M")))
-                    max_cols = max(48, int((wpx - 18) / ch))
-                except Exception:
-                    max_cols = 70
+                return 70
+            try:
+                f = tkfont.Font(font=self.console.cget("font"))
+                ch = max(6, int(f.measure("M")))
+                return max(48, int((wpx - 18) / ch))
+            except Exception:
+                return 70
+        except Exception:
+            return 0
+
+    def _wrap_to_console_width(self, s: str, max_cols=None) -> str:
+        """Hard-wrap long lines to the current console width on Windows.
+
+        IMPORTANT: Preserve menu/frame borders like `║ ... ║` by wrapping the *inside* and
+        re-applying borders on each wrapped line. This avoids the "missing vertical border"
+        look and restores the original menu layout.
+        """
+        try:
+            if not s:
+                return s
+            if max_cols is None:
+                max_cols = self._console_cols()
+            if max_cols <= 0:
+                return s
 
             import unicodedata
 
@@ -1162,6 +1677,98 @@ class OtakuGUI:
             return "\n".join(out_lines)
         except Exception:
             return s
+    def _known_frames(self):
+        """[(frame_id, raw_text), ...] for every hangman frame the game can print."""
+        if self._frames is None:
+            try:
+                game = _load_game_module()
+                self._frames = (
+                    [(("L1", i), f) for i, f in enumerate(game.FRAMES_L1)]
+                    + [(("L2", i), f) for i, f in enumerate(game.FRAMES_L2)]
+                )
+            except Exception as e:
+                log_exc("[otaku_gui] frame cache disabled:", e)
+                self._frames = []
+        return self._frames
+
+    def _split_frames(self, text: str):
+        """Split output into ("text", str) and ("frame", (frame_id, raw)) segments."""
+        frames = self._known_frames()
+        # every frame has the gallows base; skip the search entirely for menus/feedback
+        if not frames or "┴" not in text:
+            return [("text", text)]
+        out = []
+        pos = 0
+        while True:
+            best = None
+            for fid, raw in frames:
+                i = text.find(raw, pos)
+                if i != -1 and (best is None or i < best[0]):
+                    best = (i, fid, raw)
+            if best is None:
+                break
+            i, fid, raw = best
+            if i > pos:
+                out.append(("text", text[pos:i]))
+            out.append(("frame", (fid, raw)))
+            pos = i + len(raw)
+        if pos < len(text):
+            out.append(("text", text[pos:]))
+        return out
+
+    def _render_insert_args(self, text: str, cols=None):
+        """Turn raw game output into Text.insert() args: (chunk, tags, chunk, tags, ...)."""
+        if cols is None:
+            cols = self._console_cols()
+        tagged = not self._safe_mode
+        args = []
+        for kind, payload in self._split_frames(text):
+            if kind == "frame":
+                fid, raw = payload
+                key = (fid, cols, USE_ASCII_UI)
+                cached = self._frame_cache.get(key)
+                if cached is None:
+                    processed = self._wrap_to_console_width(console_text(raw), cols)
+                    cached = tuple(_tag_chunks(processed, tagged))
+                    self._frame_cache[key] = cached
+                args.extend(cached)
+            else:
+                chunk = self._wrap_to_console_width(console_text(payload), cols)
+                args.extend(_tag_chunks(chunk, tagged))
+        return args
+
+    def _frame_row_args(self, lines, cols):
+        """{row: insert args} for the rows of `lines` that belong to a known frame.
+
+        Frames are found on the whole screen (a single row never matches one) and their
+        rows come from the render cache, one entry per frame.
+        """
+        text = "\n".join(lines)
+        segments = self._split_frames(text)
+        if len(segments) == 1 and segments[0][0] == "text":
+            return {}
+        tagged = not self._safe_mode
+        rows = {}
+        row = 0
+        for kind, payload in segments:
+            if kind == "text":
+                row += payload.count("\n")
+                continue
+            fid, raw = payload
+            key = ("rows", fid, cols, USE_ASCII_UI)
+            cached = self._frame_cache.get(key)
+            if cached is None:
+                cached = tuple(
+                    tuple(_tag_chunks(self._wrap_to_console_width(console_text(part), cols), tagged))
+                    for part in raw.split("\n")
+                )
+                self._frame_cache[key] = cached
+            # the first / last part may share a row with other text; the rest are whole rows
+            for k in range(1, len(cached) - 1):
+                rows[row + k] = cached[k]
+            row += len(cached) - 1
+        return rows
+
     def _clear_console(self):
         """Clear the embedded console safely and reset tagging state."""
         try:
@@ -1170,9 +1777,8 @@ class OtakuGUI:
             self.console.configure(state="disabled")
         except Exception:
             pass
-        # reset parse/tag scan
+        # reset parse state
         self._parse_buf = ""
-        self._tag_scan_index = "1.0"
     def _append_output(self, text: str):
         try:
             # If the game requests a full-screen redraw (ANSI clear), emulate it by clearing
@@ -1183,9 +1789,8 @@ class OtakuGUI:
                 if has_clear:
                     try:
                         self._clear_console()
-                        # Also reset parse/tag scan so HUD/highlights remain consistent
+                        # Also reset parse state so HUD stays consistent
                         self._parse_buf = ""
-                        self._tag_scan_index = "1.0"
                     except Exception:
                         pass
                 text = text.replace("\x1b[2J", "").replace("\x1b[H", "").replace("\x1b[3J", "")
@@ -1195,26 +1800,8 @@ class OtakuGUI:
             # Normalize carriage returns (some terminal output uses \r for in-place updates)
             if text:
                 text = text.replace("\r\n", "\n").replace("\r", "\n")
-            # Feedback cues (precedence: DAZY sparkle > WIN green > HIT pink)
             if text:
-                t = text.lower()
-                hit_cue = ("-1 hp" in t) or ("bonk" in t) or ("crit hit" in t) or ("wrong" in t) or ("life -1" in t)
-                sparkle_cue = ("sigil resonance" in t) or ("something secret is forming" in t) or ("unlocked the challenge mode" in t) or ("congratulations dazy" in t)
-                # Win cues: correct guess / progress / clear messages (distinct from DAZY)
-                win_cue = ("correct" in t) or ("nice" in t) or ("good job" in t) or ("well done" in t) or ("yatta" in t) or ("sugoi" in t) or ("kawaii" in t) or ("round cleared" in t) or ("you win" in t) or ("perfect guess" in t) or ("challenge cleared" in t)
-
-                if (not self._closing) and self.root.winfo_exists():
-                    if sparkle_cue:
-                        # prevent hit flashes caused by recap HP lines
-                        self._suppress_hit_until = time.time() + 0.9
-                        self.root.after(0, self._trigger_sparkle_fx)
-                    elif win_cue:
-                        # prevent hit flashes caused by recap HP lines
-                        self._suppress_hit_until = time.time() + 0.9
-                        self.root.after(0, self._trigger_win_fx)
-                    elif hit_cue:
-                        # every wrong should trigger
-                        self.root.after(0, self._trigger_hit_fx)
+                self._output_cues(text)
 
             # HUD parsing: accumulate into line buffer and parse completed lines
             if text:
@@ -1223,23 +1810,47 @@ class OtakuGUI:
                     line, self._parse_buf = self._parse_buf.split("\n", 1)
                     self._parse_line_for_hud(line)
 
+            # Translate/wrap/tag into insert args (known frames come from the render cache)
+            insert_args = self._render_insert_args(text) if text else ()
+
             self.console.configure(state="normal")
-            if text:
-                text = console_text(text)
-                text = self._wrap_to_console_width(text)
-            self.console.insert("end", text)
-            self.console.see("end")
-            try:
-                self.console.yview_moveto(1.0)
-                self.console.xview_moveto(0.0)
-            except Exception:
-                pass
+            if insert_args:
+                self.console.insert("end", *insert_args)
+            self._console_to_end()
             self.console.configure(state="disabled")
-            if not self._safe_mode:
-                self._scan_and_tag_new_text()
         except Exception as e:
             log_exc("[otaku_gui] append_output error:", e)
 
+    def _console_to_end(self):
+        self.console.see("end")
+        try:
+            self.console.yview_moveto(1.0)
+            self.console.xview_moveto(0.0)
+        except Exception:
+            pass
+
+    def _output_cues(self, text: str):
+        """Feedback cues (precedence: DAZY sparkle > WIN green > HIT pink)."""
+        t = text.lower()
+        hit_cue = ("-1 hp" in t) or ("bonk" in t) or ("crit hit" in t) or ("wrong" in t) or ("life -1" in t)
+        sparkle_cue = ("sigil resonance" in t) or ("something secret is forming" in t) or ("unlocked the challenge mode" in t) or ("congratulations dazy" in t)
+        # Win cues: correct guess / progress / clear messages (distinct from DAZY)
+        win_cue = ("correct" in t) or ("nice" in t) or ("good job" in t) or ("well done" in t) or ("yatta" in t) or ("sugoi" in t) or ("kawaii" in t) or ("round cleared" in t) or ("you win" in t) or ("perfect guess" in t) or ("challenge cleared" in t)
+
+        # Effects only register with the FX scheduler (no per-cue timers)
+        if not self._closing:
+            if sparkle_cue:
+                # prevent hit flashes caused by recap HP lines
+                self._fx.suppress("hit", 0.9)
+                self._trigger_sparkle_fx()
+            elif win_cue:
+                # prevent hit flashes caused by recap HP lines
+                self._fx.suppress("hit", 0.9)
+                self._trigger_win_fx()
+            elif hit_cue:
+                # every wrong should trigger
+                self._trigger_hit_fx()
+
     def _drain_queue(self):
         """Drain queued stdout and append in a single Text insert.
 
@@ -1261,6 +1872,7 @@ class OtakuGUI:
                         except OSError:
                             break
                         if not b:
+                            self._unwatch_stdout()  # EOF stays readable: stop the handler
                             break
                         try:
                             parts.append(self._stdout_decoder.decode(b))
@@ -1275,7 +1887,9 @@ class OtakuGUI:
                 except queue.Empty:
                     break
             if parts:
-                self._append_output("".join(parts))
+                text = "".join(parts)
+                self._append_output(text)
+                self._note_menu(text)
         except Exception as e:
             log_exc("[otaku_gui] drain_queue error:", e)
         finally:
@@ -1287,12 +1901,29 @@ class OtakuGUI:
                         pass
                     self._drain_after_id = None
                 running_subproc = bool(self.proc and (self.proc.poll() is None))
-                running_inproc = bool((self._game_thread is not None) and (self._game_thread.is_alive()))
-                if (not self._closing) and (running_subproc or running_inproc) and self.root.winfo_exists():
+                if (not self._closing) and running_subproc and self.root.winfo_exists():
                     self._drain_after_id = self.root.after(60, self._drain_queue)
             except Exception:
                 pass
 
+    def _watch_stdout(self, fd):
+        """Drain child stdout as soon as it is readable (Tk file handler) rather than on
+        the next poll tick; the poll stays as the fallback where Tk has no file handlers."""
+        self._unwatch_stdout()
+        try:
+            self.root.tk.createfilehandler(fd, tk.READABLE, lambda _fd, _mask: self._drain_queue())
+            self._stdout_fd = fd
+        except Exception:
+            self._stdout_fd = None
+
+    def _unwatch_stdout(self):
+        fd, self._stdout_fd = self._stdout_fd, None
+        if fd is not None:
+            try:
+                self.root.tk.deletefilehandler(fd)
+            except Exception:
+                pass
+
     def _reader_loop(self):
         """Windows-safe stdout reader (blocking). Puts decoded text into out_queue."""
         p = self.proc
@@ -1320,154 +1951,243 @@ class OtakuGUI:
     # ---------------------
     # In-process game runner (for frozen/Windows builds)
     # ---------------------
-    class _QueueStdout:
-        def __init__(self, put_fn):
-            self._put = put_fn
-        def write(self, s):
-            if not s:
-                return 0
+    def _session_running(self):
+        return (self._session is not None) and (not self._session.finished)
+
+    def _start_session(self):
+        """Start the game in-process as a GameSession (module imported once, cached bytecode)."""
+        game = _load_game_module()
+        _use_word_pack(game)
+        self._screen_buf = game.ScreenBuffer()
+        self._session = game.GameSession(write=self._screen_buf.write, clear=self._screen_buf.clear)
+        self._advance_session(self._session.start)
+
+    def _advance_session(self, step=None, *args):
+        """Run a session step (if any) plus queued input, show output, arm the next wait."""
+        session = self._session
+        if session is None:
+            return
+        try:
+            if step is not None:
+                step(*args)
+            # answer with any typed-ahead lines right away (e.g. typed during a pause)
+            req = session.pump()
+        except Exception as e:
+            req = None
+            self._render_screen()
+            self._append_output("\n[GUI] Game crashed: " + repr(e) + "\n" + format_exc(type(e), e, e.__traceback__))
+        else:
+            game = _load_game_module()
+            if isinstance(req, game.Ask):
+                self._screen_buf.write(req.prompt)
+            self._render_screen()
+            if isinstance(req, game.Pause):
+                try:
+                    if not self._closing:
+                        self._pause_after_id = self.root.after(
+                            int(req.seconds * 1000), self._resume_session
+                        )
+                except Exception:
+                    pass
+        if req is None:
+            # game finished (quit / crash): behave like a process that exited
             try:
-                self._put(s)
+                self.input_entry.configure(state="disabled")
+                self.send_btn.configure(state="disabled")
             except Exception:
                 pass
-            return len(s)
-        def flush(self):
+
+    def _render_screen(self):
+        """Bring the console up to date with the session screen, touching only changed rows."""
+        screen = self._screen_buf
+        if screen is None:
             return
+        try:
+            full, changed, rows = screen.changes()
+            if not changed and rows == self._console_rows:
+                return
+            # cues / HUD only look at what is new on screen
+            text = "\n".join(line for _, line in changed)
+            if text:
+                self._output_cues(text)
+            for _, line in changed:
+                self._parse_line_for_hud(line)
+
+            c = self.console
+            c.configure(state="normal")
+            if full:
+                c.delete("1.0", "end")
+                self._console_rows = 0
+            if self._console_rows > rows:
+                c.delete(f"scr{rows} -1c", "end-1c")
+                self._console_rows = rows
+            cols = self._console_cols()
+            frame_rows = self._frame_row_args(screen.screen(), cols) if changed else {}
+            for row, line in changed:
+                args = frame_rows.get(row)
+                if args is None:
+                    args = self._render_insert_args(line, cols)
+                if row < self._console_rows:
+                    start = c.index(f"scr{row}")
+                    end = f"scr{row + 1} -1c" if row + 1 < self._console_rows else "end-1c"
+                    c.delete(start, end)
+                else:
+                    # new rows arrive in order at the bottom
+                    if row > 0:
+                        c.insert("end-1c", "\n")
+                    start = c.index("end-1c")
+                    self._console_rows = row + 1
+                if args:
+                    c.insert(start, *args)
+                # left gravity: text inserted at an empty row's start stays after its mark
+                c.mark_set(f"scr{row}", start)
+                c.mark_gravity(f"scr{row}", "left")
+            self._console_to_end()
+            c.configure(state="disabled")
+            if text:
+                self._note_menu(text)
+        except Exception as e:
+            screen.invalidate()
+            log_exc("[otaku_gui] render_screen error:", e)
 
-    class _StdinProxy:
-        def __init__(self, read_fn):
-            self._read_fn = read_fn
+    def _note_menu(self, text):
+        """Record START -> first menu on screen (the first output showing the menu prompt)."""
+        clicked = self._start_clicked_at
+        if clicked is None or MENU_PROMPT not in text:
+            return
+        self._start_clicked_at = None
+        ms = (time.perf_counter() - clicked) * 1000.0
+        self.start_to_menu_ms = ms
+        log(f"[otaku_gui] START -> menu: {ms:.1f} ms (budget {START_BUDGET_MS:.0f} ms)")
+        if ms > START_BUDGET_MS:
+            log("[otaku_gui] START over budget")
+        if self.on_first_menu is not None:
+            self.on_first_menu(ms)
+
+    def _resume_session(self):
+        self._pause_after_id = None
+        if self._session_running():
+            self._advance_session(self._session.resume)
 
-        def readline(self, *args, **kwargs):
-            # Match sys.stdin.readline() contract: return a string ending with \n
-            s = self._read_fn("")
-            if s is None:
-                return ""
-            if not isinstance(s, str):
-                try:
-                    s = str(s)
-                except Exception:
-                    return "\n"
-            if s.endswith("\n"):
-                return s
-            return s + "\n"
+    # ---------------------
+    # Warm standby child (POSIX subprocess mode)
+    # ---------------------
+    def _game_script_path(self):
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "otaku_hang_man.py")
+
+    def _uses_subprocess(self):
+        return not (sys.platform == "win32" or bool(getattr(sys, "frozen", False)))
+
+    def _spawn_child(self, script_path, standby=False):
+        import subprocess
+        env = os.environ.copy()
+        env.setdefault("OBJC_DISABLE_INITIALIZE_FORK_SAFETY", "YES")
+        args = [sys.executable, script_path]
+        if standby:
+            args.append("--standby")
+        return subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=False,
+            cwd=os.path.dirname(script_path),
+            env=env,
+            close_fds=True,
+            start_new_session=True,
+        )
 
-    def _input_provider(self, prompt: str = "") -> str:
-        # Send prompt to UI if present
-        try:
-            if prompt:
-                self.out_queue.put(prompt)
-        except Exception:
-            pass
-        # Block until user provides a line, but allow stop to interrupt
+    def _schedule_standby(self, delay_ms):
         try:
-            if getattr(self, "_stop_requested", False):
-                raise EOFError
+            if self._standby_after_id is not None:
+                self.root.after_cancel(self._standby_after_id)
+            self._standby_after_id = None
+            if (not self._closing) and self._uses_subprocess() and self.root.winfo_exists():
+                self._standby_after_id = self.root.after(delay_ms, self._ensure_standby)
         except Exception:
             pass
-        while True:
-            try:
-                if getattr(self, "_stop_requested", False):
-                    raise EOFError
-                s = self.in_queue.get(timeout=0.2)
-                return s
-            except queue.Empty:
-                continue
-            except EOFError:
-                raise
-            except Exception:
-                return ""
 
-    def _run_game_inproc(self, script_path: str):
-        """Run the hangman script inside this process (Windows/frozen-safe)."""
-        # Patch input/print to route through queues
+    def _ensure_standby(self):
+        """Spawn a warm child that has imported the game and waits for a GO line."""
+        self._standby_after_id = None
+        try:
+            if self._closing or not self._uses_subprocess():
+                return
+            if self._standby is not None and self._standby.poll() is None:
+                return
+            script_path = self._game_script_path()
+            if not os.path.exists(script_path):
+                return
+            self._standby = self._spawn_child(script_path, standby=True)
+            log("[otaku_gui] standby child ready:", self._standby.pid)
+        except Exception as e:
+            log_exc("[otaku_gui] standby spawn failed:", e)
+            self._standby = None
+
+    def _take_standby(self):
+        """Hand over the warm child (returns None if there is no live one)."""
+        p = self._standby
+        self._standby = None
+        if p is None or p.poll() is not None:
+            return None
         try:
-            self._orig_input = getattr(builtins, "input", None)
-            builtins.input = self._input_provider
+            p.stdin.write(b"GO\n")
+            p.stdin.flush()
+            return p
         except Exception:
-            pass
+            self._discard_proc(p)
+            return None
 
-        # Some parts of the game use sys.stdin.readline() (e.g., secret password). Provide a compatible stdin.
+    def _discard_proc(self, p):
+        """Close a child's pipes and make sure it exits."""
+        if p is None:
+            return
         try:
-            self._orig_stdin = getattr(sys, "stdin", None)
-            self._stdin_proxy = self._StdinProxy(self._input_provider)
-            sys.stdin = self._stdin_proxy
+            if p.stdin:
+                p.stdin.close()
         except Exception:
             pass
-
-        orig_stdout = sys.stdout
-        orig_stderr = sys.stderr
         try:
-            sys.stdout = self._QueueStdout(lambda s: self.out_queue.put(s))
-            sys.stderr = sys.stdout
+            if p.poll() is None:
+                p.terminate()
+                try:
+                    p.wait(timeout=1.2)
+                except Exception:
+                    p.kill()
         except Exception:
             pass
-
         try:
-            runpy.run_path(script_path, run_name="__main__")
-        except (SystemExit, EOFError):
+            if p.stdout:
+                p.stdout.close()
+        except Exception:
             pass
-        except Exception as e:
-            try:
-                self.out_queue.put("\n[GUI] Game crashed: " + repr(e) + "\n")
-                self.out_queue.put("".join(traceback.format_exception(type(e), e, e.__traceback__)))
-            except Exception:
-                pass
-        finally:
-            try:
-                if self._orig_input is not None:
-                    builtins.input = self._orig_input
-            except Exception:
-                pass
-            try:
-                if self._orig_stdin is not None:
-                    sys.stdin = self._orig_stdin
-            except Exception:
-                pass
-            try:
-                sys.stdout = orig_stdout
-                sys.stderr = orig_stderr
-            except Exception:
-                pass
-            # ensure UI stops polling if process is gone
-            try:
-                self.proc = None
-            except Exception:
-                pass
 
     def _launch_game_process(self):
-        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "otaku_hang_man.py")
+        script_path = self._game_script_path()
         if not os.path.exists(script_path):
             self._append_output("[GUI] ERROR: otaku_hang_man.py not found next to otaku_gui.py\n")
             return
 
         # In PyInstaller onefile on Windows, sys.executable is the EXE bootloader (not python).
         # Run the game in-process to avoid child-process launch failures.
-        is_frozen = bool(getattr(sys, "frozen", False))
-        if sys.platform == "win32" or is_frozen:
+        if not self._uses_subprocess():
+            # enable input first: the session may finish synchronously
+            self.input_entry.configure(state="normal")
+            self.send_btn.configure(state="normal")
+            self.input_entry.focus_set()
             try:
                 log("[otaku_gui] launching in-proc:", script_path)
-                self._game_thread = threading.Thread(target=self._run_game_inproc, args=(script_path,), daemon=True)
-                self._game_thread.start()
+                self._start_session()
             except Exception as e:
                 self._append_output(f"[GUI] Failed to start game: {e}\n")
-                return
+            return
         else:
             try:
-                log("[otaku_gui] launching child:", script_path)
-                env = os.environ.copy()
-                env.setdefault("OBJC_DISABLE_INITIALIZE_FORK_SAFETY", "YES")
-                self.proc = subprocess.Popen(
-                    [sys.executable, script_path],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=False,
-                    cwd=os.path.dirname(script_path),
-                    env=env,
-                    close_fds=True,
-                    start_new_session=True,
-                )
+                # Prefer the pre-warmed standby child: interpreter + module are already loaded
+                self.proc = self._take_standby()
+                if self.proc is None:
+                    log("[otaku_gui] launching child:", script_path)
+                    self.proc = self._spawn_child(script_path)
                 try:
                     log("[otaku_gui] child pid:", self.proc.pid)
                 except Exception:
@@ -1479,6 +2199,7 @@ class OtakuGUI:
                         fd = self.proc.stdout.fileno()
                         flags = fcntl.fcntl(fd, fcntl.F_GETFL)
                         fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+                        self._watch_stdout(fd)
                 except Exception:
                     pass
 
@@ -1491,13 +2212,15 @@ class OtakuGUI:
                     pass
                 # reset decoder for a fresh run
                 try:
-                    self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    self._stdout_decoder = new_stdout_decoder()
                 except Exception:
                     pass
             except Exception as e:
                 self._append_output(f"[GUI] Failed to launch: {e}\n")
                 self.proc = None
                 return
+            # keep one warm child ready for the next START
+            self._schedule_standby(250)
 
         # enable input
         self.input_entry.configure(state="normal")
@@ -1511,6 +2234,7 @@ class OtakuGUI:
             pass
 
     def start_game(self):
+        clicked = time.perf_counter()
         log("[otaku_gui] START clicked")
 
         # cancel any previous boot/loading callbacks (kept for safety)
@@ -1523,7 +2247,7 @@ class OtakuGUI:
         except Exception:
             pass
         try:
-            if (self._game_thread is not None) and (self._game_thread.is_alive()):
+            if self._session_running():
                 return
         except Exception:
             pass
@@ -1535,6 +2259,8 @@ class OtakuGUI:
         except Exception:
             return
 
+        self._start_clicked_at = clicked
+
         # clear console
         self._clear_console()
         try:
@@ -1542,9 +2268,8 @@ class OtakuGUI:
         except Exception:
             pass
 
-        # reset parse/tag scan
+        # reset parse state
         self._parse_buf = ""
-        self._tag_scan_index = "1.0"
 
         # Show an immediate start banner (no scheduled boot steps)
         self._set_hud(hp="--/--", mode="MENU", sigil="◇ ◇ ◇ ◇")
@@ -1561,8 +2286,6 @@ class OtakuGUI:
             self.send_btn.configure(state="disabled")
         except Exception:
             pass
-        # Reset stop flag before launching game
-        self._stop_requested = False
         # Launch immediately (no after-based loading)
         try:
             self._launch_game_process()
@@ -1574,18 +2297,19 @@ class OtakuGUI:
                 pass
 
     def send_input(self, event=None):
-        # In-proc mode (Windows/frozen): route input to queue
-        if (self._game_thread is not None) and (self._game_thread.is_alive()) and (self.proc is None):
+        # In-proc mode (Windows/frozen): feed the session directly
+        if self._session_running() and (self.proc is None):
             msg = self.input_entry.get()
             if msg is None:
                 return
-            if msg.strip() != "":
-                self._append_output(f"> {msg}\n")
-            try:
-                self.in_queue.put(msg)
-            except Exception:
-                pass
             self.input_entry.delete(0, "end")
+            if msg.strip() != "":
+                self._screen_buf.write(f"> {msg}\n")
+                self._render_screen()
+            # queued on the session's input channel; consumed now, or after the pause
+            self._session.inputs.put(msg)
+            if self._pause_after_id is None:
+                self._advance_session()
             return
 
         # Subprocess mode
@@ -1613,6 +2337,18 @@ class OtakuGUI:
         try:
             # best effort to stop repeating jobs
             self._cancel_boot_jobs()
+            self._fx.cancel_all()
+            if self._closing:
+                self._fx.closed = True
+                self._audio.close()
+                if self._standby_after_id is not None:
+                    try:
+                        self.root.after_cancel(self._standby_after_id)
+                    except Exception:
+                        pass
+                    self._standby_after_id = None
+                standby, self._standby = self._standby, None
+                self._discard_proc(standby)
             if self._grad_after_id is not None:
                 try:
                     self.root.after_cancel(self._grad_after_id)
@@ -1637,23 +2373,19 @@ class OtakuGUI:
         p = self.proc
         self.proc = None
 
-        # Stop in-proc mode: request stop and unblock input()
-        try:
-            self._stop_requested = True
-        except Exception:
-            pass
+        # Stop in-proc mode: close the session (runs the game's cleanup)
         try:
-            if self._game_thread is not None and self._game_thread.is_alive():
-                # Try a clean quit option first (menu option 4)
+            if self._pause_after_id is not None:
                 try:
-                    self.in_queue.put("4")
-                except Exception:
-                    pass
-                # Also unblock any pending input() calls
-                try:
-                    self.in_queue.put("")
+                    self.root.after_cancel(self._pause_after_id)
                 except Exception:
                     pass
+                self._pause_after_id = None
+            session, self._session = self._session, None
+            if session is not None:
+                session.token.cancel()
+                session.close()
+                log("[otaku_gui] session metrics:", _load_game_module().metrics.snapshot())
         except Exception:
             pass
 
@@ -1686,6 +2418,7 @@ class OtakuGUI:
                 pass
 
         # close remaining pipes
+        self._unwatch_stdout()
         try:
             if p:
                 try:
@@ -1698,7 +2431,7 @@ class OtakuGUI:
 
         # reset decoder for next run
         try:
-            self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._stdout_decoder = new_stdout_decoder()
         except Exception:
             pass
 
@@ -1710,14 +2443,17 @@ class OtakuGUI:
             pass
 
 if __name__ == "__main__":
+    if "--bench-startup" in sys.argv[1:]:
+        sys.exit(bench_startup())
     try:
         log("[otaku_gui] creating Tk root...")
         root = tk.Tk()
         root.update_idletasks()
-        time.sleep(0.2)
+        mark_phase("tk_root")
 
         log("[otaku_gui] starting app...")
         app = OtakuGUI(root)
+        mark_phase("build_ui")
 
         # Visibility watchdog (macOS sometimes keeps the window behind)
         def _ensure_visible():
@@ -1763,13 +2499,55 @@ if __name__ == "__main__":
 
         root.protocol("WM_DELETE_WINDOW", _on_close)
 
+        # First map of the root window = visible; deferred log lines go to disk after that
+        def _on_first_map(event=None):
+            if event is not None and event.widget is not root:
+                return
+            if any(name == "visible" for name, _ms in _phases):
+                return
+            mark_phase("visible")
+            root.after_idle(flush_log)
+            bench = "--exit-after-menu" in sys.argv[1:]
+            # pre-warm a game child once the window is up (after the visibility watchdog)
+            app._schedule_standby(0 if bench else 700)
+            if PROFILE_STARTUP:
+                import json
+                report = startup_report()
+                print("STARTUP " + json.dumps(report), flush=True)
+                if not report.get("ok", True):
+                    log("[otaku_gui] startup over budget: visible at",
+                        report["phases_ms"]["visible"], "ms >", STARTUP_BUDGET_MS, "ms")
+                if "--exit-when-visible" not in sys.argv[1:] and not bench:
+                    try:
+                        report["imports"] = importtime_report()
+                    except Exception as e:
+                        report["imports"] = repr(e)
+                    log("[otaku_gui] startup profile:", json.dumps(report, indent=2))
+            if "--exit-when-visible" in sys.argv[1:]:
+                root.after(0, _on_close)
+            elif bench:
+                def _menu_shown(ms):
+                    import json
+                    print("MENU " + json.dumps({"start_to_menu_ms": round(ms, 2), "budget_ms": START_BUDGET_MS,
+                                                "ok": ms <= START_BUDGET_MS}), flush=True)
+                    root.after(0, _on_close)
+                app.on_first_menu = _menu_shown
+                root.after(BENCH_START_DELAY_MS, app.start_game)
+
+        root.bind("<Map>", _on_first_map, add="+")
+        if root.winfo_viewable():
+            _on_first_map()
+
         log("[otaku_gui] entering mainloop...")
-        root.mainloop()
+        try:
+            root.mainloop()
+        finally:
+            flush_log()
     except Exception as e:
         try:
-            import traceback
             log_exc("[otaku_gui] fatal:", e)
-            log(traceback.format_exc())
+            log(format_exc(type(e), e, e.__traceback__))
+            flush_log()
         except Exception:
             pass
         raise
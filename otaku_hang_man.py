@@ -3,13 +3,19 @@ import os
 import json
 import time
 import sys
+import struct
+import zlib
+import contextvars
+import functools
+import threading
+from collections import deque
 
 # ============================================================
 #  OTAKU HANGMAN - FINAL (Menu fixed)
 #
 #  ✅ 2) Challenge: locked until sigil unlock (save["dazy_unlocked"] == True)
 #  ✅ Secret Note: NOT shown in menu; auto-shown after Challenge clear
-#  ✅ Save file: otaku_save.json next to this .py file
+#  ✅ Save file: otaku_save.dat next to this .py file (old otaku_save.json is migrated)
 # ============================================================
 
 BASE_LIVES = 8
@@ -214,6 +220,34 @@ WORDS = [
     {"word": "casca", "hint": "berserk"},
 ]
 
+# Word packs (compiled by otaku_wordpack.py) replace WORDS: --words PATH / OTAKU_WORDPACK
+WORDPACK_ENV = "OTAKU_WORDPACK"
+
+
+def load_word_pack(path):
+    """Read a compiled word pack -> [{"word": ..., "hint": ...}, ...] (WORDS layout)."""
+    with open(path, "r", encoding="utf-8") as f:
+        pack = json.load(f)
+    if pack.get("format") != "otaku-wordpack" or pack.get("version") != 1:
+        raise ValueError(f"{path}: not a version 1 otaku word pack")
+    return [{"word": word, "hint": hint} for hint, words in pack["groups"] for word in words]
+
+
+def use_word_pack(path):
+    """Make the pack at `path` the live catalog."""
+    global WORDS
+    words = load_word_pack(path)
+    if not words:
+        raise ValueError(f"{path}: empty word pack")
+    WORDS = words
+    return len(words)
+
+
+def use_word_pack_from_env():
+    """Load OTAKU_WORDPACK if set (hosts that import the game call this once)."""
+    path = os.environ.get(WORDPACK_ENV)
+    return use_word_pack(path) if path else 0
+
 FRAMES_L1 = [
 r"""
    ✦ ｡ﾟ⋆ START ⋆｡ﾟ ✦     (ﾉ◕ヮ◕)ﾉ*:･ﾟ✧
@@ -416,62 +450,744 @@ r"""
 # ======================
 #  Save System
 # ======================
+# One schema drives defaults, migration and the binary layout. Save file (v2):
+#
+#   "OTKS" u16 version, then sections: 4-byte tag, u32 length, payload
+#     GEN_  u64 write sequence number; always first (v2+)
+#     CORE  SAVE_SCHEMA fields, struct-packed (letters = a-z bitmask)
+#     STAT  rounds, wins, best_streak, letters[a-z] (guessed, hit), guess_hist[27]
+#     MODE  u8 count, then (u8 name length, name, u32 rounds, u32 wins) per mode
+#     XTRA  UTF-8 JSON object of keys the schema doesn't know (only if any)
+#     CRC_  crc32 of every byte before it; always last (v2+, v1 files have none)
+#
+# Unknown tags are skipped, so newer sections don't break older readers. A JSON save
+# (the old format, or otaku_save.json next to a missing .dat) is migrated on load and
+# rewritten as binary by the next write_save().
+#
+# Writes go to <save>.tmp and are renamed into place; the replaced file (sequence k)
+# goes to generation slot <save>.(k % SAVE_GENERATIONS + 1), which holds the oldest
+# generation, so a write costs two renames. A load that finds the save torn or failing
+# its checksum falls back to the valid generation with the highest sequence, and the
+# broken file is moved aside as <save>.bad.
+#
+# Several processes may play on one save (the GUI's child and a terminal, two GUIs).
+# Every access holds an advisory lock on <save>.lock: shared for load_save(), exclusive
+# while write_save() reads what is on disk, merges, and renames (and for moving a broken
+# save aside). Counters add this session's delta since it loaded (see merge_save),
+# other fields take this session's value only if it changed them.
+
+SAVE_SCHEMA = (
+    # key                       type       default
+    ("dazy_unlocked",           "bool",    False),
+    ("dazy_unlock_count",       "u32",     0),
+    ("sigil_collected",         "letters", ()),
+    ("challenge_entries",       "u32",     0),
+    ("challenge_clears",        "u32",     0),
+    ("secret_note_unlocked",    "bool",    False),
+    ("secret_note_read_count",  "u32",     0),
+)
+SAVE_MAGIC = b"OTKS"
+SAVE_VERSION = 2
+SAVE_GENERATIONS = 3
+SAVE_REPLACE_RETRIES = 5   # os.replace retries (Windows refuses while another handle is open)
+SAVE_EXT = ".dat"
+LEGACY_SAVE_EXT = ".json"
+LEGACY_MIGRATED_SUFFIX = ".migrated"  # otaku_save.json once it has been converted
+
+SAVE_FILE = os.path.splitext(SAVE_FILE)[0] + SAVE_EXT
+
+_U32_MAX = 0xFFFFFFFF
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+_STRUCT_CODES = {"bool": "?", "u32": "I", "letters": "I"}
+_SAVE_HEAD = struct.Struct("<4sH")
+_SECTION_HEAD = struct.Struct("<4sI")
+_CORE = struct.Struct("<" + "".join(_STRUCT_CODES[kind] for _, kind, _ in SAVE_SCHEMA))
+_STAT = struct.Struct(f"<III{2 * len(_ALPHABET)}I27I")
+_MODE = struct.Struct("<II")
+_CRC = struct.Struct("<4sII")   # section head + crc32, the last 12 bytes of a v2 save
+_GEN = struct.Struct("<4sIQ")   # section head + sequence, right after the file header
+
+
+def save_path():
+    """Save file of the current session (per-profile on the server), else SAVE_FILE."""
+    session = _SESSION.get()
+    if session is None or session.save_path is None:
+        return SAVE_FILE
+    return session.save_path
+
+
+class SaveData(dict):
+    """A save dict that remembers what it looked like when loaded (`base`, for merging)
+    and the write sequence number of the file it came from (`seq`, 0 = none)."""
+
+    __slots__ = ("base", "seq")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base = None
+        self.seq = 0
+
+    def snapshot(self):
+        self.base = _copy_tree(self)
+        return self
+
+
+def _copy_tree(value):
+    """Deep copy of JSON-like data (much cheaper than copy.deepcopy for a save)."""
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
+def default_save():
+    save = SaveData((key, list(default) if kind == "letters" else default) for key, kind, default in SAVE_SCHEMA)
+    save["stats"] = new_stats()
+    return save
+
+
+def _u32(value):
+    if type(value) is int and 0 <= value <= _U32_MAX:
+        return value
+    try:
+        return min(max(int(value), 0), _U32_MAX)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _letter_mask(letters):
+    mask = 0
+    for ch in letters or ():
+        if isinstance(ch, str) and len(ch) == 1 and "a" <= ch <= "z":
+            mask |= 1 << (ord(ch) - 97)
+    return mask
+
+
+def encode_save(save, seq=0):
+    """Save dict -> bytes (current SAVE_VERSION); `seq` can be changed later with _stamp()."""
+    core = []
+    for key, kind, default in SAVE_SCHEMA:
+        value = save.get(key, default)
+        if kind == "bool":
+            core.append(bool(value))
+        elif kind == "u32":
+            core.append(_u32(value))
+        else:
+            core.append(_letter_mask(value))
+
+    stats = save_stats(dict(save))
+    letters = stats.get("letters") or {}
+    cells = []
+    for ch in _ALPHABET:
+        guessed, hit = (list(letters.get(ch) or ()) + [0, 0])[:2]
+        cells += (_u32(guessed), _u32(hit))
+    hist = [_u32(n) for n in stats["guess_hist"][:27]]
+    stat = _STAT.pack(_u32(stats["rounds"]), _u32(stats["wins"]), _u32(stats["best_streak"]), *cells, *hist)
+
+    modes = [bytes((min(len(stats["modes"]), 255),))]
+    for name, counts in list(stats["modes"].items())[:255]:
+        raw = str(name).encode("utf-8")[:255]
+        rounds, wins = (list(counts or ()) + [0, 0])[:2]
+        modes += (bytes((len(raw),)), raw, _MODE.pack(_u32(rounds), _u32(wins)))
+
+    sections = [(b"CORE", _CORE.pack(*core)), (b"STAT", stat), (b"MODE", b"".join(modes))]
+    known = {key for key, _, _ in SAVE_SCHEMA}
+    known.add("stats")
+    extra = {k: v for k, v in save.items() if k not in known}
+    if extra:
+        sections.append((b"XTRA", json.dumps(extra, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+
+    out = [_SAVE_HEAD.pack(SAVE_MAGIC, SAVE_VERSION), _GEN.pack(b"GEN_", 8, seq)]
+    for tag, payload in sections:
+        out += (_SECTION_HEAD.pack(tag, len(payload)), payload)
+    body = b"".join(out)
+    return body + _CRC.pack(b"CRC_", 4, zlib.crc32(body))
+
+
+def _stamp(encoded, seq):
+    """Set the sequence number of an encode_save() result (and fix its checksum)."""
+    buf = bytearray(encoded)
+    _GEN.pack_into(buf, _SAVE_HEAD.size, b"GEN_", 8, seq)
+    end = len(buf) - _CRC.size
+    _CRC.pack_into(buf, end, b"CRC_", 4, zlib.crc32(memoryview(buf)[:end]))
+    return bytes(buf)
+
+
+def decode_save(data):
+    """bytes -> save dict, missing fields defaulted. Raises ValueError on a malformed file."""
+    try:
+        magic, version = _SAVE_HEAD.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError("truncated save header")
+    if magic != SAVE_MAGIC:
+        raise ValueError("not an otaku save")
+    if version > SAVE_VERSION:
+        raise ValueError(f"save version {version} is newer than this game ({SAVE_VERSION})")
+
+    end = len(data)
+    if version >= 2:
+        if end < _SAVE_HEAD.size + _CRC.size:
+            raise ValueError("truncated save")
+        tag, size, crc = _CRC.unpack_from(data, end - _CRC.size)
+        if tag != b"CRC_" or size != 4:
+            raise ValueError("save has no checksum (torn write?)")
+        end -= _CRC.size
+        if zlib.crc32(memoryview(data)[:end]) != crc:
+            raise ValueError("save checksum mismatch")
+
+    save = default_save()
+    stats = save["stats"]
+    view = memoryview(data)[:end]
+    pos = _SAVE_HEAD.size
+    try:
+        while pos < end:
+            tag, size = _SECTION_HEAD.unpack_from(data, pos)
+            pos += _SECTION_HEAD.size
+            payload = view[pos:pos + size]
+            if len(payload) != size:
+                raise ValueError(f"truncated {tag!r} section")
+            pos += size
+            if tag == b"GEN_":
+                save.seq = struct.unpack_from("<Q", payload)[0]
+            elif tag == b"CORE":
+                for (key, kind, _), value in zip(SAVE_SCHEMA, _CORE.unpack_from(payload)):
+                    if kind == "letters":
+                        value = [ch for i, ch in enumerate(_ALPHABET) if value >> i & 1]
+                    save[key] = value
+            elif tag == b"STAT":
+                values = _STAT.unpack_from(payload)
+                stats["rounds"], stats["wins"], stats["best_streak"] = values[:3]
+                cells = values[3:3 + 2 * len(_ALPHABET)]
+                stats["letters"] = {
+                    ch: [cells[2 * i], cells[2 * i + 1]] for i, ch in enumerate(_ALPHABET) if cells[2 * i]
+                }
+                stats["guess_hist"] = list(values[3 + 2 * len(_ALPHABET):])
+            elif tag == b"MODE":
+                at = 1
+                for _ in range(payload[0]):
+                    n = payload[at]
+                    name = bytes(payload[at + 1:at + 1 + n]).decode("utf-8", errors="replace")
+                    at += 1 + n
+                    stats["modes"][name] = list(_MODE.unpack_from(payload, at))
+                    at += _MODE.size
+            elif tag == b"XTRA":
+                for key, value in json.loads(bytes(payload).decode("utf-8")).items():
+                    save.setdefault(key, value)
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"malformed save: {e}")
+    return save
+
+
+def migrate_save(data):
+    """Old JSON save (dict) -> current save dict: schema fields coerced, defaults filled in."""
+    save = default_save()
+    if not isinstance(data, dict):
+        return save
+    for key, value in data.items():
+        save[key] = value
+    for key, kind, default in SAVE_SCHEMA:
+        value = save[key]
+        if kind == "bool":
+            save[key] = bool(value)
+        elif kind == "u32":
+            save[key] = _u32(value)
+        elif not isinstance(value, list):
+            save[key] = list(default)
+    save_stats(save)
+    return save
+
+
+def legacy_save_path(path):
+    """otaku_save.dat -> otaku_save.json (where the JSON-era save lived)."""
+    stem, ext = os.path.splitext(path)
+    return stem + LEGACY_SAVE_EXT if ext == SAVE_EXT else None
+
+
+def _retire_legacy(legacy):
+    """Rename a converted JSON-era save so deleting the .dat really starts over."""
+    try:
+        _replace(legacy, legacy + LEGACY_MIGRATED_SUFFIX)
+    except OSError:
+        pass
+
+
+def parse_save(data):
+    """Save file bytes (binary or JSON) -> save dict. Raises ValueError if they don't verify."""
+    if data.startswith(SAVE_MAGIC):
+        return decode_save(data)
+    try:
+        return migrate_save(json.loads(data.decode("utf-8")))
+    except (TypeError, KeyError, AttributeError) as e:
+        raise ValueError(f"malformed save: {e}")
+
+
+def _generation_slots(path):
+    return [f"{path}.{n}" for n in range(1, SAVE_GENERATIONS + 1)]
+
+
+def save_generations(path):
+    """Files next to `path` that may hold an older (or unfinished newer) save."""
+    return [path + ".tmp"] + _generation_slots(path)
+
+
+def _read_save(path):
+    """-> save dict, None if the file doesn't exist. Raises if it doesn't verify."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return parse_save(data)
+
+
+def recover_save(path):
+    """Newest save under `path` that verifies -> (save, source, primary_bad).
+
+    (None, None, False) is a new profile. Tries the save, then the finished .tmp and the
+    generations (highest sequence wins), then the JSON-era file next to it. Only files
+    that don't verify are skipped; I/O errors (permissions, ...) are raised. Call it
+    with the save lock held.
+    """
+    primary_bad = False
+    try:
+        save = _read_save(path)
+        if save is not None:
+            return save, path, False
+    except ValueError:
+        primary_bad = True
+    best = None
+    for candidate in save_generations(path):
+        try:
+            save = _read_save(candidate)
+        except ValueError:
+            continue
+        if save is not None and (best is None or save.seq > best[0].seq):
+            best = (save, candidate)
+    if best is None:
+        legacy = legacy_save_path(path)
+        try:
+            save = _read_save(legacy) if legacy is not None else None
+        except ValueError:
+            save = None
+        if save is not None:
+            best = (save, legacy)
+    if best is None:
+        return None, None, primary_bad
+    return best[0], best[1], primary_bad
+
+
+def _quarantine(path):
+    """Move a save that doesn't verify out of the way as <save>.bad (exclusive lock held)."""
+    try:
+        _read_save(path)
+        return
+    except ValueError:
+        pass
+    except OSError:
+        return
+    try:
+        os.replace(path, path + ".bad")
+    except OSError:
+        pass
+
+
+def _replace(src, dst):
+    """os.replace, retried briefly: on Windows it fails while another process has dst open."""
+    for attempt in range(SAVE_REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == SAVE_REPLACE_RETRIES - 1:
+                raise
+            time.sleep(0.01 * (attempt + 1))
+
+
+class SaveLock:
+    """Advisory lock on <save>.lock: fcntl.flock on POSIX, msvcrt.locking on Windows.
+
+    `shared` lets readers overlap each other (POSIX only; msvcrt locks are always
+    exclusive). Works between processes and between threads (each acquire opens its
+    own handle).
+    """
+
+    def __init__(self, path, shared=False):
+        self.path = path + ".lock"
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        f = open(self.path, "a+b")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # retries for ~10 s, then OSError
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        except BaseException:
+            f.close()
+            raise
+        self._file = f
+        return self
+
+    def __exit__(self, *exc):
+        f, self._file = self._file, None
+        try:
+            if os.name == "nt":
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        finally:
+            f.close()
+        return False
+
+
+def _merge_counts(base, mine, disk):
+    """disk + (mine - base) for ints, element-wise for lists, key-wise for dicts."""
+    if isinstance(mine, bool) or not isinstance(mine, (int, list, dict)):
+        return mine
+    if isinstance(mine, int):
+        if not isinstance(disk, int) or not isinstance(base, int):
+            return mine
+        return max(disk + mine - base, 0)
+    if isinstance(mine, list):
+        if not isinstance(disk, list) or not isinstance(base, list):
+            return mine
+        size = max(len(mine), len(disk))
+        pad = lambda seq: list(seq) + [0] * (size - len(seq))
+        return [_merge_counts(b, m, d) for b, m, d in zip(pad(base), pad(mine), pad(disk))]
+    base = base if isinstance(base, dict) else {}
+    disk = disk if isinstance(disk, dict) else {}
+    merged = dict(disk)
+    for key, value in mine.items():
+        merged[key] = _merge_counts(base.get(key, _zero_like(value)), value, disk.get(key, _zero_like(value)))
+    return merged
+
+
+def _zero_like(value):
+    if isinstance(value, list):
+        return [0] * len(value)
+    if isinstance(value, dict):
+        return {}
+    return 0
+
+
+def merge_save(base, mine, disk):
+    """Three-way merge of one session's save into what another session wrote meanwhile.
+
+    Counters (u32 schema fields, stats) add up; best_streak keeps the max; anything else
+    takes `mine` if this session changed it since `base`, else `disk`.
+    """
+    merged = dict(disk)
+    counters = {key for key, kind, _ in SAVE_SCHEMA if kind == "u32"}
+    for key, value in mine.items():
+        if key in counters:
+            merged[key] = _merge_counts(base.get(key, 0), value, disk.get(key, 0))
+        elif key == "stats":
+            stats = _merge_counts(base.get("stats") or {}, value, disk.get("stats") or {})
+            best = [s.get("best_streak", 0) for s in (value, disk.get("stats") or {}) if isinstance(s, dict)]
+            stats["best_streak"] = max(best, default=0)
+            merged[key] = stats
+        elif key not in base or base[key] != value:
+            merged[key] = value
+    return merged
+
 
 def load_save():
-    default = {
-        "dazy_unlocked": False,
-        "dazy_unlock_count": 0,
-        "sigil_collected": [],
-        "challenge_entries": 0,
-        "challenge_clears": 0,
-        "secret_note_unlocked": False,
-        "secret_note_read_count": 0
-    }
-    if not os.path.exists(SAVE_FILE):
-        return default
+    """Current save (recovered / quarantined as needed), or a new profile if there is none.
+
+    If the save lock can't be taken it is read without the lock. I/O errors reading the
+    save itself are raised: starting from defaults would let the next write replace the
+    real profile.
+    """
+    path = save_path()
+    lock = SaveLock(path, shared=True)
     try:
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for k, v in default.items():
-            if k not in data:
-                data[k] = v
-        return data
-    except Exception:
-        return default
+        lock.__enter__()
+    except OSError as e:
+        say(f"⚠️  Save lock unavailable ({e}); reading the save without it.")
+        lock = None
+    try:
+        save, source, primary_bad = recover_save(path)
+    finally:
+        if lock is not None:
+            lock.__exit__(None, None, None)
+    if primary_bad:
+        try:
+            with SaveLock(path):
+                _quarantine(path)
+        except OSError:
+            pass  # stays in place; recovery skips it again next time
+    if save is None:
+        save = default_save()
+    elif not isinstance(save, SaveData):
+        save = SaveData(save)
+    save.snapshot()
+    if source is not None and source == legacy_save_path(path):
+        write_save(save)  # finish the migration: writes the .dat, retires the .json
+    return save
+
+
+def reload_save(save):
+    """Refresh `save` in place from disk (rebasing it, so later writes merge correctly)."""
+    fresh = load_save()
+    save.clear()
+    save.update(fresh)
+    if isinstance(save, SaveData):
+        save.base = fresh.base
 
 
 def write_save(save):
+    """Merge `save` into the file under the save lock, then refresh `save` with the result.
+
+    Loaded saves (SaveData with a base) are merged with whatever is on disk; a plain dict
+    or a fresh default_save() overwrites. The file goes to <save>.tmp, the current one to
+    its generation slot, and the new file is renamed into place. Returns False (and says
+    so) if the save couldn't be written; a loaded save keeps its changes, so the next
+    write_save() carries them over.
+    """
+    path = save_path()
+    base = getattr(save, "base", None)
+    data = save
     try:
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(save, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+        encoded = encode_save(save)  # outside the lock; redone only if another session wrote
+        with SaveLock(path):
+            disk, source, primary_bad = recover_save(path)
+            if primary_bad:
+                _quarantine(path)
+            if base is not None and disk is not None and disk != base:
+                data = merge_save(base, save, disk)
+                encoded = encode_save(data)
+            seq = (disk.seq if disk is not None else 0) + 1
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_stamp(encoded, seq))
+            if source == path:
+                _replace(path, f"{path}.{disk.seq % SAVE_GENERATIONS + 1}")
+            _replace(tmp, path)
+            if source is not None and source == legacy_save_path(path):
+                _retire_legacy(source)
+    except Exception as e:
+        say(f"⚠️  Save not written ({e}); it will be retried with the next save.")
+        return False
+    if data is not save:
+        save.clear()
+        save.update(data)
+    if isinstance(save, SaveData):
+        save.seq = seq
+        save.snapshot()
+    return True
 
 
 def reset_save_to_locked():
     """Dev helper: wipe progress back to locked state."""
-    save = {
-        "dazy_unlocked": False,
-        "dazy_unlock_count": 0,
-        "sigil_collected": [],
-        "challenge_entries": 0,
-        "challenge_clears": 0,
-        "secret_note_unlocked": False,
-        "secret_note_read_count": 0
-    }
+    save = default_save()
     write_save(save)
     return save
 
+
+# ======================
+#  Running stats (save["stats"])
+# ======================
+# Counters are bumped once per round, so the stats screen never has to look at history.
+#   rounds / wins               all modes
+#   modes[mode] = [rounds, wins]
+#   best_streak                 longest challenge win streak
+#   letters[l] = [guessed, hit]
+#   guess_hist[n]               won rounds that took n guesses (0..26)
+
+STATS_MODES = ("play", "franchise", "challenge")
+
+
+def new_stats():
+    return {
+        "rounds": 0,
+        "wins": 0,
+        "modes": {mode: [0, 0] for mode in STATS_MODES},
+        "best_streak": 0,
+        "letters": {},
+        "guess_hist": [0] * 27,
+    }
+
+
+def save_stats(save):
+    """save["stats"], repaired in place if an older / hand-edited save lacks parts of it."""
+    stats = save.get("stats")
+    if not isinstance(stats, dict):
+        stats = save["stats"] = new_stats()
+    for key, value in new_stats().items():
+        stats.setdefault(key, value)
+    if len(stats["guess_hist"]) < 27:
+        stats["guess_hist"] += [0] * (27 - len(stats["guess_hist"]))
+    return stats
+
+
+def count_round(save, mode, won, guessed, positions):
+    """Add one finished round to save["stats"] (O(1): at most 26 letter counters)."""
+    stats = save_stats(save)
+    stats["rounds"] += 1
+    stats["wins"] += bool(won)
+    per_mode = stats["modes"].setdefault(mode, [0, 0])
+    per_mode[0] += 1
+    per_mode[1] += bool(won)
+    letters = stats["letters"]
+    for letter in guessed:
+        counts = letters.setdefault(letter, [0, 0])
+        counts[0] += 1
+        counts[1] += letter in positions
+    if won:
+        stats["guess_hist"][min(len(guessed), 26)] += 1
+
+
+def count_streak(save, streak):
+    stats = save_stats(save)
+    if streak > stats["best_streak"]:
+        stats["best_streak"] = streak
+        return True
+    return False
+
+
+# ======================
+#  Round journal
+# ======================
+# One JSON line per finished round (and per ended challenge streak), appended next to
+# the save: otaku_save.dat -> otaku_save.rounds.jsonl. Nothing in the game reads it
+# back; otaku_analytics.py streams it. OTAKU_JOURNAL=0 turns it off.
+
+JOURNAL_ENV = "OTAKU_JOURNAL"
+JOURNAL_SUFFIX = ".rounds.jsonl"
+
+
+def journal_path():
+    """Journal file for the current save, or None when journaling is off."""
+    if os.environ.get(JOURNAL_ENV, "1") == "0":
+        return None
+    return os.path.splitext(save_path())[0] + JOURNAL_SUFFIX
+
+
+def append_journal(record):
+    """Append one record (a dict); the date and a timestamp are filled in."""
+    path = journal_path()
+    if path is None:
+        return
+    record = {"date": today().isoformat(), "ts": int(time.time()), **record}
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    except Exception:
+        pass
+
 # ======================
 #  Helpers
 # ======================
 
+def say(*args, sep=" ", end="\n", flush=False):
+    """print() into the current session's output."""
+    text = sep.join(str(a) for a in args) + end
+    session = _SESSION.get()
+    if session is None:
+        sys.stdout.write(text)
+        if flush:
+            sys.stdout.flush()
+        return
+    session.write(text)
+
+
+def ask(prompt="", kind="text"):
+    """Awaitable input(): `line = await ask("Option: ", kind="option")`."""
+    return Ask(prompt, kind)
+
+
+def ack(prompt="Press Enter..."):
+    """Awaitable "Press Enter..." acknowledgement."""
+    return Ask(prompt, "ack")
+
+
+def pause(seconds):
+    """Awaitable sleep; the host decides how to wait (see GameSession)."""
+    return Pause(seconds)
+
+
+def today():
+    """Current date; a session may pin it (golden transcripts must not depend on the calendar)."""
+    session = _SESSION.get()
+    if session is not None and session.today is not None:
+        return session.today
+    import datetime
+    return datetime.date.today()
+
+
 def clear_screen():
+    session = _SESSION.get()
+    if session is None:
+        terminal_clear()
+        return
+    session.clear()
+
+
+def terminal_clear():
+    # flush first so buffered text can't land after the clear
+    sys.stdout.flush()
     os.system("clear" if os.name != "nt" else "cls")
 
 
 def normalize(s):
-    return s.strip().lower()
+    s = s.strip().lower()
+    if not s.isascii():
+        # full-width / compatibility forms from IME keyboards: "Ｔｏｍｏｅ" -> "tomoe", "１" -> "1"
+        import unicodedata
+        s = unicodedata.normalize("NFKC", s).strip().lower()
+    return s
+
+
+# ---- letter folding (guesses and answers)
+# Both tables are built once. LATIN_FOLD maps accented / variant Latin letters to their
+# a-z base (answers and guesses: "é" is revealed by "e"). KANA_FOLD maps the kana a
+# Japanese IME gives for a lone vowel or n (guesses only).
+KANA_LETTERS = {
+    "a": "あぁアァ", "i": "いぃイィ", "u": "うぅウゥ", "e": "えぇエェ", "o": "おぉオォ", "n": "んン",
+}
+LATIN_EXTRA = {"ø": "o", "đ": "d", "ł": "l", "ħ": "h", "ı": "i", "ŧ": "t", "ŀ": "l", "ſ": "s"}
+
+
+@functools.lru_cache(maxsize=None)
+def fold_tables():
+    """-> (LATIN_FOLD, KANA_FOLD) dicts, char -> a-z letter."""
+    import unicodedata
+    latin = dict(LATIN_EXTRA)
+    for lo, hi in ((0x00C0, 0x024F), (0x1E00, 0x1EFF)):
+        for cp in range(lo, hi + 1):
+            ch = chr(cp).lower()
+            if len(ch) != 1 or ch.isascii() or not ch.isalpha():
+                continue
+            base = unicodedata.normalize("NFKD", ch)[0]
+            if base.isascii() and base.isalpha():
+                latin.setdefault(ch, base.lower())
+    kana = {k: letter for letter, chars in KANA_LETTERS.items() for k in chars}
+    return latin, kana
+
+
+def letter_of(ch):
+    """The a-z letter that reveals answer char `ch`, or None (shown from the start)."""
+    if ch.isascii():
+        return ch if ch.isalpha() else None
+    return fold_tables()[0].get(ch)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_guess(s):
+    """normalize() plus folding of one accented letter / full-width letter / kana vowel."""
+    s = normalize(s)
+    if len(s) == 1 and not s.isascii():
+        latin, kana = fold_tables()
+        return latin.get(s) or kana.get(s) or s
+    return s
 
 # Cute feedback pools (anime-style)
 CUTE_CORRECT = [
@@ -524,6 +1240,268 @@ def frame_for_lives(frames, max_lives, lives_left):
     idx = max(0, min(idx, len(frames) - 1))
     return frames[idx]
 
+# ======================
+#  Word index
+# ======================
+# Rounds only guess single a-z letters; accented answer letters fold to theirs (see
+# letter_of). Everything else in an answer (spaces, digits, punctuation, other scripts)
+# is shown from the start and is not guessable, so catalogs with "one piece",
+# "persona5" or "pokémon" play as-is.
+
+def is_guessable_char(ch):
+    return letter_of(ch) is not None
+
+
+class WordInfo:
+    """Round model of one answer, built once per word (not per guess).
+
+    template: display at round start ("_" for hidden letters, other chars as-is)
+    positions: letter (folded) -> indices to reveal; hidden: number of hidden slots
+    """
+
+    __slots__ = ("word", "template", "positions", "hidden")
+
+    def __init__(self, word):
+        positions = {}
+        template = []
+        for i, ch in enumerate(word):
+            letter = letter_of(ch)
+            if letter is not None:
+                positions.setdefault(letter, []).append(i)
+                template.append("_")
+            else:
+                template.append(ch)
+        self.word = word
+        self.template = tuple(template)
+        self.positions = {ch: tuple(idx) for ch, idx in positions.items()}
+        self.hidden = sum(len(idx) for idx in positions.values())
+
+
+@functools.lru_cache(maxsize=4096)
+def word_info(word):
+    return WordInfo(word)
+
+# ======================
+#  Sigil feasibility index
+# ======================
+# The DAZY unlock needs one won normal round in which all of SIGIL_ORDER was guessed.
+# Sigil letters in the word are "free"; each absent one costs a life. The player picks
+# the order, so collecting them first is always possible: a word allows the unlock iff
+# it is winnable (has a letter to guess) and the absent sigils cost fewer lives than
+# max_lives.
+
+SIGIL_BITS = {ch: 1 << i for i, ch in enumerate(SIGIL_ORDER)}
+
+
+class SigilIndex:
+    """Per-word sigil facts for a catalog, precomputed once; queries are dict/array lookups.
+
+    Per word: mask (bit i = SIGIL_ORDER[i] present), free (present count), cost (lives
+    the absent sigils take), winnable, min_guesses (distinct letters + absent sigils).
+    """
+
+    def __init__(self, words=None):
+        words = WORDS if words is None else words
+        self.entries = {}
+        self.by_free = [[] for _ in range(len(SIGIL_ORDER) + 1)]
+        for entry in words:
+            word = entry["word"]
+            letters = {letter_of(ch) for ch in word} - {None}
+            mask = 0
+            for ch in letters:
+                mask |= SIGIL_BITS.get(ch, 0)
+            free = bin(mask).count("1")
+            info = {
+                "word": word,
+                "hint": entry.get("hint"),
+                "mask": mask,
+                "free": free,
+                "cost": len(SIGIL_ORDER) - free,
+                "winnable": bool(letters),
+                "min_guesses": len(letters | SIGIL_SET),
+            }
+            self.entries[word] = info
+            self.by_free[free].append(info)
+        self.total = len(words)
+
+    # ---- per word
+    def free(self, word):
+        return self.entries[word]["free"]
+
+    def margin(self, word, lives=BASE_LIVES):
+        """Lives left once every sigil is collected (<= 0: unlock impossible with this word)."""
+        info = self.entries[word]
+        return lives - info["cost"] if info["winnable"] else 0
+
+    def feasible(self, word, lives=BASE_LIVES):
+        return self.margin(word, lives) > 0
+
+    # ---- catalog
+    def count_feasible(self, lives=BASE_LIVES):
+        return sum(
+            sum(1 for info in infos if info["winnable"])
+            for free, infos in enumerate(self.by_free)
+            if len(SIGIL_ORDER) - free < lives
+        )
+
+    def unlock_odds(self, lives=BASE_LIVES):
+        """Share of rounds (uniform word pick) in which the unlock is possible at all."""
+        return self.count_feasible(lives) / self.total if self.total else 0.0
+
+    def words_with_free(self, free):
+        return [info["word"] for info in self.by_free[free]]
+
+    def report(self, lives=BASE_LIVES):
+        lines = [f"Sigil feasibility ({self.total} words, {lives} lives, sigils {''.join(SIGIL_ORDER).upper()})"]
+        for free, infos in enumerate(self.by_free):
+            if not infos:
+                continue
+            share = len(infos) / self.total
+            sample = ", ".join(info["word"] for info in infos[:5])
+            lines.append(f"  free {free} / cost {len(SIGIL_ORDER) - free}: {len(infos):5d} ({share:6.1%})  e.g. {sample}")
+        stuck = [info["word"] for info in self.entries.values() if not info["winnable"]]
+        if stuck:
+            lines.append(f"  unwinnable (nothing to guess): {len(stuck)}  {', '.join(stuck[:8])}")
+        lines.append(f"  unlock possible: {self.count_feasible(lives)} words ({self.unlock_odds(lives):.1%})")
+        if self.total:
+            mean = sum(info["min_guesses"] for info in self.entries.values()) / self.total
+            lines.append(f"  min guesses for an unlock run: {mean:.1f} on average")
+        return "\n".join(lines)
+
+
+_SIGIL_INDEX = None
+
+
+def sigil_index():
+    """Index for the live catalog (rebuilt if WORDS was replaced or resized)."""
+    global _SIGIL_INDEX
+    key = (id(WORDS), len(WORDS))
+    if _SIGIL_INDEX is None or _SIGIL_INDEX[0] != key:
+        _SIGIL_INDEX = (key, SigilIndex(WORDS))
+    return _SIGIL_INDEX[1]
+
+# ======================
+#  Franchise index
+# ======================
+# Filtered play: every pool is a contiguous slice of one precomputed ordering, so a
+# draw is a single randrange + index, never a scan of WORDS.
+
+def _squash(text):
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+class WordPool:
+    """A slice [start, end) of an entry sequence; draw() is O(1)."""
+
+    __slots__ = ("label", "seq", "start", "end")
+
+    def __init__(self, label, seq, start=0, end=None):
+        self.label = label
+        self.seq = seq
+        self.start = start
+        self.end = len(seq) if end is None else end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def draw(self):
+        return self.seq[random.randrange(self.start, self.end)]
+
+    def __repr__(self):
+        return f"WordPool({self.label!r}, {len(self)} words)"
+
+
+class FranchiseIndex:
+    """Catalog grouped by franchise (hint) and by kind, built once.
+
+    A franchise pool holds the characters of that hint. A title counts toward the
+    franchise whose hint squashes to it ("chainsawman" -> "chainsaw man") in
+    `franchise_of`, but stays out of that pool: the pool label would give it away.
+    Kinds: "titles" (no hint) / "characters".
+    """
+
+    KINDS = ("titles", "characters")
+
+    def __init__(self, words=None):
+        words = WORDS if words is None else words
+        by_squash = {}
+        for entry in words:
+            hint = entry.get("hint")
+            if hint:
+                by_squash.setdefault(_squash(hint), hint)
+        groups = {}
+        for entry in words:
+            groups.setdefault(entry.get("hint"), []).append(entry)
+
+        self.order = []
+        self.ranges = {}
+        for key, entries in groups.items():
+            start = len(self.order)
+            self.order.extend(entries)
+            if key is not None:
+                self.ranges[key] = (start, len(self.order))
+        self._by_squash = {_squash(key): key for key in self.ranges}
+        self.franchise_of = {
+            entry["word"]: key for key, (start, end) in self.ranges.items() for entry in self.order[start:end]
+        }
+        for entry in groups.get(None, ()):
+            key = by_squash.get(_squash(entry["word"]))
+            if key is not None:
+                self.franchise_of[entry["word"]] = key
+
+        titles = [e for e in words if not e.get("hint")]
+        self.by_kind = titles + [e for e in words if e.get("hint")]
+        self.kind_ranges = {"titles": (0, len(titles)), "characters": (len(titles), len(self.by_kind))}
+
+    def franchises(self):
+        """[(name, size), ...], biggest first."""
+        return sorted(((k, end - start) for k, (start, end) in self.ranges.items()), key=lambda kv: (-kv[1], kv[0]))
+
+    def resolve(self, name):
+        """Franchise / kind name as typed ("Chainsaw Man", "chainsawman", "chain") -> key or None."""
+        name = normalize(name or "")
+        if not name:
+            return None
+        if name in self.ranges or name in self.kind_ranges:
+            return name
+        key = self._by_squash.get(_squash(name))
+        if key is not None:
+            return key
+        hits = [k for k in self.ranges if k.startswith(name)]
+        return hits[0] if len(hits) == 1 else None
+
+    def pool(self, name):
+        """WordPool for a franchise or kind, or None if it doesn't resolve."""
+        key = self.resolve(name)
+        if key in self.kind_ranges:
+            start, end = self.kind_ranges[key]
+            return WordPool(key, self.by_kind, start, end) if end > start else None
+        if key is None:
+            return None
+        start, end = self.ranges[key]
+        return WordPool(key, self.order, start, end)
+
+
+_FRANCHISE_INDEX = None
+
+
+def franchise_index():
+    """Index for the live catalog (rebuilt if WORDS was replaced or resized)."""
+    global _FRANCHISE_INDEX
+    key = (id(WORDS), len(WORDS))
+    if _FRANCHISE_INDEX is None or _FRANCHISE_INDEX[0] != key:
+        _FRANCHISE_INDEX = (key, FranchiseIndex(WORDS))
+    return _FRANCHISE_INDEX[1]
+
+
+def session_pool():
+    """The current session's Play pool (--franchise), or None for the whole catalog.
+
+    Only menu Play uses it; Challenge always draws from the full catalog.
+    """
+    session = _SESSION.get()
+    return None if session is None else session.pool
+
 # ======================
 #  UI
 # ======================
@@ -531,7 +1509,7 @@ def frame_for_lives(frames, max_lives, lives_left):
 def kawaii_banner(save):
     clear_screen()
     route = "Secret Route: OPEN ✅" if save.get("dazy_unlocked") else "Secret Route: ???"
-    print(rf"""
+    say(rf"""
 ╭──────────────────────────────────────────────────────────╮
 │ (≧◡≦) ♡  OTAKU HANGMAN  ♡ (≧◡≦)                          │
 │  rule: 1 letter per turn                                  │
@@ -542,15 +1520,15 @@ def kawaii_banner(save):
 
 def kawaii_menu(save):
     """Menu behavior:
-    - Locked: show only 1/3/4 (Challenge not shown at all).
+    - Locked: show only 1/3/4/5 (Challenge not shown at all).
       If user types 2 anyway, main() will show the sealed door message.
-    - Unlocked: show 1/2/3/4 with Challenge Mode.
+    - Unlocked: show 1/2/3/4/5 with Challenge Mode.
     - Secret note is NOT a menu item.
     """
     unlocked = bool(save.get("dazy_unlocked"))
 
     if not unlocked:
-        print(r"""
+        say(r"""
 ╔══════════════════════════════════════════════════════╗
 ║              ✨ MENU / メニュー ✨                     ║
 ╠══════════════════════════════════════════════════════╣
@@ -560,12 +1538,13 @@ def kawaii_menu(save):
 ║                                                      ║
 ║  3) 📜 Stats                                         ║
 ║  4) ❌ Quit / やめる                                   ║
+║  5) 🎯 Franchise                                     ║
 ╠══════════════════════════════════════════════════════╣
 ║  Gambatte! (=^･ω･^=)ฅ                                 ║
 ╚══════════════════════════════════════════════════════╝
 """)
     else:
-        print(r"""
+        say(r"""
 ╔══════════════════════════════════════════════════════╗
 ║              ✨ MENU / メニュー ✨                     ║
 ╠══════════════════════════════════════════════════════╣
@@ -573,29 +1552,61 @@ def kawaii_menu(save):
 ║  2) 🔥 Challenge 🔥                                   ║
 ║  3) 📜 Stats                                         ║
 ║  4) ❌ Quit / やめる                                  ║
+║  5) 🎯 Franchise                                     ║
 ╠══════════════════════════════════════════════════════╣
 ║  Gambatte! (=^･ω･^=)ฅ                                ║
 ╚══════════════════════════════════════════════════════╝
 """)
 
-def show_stats(save):
+async def show_stats(save):
     clear_screen()
-    print(r"""
+    say(r"""
 ╔══════════════════════════════════════╗
 ║              📜 STATS                ║
 ╚══════════════════════════════════════╝
 """)
-    print("SAVE FILE:", SAVE_FILE)
-    print(f"🌸 Secret Route opened : {'YES' if save.get('dazy_unlocked') else 'NO'}")
-    print(f"✨ Route opens count    : {save.get('dazy_unlock_count', 0)}")
-    print(f"🔥 Challenge entries    : {save.get('challenge_entries', 0)}")
-    print(f"🏆 Challenge clears     : {save.get('challenge_clears', 0)}")
-    print(f"📩 Secret note unlocked : {'YES' if save.get('secret_note_unlocked') else 'NO'}")
-    print(f"👀 Secret note reads    : {save.get('secret_note_read_count', 0)}")
-    input("\nPress Enter to go back...")
-
-
-def show_secret_note(save):
+    say("SAVE FILE:", save_path())
+    say(f"🌸 Secret Route opened : {'YES' if save.get('dazy_unlocked') else 'NO'}")
+    say(f"✨ Route opens count    : {save.get('dazy_unlock_count', 0)}")
+    say(f"🔥 Challenge entries    : {save.get('challenge_entries', 0)}")
+    say(f"🏆 Challenge clears     : {save.get('challenge_clears', 0)}")
+    say(f"📩 Secret note unlocked : {'YES' if save.get('secret_note_unlocked') else 'NO'}")
+    say(f"👀 Secret note reads    : {save.get('secret_note_read_count', 0)}")
+
+    stats = save_stats(save)
+    rounds, wins = stats["rounds"], stats["wins"]
+    say(f"\n🎮 Rounds played        : {rounds}")
+    say(f"🎉 Rounds won           : {wins}  ({percent(wins, rounds)})")
+    for mode, (played, won) in stats["modes"].items():
+        if played:
+            say(f"   {mode:<10}: {won}/{played} won  ({percent(won, played)})")
+    say(f"🔥 Best challenge streak: {stats['best_streak']}/{WINS_IN_A_ROW_TO_CLEAR}")
+
+    letters = stats["letters"]
+    if letters:
+        say("\n🔤 Letter hit rate (hit / guessed):")
+        cells = []
+        for letter in "abcdefghijklmnopqrstuvwxyz":
+            guessed, hit = letters.get(letter, (0, 0))
+            cells.append(f"{letter} {percent(hit, guessed):>4}")
+        for i in range(0, len(cells), 7):
+            say("   " + "  ".join(cells[i:i + 7]))
+
+    hist = stats["guess_hist"]
+    if any(hist):
+        say("\n📊 Guesses to win:")
+        peak = max(hist)
+        for n, count in enumerate(hist):
+            if count:
+                say(f"   {n:>2} {'█' * max(1, round(20 * count / peak))} {count}")
+    await ack("\nPress Enter to go back...")
+
+
+def percent(part, whole):
+    return f"{100 * part // whole}%" if whole else "-"
+
+
+async def show_secret_note(save):
     """
     Secret note should never be a menu item.
     It is shown automatically right after a successful Challenge clear
@@ -608,7 +1619,7 @@ def show_secret_note(save):
     write_save(save)
 
     clear_screen()
-    print(r"""
+    say(r"""
           
 
 🌸✨ SECRET NOTE ✨🌸
@@ -632,34 +1643,33 @@ System shutting up now.
 (๑>ᴗ<๑)<3
 A_
 """)
-    input("Press Enter...")
+    await ack("Press Enter...")
 
-    import datetime
-    _today = datetime.datetime.now()
+    _today = today()
     if _today.month == 2 and _today.day == 14:
-        print("\n\n")
-        print("\n" + "=" * 46)
-        print("[VALENTINE PATCH v1.0]")
-        print("=" * 46 + "\n")
+        say("\n\n")
+        say("\n" + "=" * 46)
+        say("[VALENTINE PATCH v1.0]")
+        say("=" * 46 + "\n")
 
-        print("System notice:")
-        print("Today is Valentine’s Day.\n")
+        say("System notice:")
+        say("Today is Valentine’s Day.\n")
 
-        print("Stat update:")
-        print("+1 Warmth")
-        print("+1 Mischief\n")
+        say("Stat update:")
+        say("+1 Warmth")
+        say("+1 Mischief\n")
 
-        print("Cause:")
-        print("Unknown.")
-        print("Possible horse-year amplification affecting")
-        print("Tiger-class rizz levels.\n")
+        say("Cause:")
+        say("Unknown.")
+        say("Possible horse-year amplification affecting")
+        say("Tiger-class rizz levels.\n")
 
-        print("-" * 46)
-        print("System going offline.")
-        print("(pretending nothing happened)")
-        print("-" * 46 + "\n")
+        say("-" * 46)
+        say("System going offline.")
+        say("(pretending nothing happened)")
+        say("-" * 46 + "\n")
 
-        input("Press Enter...")
+        await ack("Press Enter...")
 
 
 def unlock_secret_note_if_eligible(save):
@@ -673,54 +1683,62 @@ def unlock_secret_note_if_eligible(save):
 #  Game Hooks (you fill these)
 # ======================
 
-def play_round(max_lives, level_name, frames, save, allow_sigil=True, **kwargs):
-    # pick a random word
-    entry = random.choice(WORDS)
+async def play_round(max_lives, level_name, frames, save, allow_sigil=True, pool=None, mode="play", **kwargs):
+    # pick a random word (filtered pools: O(1) draw; no sigil ritual, the unlock needs the full catalog)
+    if pool is not None:
+        entry = pool.draw()
+        allow_sigil = False
+        level_name = f"{level_name} · {pool.label}"
+    else:
+        entry = random.choice(WORDS)
     wordchosen = entry["word"]
     hint = entry.get("hint")
 
     lives = max_lives
-    display = ["_"] * len(wordchosen)
+    info = word_info(wordchosen)
+    display = list(info.template)  # non-letters are pre-revealed
+    remaining = info.hidden
     guessed = set()
 
     # Sigil progress is PER-ROUND only (must collect d/a/z/y in ONE run and win to save unlock)
     sigil_session = set()  # letters triggered THIS round
     sigil_revealed = False  # only show UI after the player triggers it this round
+    sigil_triggers = 0
 
     def is_single_latin_letter(s):
         return len(s) == 1 and s.isalpha() and s.isascii()
 
-    while lives > 0 and "_" in display:
+    while lives > 0 and remaining > 0:
         clear_screen()
         # frame (safe if frames exists)
         if frames:
             try:
-                print(frame_for_lives(frames, max_lives, lives))
+                say(frame_for_lives(frames, max_lives, lives))
             except Exception:
                 pass
 
-        print(f"💗 HP: {hp_bar_hearts(lives, max_lives)}  ({lives}/{max_lives})   🌟 {level_name}")
-        print("🧩 Word:", " ".join(display))
-        print("📝 Guessed:", " ".join(sorted(guessed)) if guessed else "∅")
+        say(f"💗 HP: {hp_bar_hearts(lives, max_lives)}  ({lives}/{max_lives})   🌟 {level_name}")
+        say("🧩 Word:", " ".join(display))
+        say("📝 Guessed:", " ".join(sorted(guessed)) if guessed else "∅")
         if hint:
-            print("📺 From:", hint)
+            say("📺 From:", hint)
 
         if allow_sigil and (not save.get("dazy_unlocked")) and sigil_revealed:
-            print("🔒 sigil:")
-            print(f"   {sigil_bar(sigil_session)}")
-            print(f"   {sigil_letters(sigil_session)}")
+            say("🔒 sigil:")
+            say(f"   {sigil_bar(sigil_session)}")
+            say(f"   {sigil_letters(sigil_session)}")
 
-        print("-" * 60)
+        say("-" * 60)
 
-        guess = normalize(input("Type 1 letter: "))
+        guess = normalize_guess(await ask("Type 1 letter: ", kind="letter"))
 
         if guess == "" or len(guess) != 1 or (not is_single_latin_letter(guess)):
-            print("⚠️  Type exactly 1 letter (a-z).")
-            input("Press Enter...")
+            say("⚠️  Type exactly 1 letter (a-z).")
+            await ack("Press Enter...")
             continue
         if guess in guessed:
-            print("⚠️  Already guessed.")
-            input("Press Enter...")
+            say("⚠️  Already guessed.")
+            await ack("Press Enter...")
             continue
 
         guessed.add(guess)
@@ -737,10 +1755,11 @@ def play_round(max_lives, level_name, frames, save, allow_sigil=True, **kwargs):
                 sigil_new = True
 
         # normal hangman logic
-        if guess in wordchosen:
-            for i, ch in enumerate(wordchosen):
-                if ch == guess:
-                    display[i] = guess
+        hits = info.positions.get(guess)
+        if hits:
+            for i in hits:
+                display[i] = wordchosen[i]
+            remaining -= len(hits)
         else:
             lives -= 1
 
@@ -750,45 +1769,67 @@ def play_round(max_lives, level_name, frames, save, allow_sigil=True, **kwargs):
         triggered_sigil = allow_sigil and (guess in SIGIL_SET)
 
         if triggered_sigil:
+            sigil_triggers += 1
             clear_screen()
-            print("\n✨ SIGIL RESONANCE ✨\n")
+            say("\n✨ SIGIL RESONANCE ✨\n")
 
             if save.get("dazy_unlocked"):
-                print("The DAZY sigil glows steadily... ✧\n")
+                say("The DAZY sigil glows steadily... ✧\n")
                 ritual_set = set(SIGIL_ORDER)
             else:
                 if sigil_new:
-                    print("Feels like something secret is forming ... ✨\n")
+                    say("Feels like something secret is forming ... ✨\n")
                 else:
-                    print("...a familiar rune flickers softly ✧\n")
+                    say("...a familiar rune flickers softly ✧\n")
                 ritual_set = sigil_session
 
             # ritual animation: empty → lit
-            print("   " + " ".join(["◇"] * 4))
-            print("   " + " ".join(["·"] * 4))
-            time.sleep(0.4)
-            print()
-            print(f"   {sigil_bar(ritual_set)}")
-            print(f"   {sigil_letters(ritual_set)}")
-            input("\nPress Enter to continue...")
+            say("   " + " ".join(["◇"] * 4))
+            say("   " + " ".join(["·"] * 4))
+            await pause(0.4)
+            say()
+            say(f"   {sigil_bar(ritual_set)}")
+            say(f"   {sigil_letters(ritual_set)}")
+            await ack("\nPress Enter to continue...")
 
         # =============================
         # PHASE 2: NORMAL GUESS FEEDBACK
         # =============================
         clear_screen()
 
-        if guess in wordchosen:
-            print(pick_cute(CUTE_CORRECT))
+        if hits:
+            say(pick_cute(CUTE_CORRECT))
         else:
-            print(pick_cute(CUTE_WRONG))
-
+            say(pick_cute(CUTE_WRONG))
 
-        input("Press Enter...")
 
-    return {"won": ("_" not in display), "word": wordchosen, "sigil_complete": (len(sigil_session) == 4)}
+        await ack("Press Enter...")
 
+    count_round(save, mode, remaining == 0, guessed, info.positions)
+    write_save(save)
 
-def challenge_mode(save):
+    result = {
+        "won": remaining == 0,
+        "word": wordchosen,
+        "sigil_complete": (len(sigil_session) == 4),
+        "guesses": len(guessed),
+        "wrong": max_lives - lives,
+    }
+    append_journal({
+        "kind": "round",
+        "mode": mode,
+        "word": wordchosen,
+        "franchise": franchise_index().franchise_of.get(wordchosen),
+        "won": result["won"],
+        "guesses": result["guesses"],
+        "wrong": result["wrong"],
+        "max_lives": max_lives,
+        "sigils": sigil_triggers,
+    })
+    return result
+
+
+async def challenge_mode(save):
     """Challenge Mode: win 5 rounds in a row.
 
     - Locked until DAZY sigil is unlocked (save['dazy_unlocked'] == True)
@@ -798,8 +1839,8 @@ def challenge_mode(save):
     """
     if not save.get("dazy_unlocked"):
         clear_screen()
-        print("…the door doesn't move. ◆◇◇◇\n")
-        input("Press Enter...")
+        say("…the door doesn't move. ◆◇◇◇\n")
+        await ack("Press Enter...")
         return False
 
     # Track entry
@@ -809,72 +1850,672 @@ def challenge_mode(save):
     streak = 0
     while streak < WINS_IN_A_ROW_TO_CLEAR:
         clear_screen()
-        print(
+        say(
             f"🔥 CHALLENGE MODE — Win {WINS_IN_A_ROW_TO_CLEAR} in a row!  (streak: {streak}/{WINS_IN_A_ROW_TO_CLEAR})\n"
         )
-        input("Press Enter to start the next round...")
+        await ack("Press Enter to start the next round...")
 
-        result = play_round(
+        result = await play_round(
             max_lives=CHALLENGE_LIVES,
             level_name=f"CHALLENGE {streak + 1}/{WINS_IN_A_ROW_TO_CLEAR}",
             frames=FRAMES_L2,
             save=save,
             allow_sigil=False,
+            mode="challenge",
         )
 
         # reload save in case play_round wrote anything
-        save.update(load_save())
+        reload_save(save)
 
         if result.get("won"):
             streak += 1
+            if count_streak(save, streak):
+                write_save(save)
             clear_screen()
-            print(f"✅ Round cleared! ({streak}/{WINS_IN_A_ROW_TO_CLEAR})\n")
-            print(f"WORD：{result.get('word')}！\n")
-            input("\nPress Enter...")
+            say(f"✅ Round cleared! ({streak}/{WINS_IN_A_ROW_TO_CLEAR})\n")
+            say(f"WORD：{result.get('word')}！\n")
+            await ack("\nPress Enter...")
         else:
+            append_journal({"kind": "streak", "length": streak, "cleared": False})
             streak = 0
             clear_screen()
-            print("❌ Round failed. Streak reset to 0.\n")
-            input("Press Enter...")
+            say("❌ Round failed. Streak reset to 0.\n")
+            await ack("Press Enter...")
 
     # streak cleared — now require the secret password before recording the clear
+    append_journal({"kind": "streak", "length": streak, "cleared": True})
     clear_screen()
-    print("\n🏆 CHALLENGE CLEARED!\n")
-    print("Extra check: guess from Kamisama Kiss ✧")
-    print("THINK CAREFULLY — ONE SHOT ONLY.\n")
+    say("\n🏆 CHALLENGE CLEARED!\n")
+    say("Extra check: guess from Kamisama Kiss ✧")
+    say("THINK CAREFULLY — ONE SHOT ONLY.\n")
 
-    # Print prompt explicitly to guarantee visibility across terminals
-    print("SECRET PASSWORD: ", end="", flush=True)
-    password = normalize(sys.stdin.readline())
+    password = normalize(await ask("SECRET PASSWORD: ", kind="password"))
 
     if password != "tomoe":
-        print("\n⚠️  Wrong password. Clear not finalized.\n")
-        input("Press Enter...")
+        say("\n⚠️  Wrong password. Clear not finalized.\n")
+        await ack("Press Enter...")
         return False
 
     # Finalize clear ONLY if password is correct
     save["challenge_clears"] = int(save.get("challenge_clears", 0)) + 1
     write_save(save)
 
-    print("\n✨ Password accepted.\n")
-    input("Press Enter...")
+    say("\n✨ Password accepted.\n")
+    await ack("Press Enter...")
     return True
 
+
+async def franchise_mode(save):
+    """One normal round drawn from a single franchise (or titles / characters only).
+
+    Filtered rounds never open the sigil route; that stays a full-catalog feat.
+    """
+    index = franchise_index()
+    choices = index.franchises()
+    clear_screen()
+    say("\n🎯 FRANCHISE PLAY\n")
+    for n, (name, size) in enumerate(choices, 1):
+        say(f"  {n:>2}) {name}  ({size})")
+    start, end = index.kind_ranges["titles"]
+    say(f"   t) anime titles only  ({end - start})")
+    start, end = index.kind_ranges["characters"]
+    say(f"   c) characters only  ({end - start})\n")
+
+    pick = normalize(await ask("Number or name (Enter = back): ", kind="text"))
+    if not pick:
+        return None
+    if pick.isdigit() and 1 <= int(pick) <= len(choices):
+        pick = choices[int(pick) - 1][0]
+    pick = {"t": "titles", "c": "characters"}.get(pick, pick)
+    pool = index.pool(pick)
+    if pool is None:
+        say(f"\n⚠️  No franchise matches {pick!r}.\n")
+        await ack("Press Enter...")
+        return None
+
+    clear_screen()
+    say(f"\n✨ {pool.label} — {len(pool)} words ✨\n")
+    await ack("Press Enter to start...")
+    result = await play_round(
+        max_lives=BASE_LIVES,
+        level_name="LEVEL 1",
+        frames=FRAMES_L1,
+        save=save,
+        pool=pool,
+        mode="franchise",
+    )
+    if result.get("won"):
+        say(f"\n🎉 YOU WIN!! The word was: {result.get('word')}  ✧٩(ˊωˋ*)و✧\n")
+    else:
+        say(f"\n💀 YOU LOSE... The word was: {result.get('word')}  (っ˘̩╭╮˘̩)っ\n")
+    await ack("Press Enter to return to menu...")
+    return result
+
+# ======================
+#  Session core
+# ======================
+# The game is a coroutine: it awaits Ask (input) and Pause (delay) requests and a
+# host steps it. The same game runs under the terminal (run_blocking), asyncio
+# (stream_session) or a GUI event loop (inputs.put + pump / resume), without
+# polling. Pacing decides which pauses and "Press Enter" screens reach the host
+# at all.
+
+CLEAR_SEQ = "\x1b[2J\x1b[H"
+
+_SESSION = contextvars.ContextVar("otaku_session", default=None)
+
+
+class Ask:
+    """Input request yielded to the host. kind: option / letter / ack / password / text."""
+
+    __slots__ = ("prompt", "kind")
+
+    def __init__(self, prompt, kind):
+        self.prompt = prompt
+        self.kind = kind
+
+    def __await__(self):
+        line = yield self
+        return line
+
+    def __repr__(self):
+        return f"Ask({self.prompt!r}, {self.kind!r})"
+
+
+class Pause:
+    """Delay request yielded to the host (real-time animation beat)."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __await__(self):
+        yield self
+
+    def __repr__(self):
+        return f"Pause({self.seconds!r})"
+
+
+class CancelToken:
+    """Shared cancellation flag; a cancelled session closes at its next step."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+class InputChannel:
+    """Input lines for one session.
+
+    put() may come from any thread; the host answers with get_nowait() as soon as the
+    session asks (GameSession.pump), so input never waits on a poll interval. Lines
+    carry their arrival time so hosts can report input-to-processing latency.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lines = deque()
+
+    def put(self, line):
+        with self._lock:
+            self._lines.append((line, time.perf_counter()))
+
+    def get_nowait(self):
+        """-> (line, arrived_at), or None if nothing is queued."""
+        with self._lock:
+            return self._lines.popleft() if self._lines else None
+
+    def __len__(self):
+        return len(self._lines)
+
+
+class Metrics:
+    """Minimal instrumentation: count / total / max per name (seconds)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def observe(self, name, seconds):
+        with self._lock:
+            d = self._data.get(name)
+            if d is None:
+                d = self._data[name] = [0, 0.0, 0.0]
+            d[0] += 1
+            d[1] += seconds
+            d[2] = max(d[2], seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {"count": n, "mean_ms": round(total / n * 1000, 3), "max_ms": round(mx * 1000, 3)}
+                for name, (n, total, mx) in self._data.items()
+            }
+
+
+# process-wide instrumentation (input latency, ...)
+metrics = Metrics()
+
+
+# pacing: OTAKU_PACING=realtime | fast[:scale] | skip, optional "+ack" / "-ack" suffix
+PACING_ENV = "OTAKU_PACING"
+PACING_USAGE = "realtime | fast[:scale] | skip, optionally with +ack / -ack"
+FAST_FORWARD_SCALE = 0.25
+
+
+class Pacing:
+    """How a session plays animation pauses and "Press Enter" screens.
+
+    realtime: pauses as written (interactive play)
+    fast:     pauses scaled by `scale` (kiosk fast mode)
+    skip:     no pauses at all (bots, simulations, scripted sessions)
+    auto_ack answers acknowledgement prompts inside the session (the prompt is
+    still shown); it defaults to on for skip only.
+    """
+
+    MODES = ("realtime", "fast", "skip")
+
+    def __init__(self, mode="realtime", scale=FAST_FORWARD_SCALE, auto_ack=None):
+        if mode not in self.MODES:
+            raise ValueError(f"unknown pacing mode {mode!r} (use {', '.join(self.MODES)})")
+        self.mode = mode
+        self.scale = max(0.0, float(scale))
+        self.auto_ack = (mode == "skip") if auto_ack is None else bool(auto_ack)
+
+    def delay(self, seconds):
+        """Real seconds to wait for a Pause(seconds); 0 means skip it."""
+        if self.mode == "skip":
+            return 0.0
+        if self.mode == "fast":
+            return seconds * self.scale
+        return seconds
+
+    @classmethod
+    def parse(cls, spec):
+        """'realtime', 'fast', 'fast:0.1', 'skip', each optionally with '+ack' / '-ack'."""
+        spec = (spec or "realtime").strip().lower()
+        auto_ack = None
+        if spec.endswith(("+ack", "-ack")):
+            auto_ack = spec[-4] == "+"
+            spec = spec[:-4]
+        mode, _, scale = spec.partition(":")
+        return cls(mode or "realtime", float(scale) if scale else FAST_FORWARD_SCALE, auto_ack)
+
+    @classmethod
+    def from_env(cls):
+        try:
+            return cls.parse(os.environ.get(PACING_ENV, ""))
+        except ValueError:
+            return cls()
+
+    def __repr__(self):
+        return f"Pacing({self.mode!r}, scale={self.scale!r}, auto_ack={self.auto_ack!r})"
+
+
+class GameSession:
+    """One game run driven by a host.
+
+    start() runs until the first request; feed(line) answers an Ask; resume() continues
+    after a Pause. Each returns the next request (`pending`), or None once finished.
+    Output goes to `write`/`clear` (default: an internal buffer read with drain()).
+    `save_path` gives the session its own save file (default: SAVE_FILE).
+
+    Hosts that receive input asynchronously put lines on `inputs` and call pump();
+    `token` (shareable) cancels the run cleanly from any thread.
+
+    `pacing` (default: from OTAKU_PACING) is applied here, so hosts only ever see the
+    pauses and acknowledgement prompts it leaves in place. `today` pins the date;
+    `pool` (a WordPool) restricts normal rounds to one franchise / kind.
+    """
+
+    def __init__(self, entry=None, write=None, clear=None, save_path=None, token=None, pacing=None,
+                 today=None, pool=None):
+        self.save_path = save_path
+        self.today = today
+        self.pool = pool
+        self.pacing = pacing if pacing is not None else Pacing.from_env()
+        self.token = token if token is not None else CancelToken()
+        self.inputs = InputChannel()
+        self._buf = []
+        self._write = write if write is not None else self._buf.append
+        self._clear = clear
+        self.pending = None
+        self.finished = False
+        # each session gets its own context, so many can run in one thread
+        self._ctx = contextvars.Context()
+        self._ctx.run(_SESSION.set, self)
+        self._coro = (entry or menu_loop)()
+
+    # ---- output
+    def write(self, text):
+        self._write(text)
+
+    def clear(self):
+        if self._clear is not None:
+            self._clear()
+        else:
+            self._write(CLEAR_SEQ)
+
+    def drain(self):
+        """Buffered output since the last drain() (default sink only)."""
+        out = "".join(self._buf)
+        self._buf.clear()
+        return out
+
+    # ---- stepping
+    def start(self):
+        return self._step(self._coro.send, None)
+
+    def feed(self, line):
+        if not isinstance(self.pending, Ask):
+            raise RuntimeError(f"session is not waiting for input (pending={self.pending!r})")
+        return self._step(self._coro.send, line)
+
+    def resume(self):
+        if not isinstance(self.pending, Pause):
+            raise RuntimeError(f"session is not paused (pending={self.pending!r})")
+        return self._step(self._coro.send, None)
+
+    def pump(self):
+        """Answer the pending Ask with queued input lines (zero wait); returns `pending`."""
+        while isinstance(self.pending, Ask) and not self.finished:
+            item = self.inputs.get_nowait()
+            if item is None:
+                break
+            line, arrived = item
+            self.feed(line)
+            metrics.observe("input_latency", time.perf_counter() - arrived)
+        return self.pending
+
+    def throw(self, exc):
+        """Raise `exc` at the pending await (e.g. KeyboardInterrupt at a prompt)."""
+        return self._step(self._coro.throw, exc)
+
+    def close(self):
+        """Stop the run (runs the game's finally blocks)."""
+        if not self.finished:
+            self.finished = True
+            self.pending = None
+            self._ctx.run(self._coro.close)
+
+    def _step(self, fn, value):
+        if self.finished:
+            return None
+        if self.token.cancelled:
+            self.close()
+            return None
+        try:
+            self.pending = self._paced(self._ctx.run(fn, value))
+        except StopIteration:
+            self.pending = None
+            self.finished = True
+        except BaseException:
+            self.pending = None
+            self.finished = True
+            raise
+        return self.pending
+
+    def _paced(self, req):
+        """Settle the requests the pacing policy handles itself; return the next one for the host."""
+        pacing = self.pacing
+        while True:
+            if isinstance(req, Pause):
+                seconds = pacing.delay(req.seconds)
+                if seconds > 0:
+                    return req if seconds == req.seconds else Pause(seconds)
+                req = self._ctx.run(self._coro.send, None)
+            elif isinstance(req, Ask) and req.kind == "ack" and pacing.auto_ack:
+                self.write(req.prompt + "\n")
+                req = self._ctx.run(self._coro.send, "")
+            else:
+                return req
+
+
+def run_blocking(session, read=input, flush=None):
+    """Terminal host: block on read(prompt) for each Ask, sleep for each Pause.
+
+    flush() (optional) is called whenever output must become visible without a prompt:
+    before each pause and when the run ends.
+    """
+    try:
+        req = session.start()
+        while req is not None:
+            if isinstance(req, Pause):
+                if flush is not None:
+                    flush()
+                time.sleep(req.seconds)
+                req = session.resume()
+                continue
+            try:
+                line = read(req.prompt)
+            except KeyboardInterrupt as e:
+                req = session.throw(e)
+                continue
+            except EOFError:
+                session.close()
+                return
+            req = session.feed(line)
+    finally:
+        if flush is not None:
+            flush()
+
+
+async def stream_session(session, inputs, executor=None):
+    """asyncio host: async stream of (output, request) pairs.
+
+    `inputs` is an async iterator of lines; each Ask waits for the next one (no polling),
+    each Pause is an asyncio.sleep. The final pair has request None. With an `executor`,
+    game steps (and so their save / journal I/O and the save lock) run there instead of
+    on the event loop; one session's steps still run one at a time.
+    """
+    import asyncio
+    lines = inputs.__aiter__()
+    if executor is None:
+        async def step(fn, *args):
+            return fn(*args)
+    else:
+        loop = asyncio.get_running_loop()
+
+        def step(fn, *args):
+            return loop.run_in_executor(executor, fn, *args)
+
+    req = await step(session.start)
+    while True:
+        yield session.drain(), req
+        if req is None or session.token.cancelled:
+            session.close()
+            return
+        if isinstance(req, Pause):
+            await asyncio.sleep(req.seconds)
+            req = await step(session.resume)
+            continue
+        try:
+            line = await lines.__anext__()
+        except StopAsyncIteration:
+            session.close()
+            yield session.drain(), None
+            return
+        req = await step(session.feed, line)
+
+
+# ======================
+#  Differential screen output
+# ======================
+# Screens are rebuilt from scratch (clear_screen + say), but from one guess to the
+# next only the HP / word / guessed lines change. ScreenBuffer keeps the screen as
+# a list of lines plus what the host currently shows, and hands out only the rows
+# that differ: the terminal turns them into cursor-addressed ANSI, the GUI into
+# Text line replacements.
+
+def display_width(text):
+    """Terminal columns of `text` (East Asian wide / fullwidth count as 2)."""
+    if text.isascii():
+        return len(text)
+    import unicodedata
+    return sum(0 if unicodedata.combining(ch) else 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+               for ch in text)
+
+
+def _safe_prefix(old, new):
+    """Length of the common prefix of two rows, cut back to where column math is exact.
+
+    Emoji sequences (variation selectors, joiners) and ambiguous-width symbols render at
+    terminal-dependent widths, so the prefix stops before the first of them. It never
+    ends right before a mark that attaches to the previous character (combining accents,
+    joiners, selectors), in either row.
+    """
+    n = 0
+    limit = min(len(old), len(new))
+    while n < limit and old[n] == new[n]:
+        n += 1
+    if n == 0 or (new[:n].isascii() and old[n:n + 1].isascii() and new[n:n + 1].isascii()):
+        return n
+    import unicodedata
+
+    def attaches(row, i):
+        return i < len(row) and (row[i] in "\ufe0f\u200d" or unicodedata.combining(row[i]))
+
+    for i, ch in enumerate(new[:n]):
+        if ch in "\ufe0f\u200d" or unicodedata.east_asian_width(ch) == "A":
+            n = i
+            break
+    while n and (attaches(new, n) or attaches(old, n)):
+        n -= 1
+    return n
+
+
+# a cleared screen this short (guess feedback + "Press Enter...") is drawn under the
+# previous one, so the board after it only differs from the display in a few rows
+OVERLAY_ROWS = 2
+
+
+class ScreenBuffer:
+    """Line model of one screen for differential redraws.
+
+    Use write / clear as a GameSession sink, echo() for text the host already put on
+    screen itself (typed input), and changes() / render_ansi() to redraw.
+
+    The game clears before every screen. Here, a screen of at most `overlay_rows` rows
+    (0 = off) is shown under the one it cleared instead of on a blank display; that
+    rendering choice stays in this host, other hosts clear as the game asks.
+    """
+
+    def __init__(self, overlay_rows=OVERLAY_ROWS):
+        self.lines = [""]
+        self.overlay_rows = overlay_rows
+        self._under = None      # rows of the cleared screen a short screen is drawn under
+        self._overlaid = False  # the current screen has been shown composed with _under
+        self._shown = None      # rows the host displays; None = unknown (full redraw)
+        self.bytes_out = 0      # ANSI bytes actually written
+        self.bytes_full = 0     # bytes the plain clear + reprint output would have been
+
+    # ---- session sink
+    def write(self, text):
+        self.bytes_full += len(text.encode("utf-8"))
+        self._append(text)
+
+    def clear(self):
+        self.bytes_full += len(CLEAR_SEQ)
+        under = self.lines[:-1] if self.lines[-1] == "" else self.lines
+        self._under = under if self.overlay_rows else None
+        self._overlaid = False
+        self.lines = [""]
+
+    def screen(self):
+        """Rows to display: the current screen, under its predecessor if it is short."""
+        if self._under is not None and (self._overlaid or len(self.lines) <= self.overlay_rows):
+            return self._under + self.lines
+        return self.lines
+
+    def _append(self, text):
+        parts = text.split("\n")
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+
+    # ---- host side
+    def echo(self, text):
+        """The host displayed `text` at the cursor itself (e.g. the terminal echoing input)."""
+        in_sync = self._shown is not None and self._shown == self.screen()
+        self._append(text)
+        if in_sync:
+            self._shown = list(self.screen())
+
+    def invalidate(self):
+        """Host display is unknown (resize, ^C, foreign output): next redraw is full."""
+        self._shown = None
+
+    def changes(self, full=False):
+        """-> (full, [(row, text), ...], rows) since the last call; marks the screen as shown.
+
+        full=True (or an unknown display) returns every row; otherwise only rows that
+        differ from what is shown. Rows past `rows` must be removed by the host.
+        """
+        lines = self.screen()
+        if lines is not self.lines:
+            self._overlaid = True  # keep the composition until the next clear
+        shown = self._shown
+        self._shown = list(lines)
+        if full or shown is None:
+            return True, list(enumerate(lines)), len(lines)
+        changed = [(i, line) for i, line in enumerate(lines) if i >= len(shown) or shown[i] != line]
+        return False, changed, len(lines)
+
+    def render_ansi(self, term_cols=0, term_rows=0):
+        """ANSI text that turns the terminal's current screen into this one.
+
+        Falls back to clear + full reprint when the screen would scroll or wrap
+        (cursor addressing only works while every row is one terminal line).
+        """
+        lines = self.screen()
+        fits = (not term_rows or len(lines) < term_rows) and (
+            not term_cols or all(display_width(line) < term_cols for line in lines))
+        shown = self._shown or []
+        prev_rows = len(shown)
+        full, changed, rows = self.changes(full=not fits)
+        if full:
+            out = CLEAR_SEQ + "\n".join(lines)
+            if not fits:
+                self._shown = None
+        else:
+            parts = []
+            if prev_rows > rows:
+                parts.append(f"\x1b[{rows + 1};1H\x1b[J")
+            for row, text in changed:
+                # rewrite from the first differing column only ("guessed: a b" -> "a b c")
+                col = _safe_prefix(shown[row], text) if row < prev_rows else 0
+                parts.append(f"\x1b[{row + 1};{display_width(text[:col]) + 1}H{text[col:]}\x1b[K")
+            if (changed and changed[-1][0] != rows - 1) or (not changed and prev_rows > rows):
+                # leave the cursor at the end of the last row (where the prompt is)
+                last = lines[-1]
+                if _safe_prefix(last, last) == len(last):
+                    parts.append(f"\x1b[{rows};{display_width(last) + 1}H")
+                else:
+                    parts.append(f"\x1b[{rows};1H{last}\x1b[K")
+            out = "".join(parts)
+        self.bytes_out += len(out.encode("utf-8"))
+        return out
+
+    def stats(self):
+        return {"bytes_out": self.bytes_out, "bytes_full": self.bytes_full,
+                "ratio": round(self.bytes_full / self.bytes_out, 1) if self.bytes_out else 0.0}
+
+
 # ======================
 #  Main
 # ======================
 
-def main():
+def main(pacing=None, diff=None, pool=None):
+    """Play in the terminal (differential redraws on a POSIX tty; OTAKU_DIFF=0 disables).
+
+    `pool` (see FranchiseIndex.pool) restricts every Play round to one franchise.
+    """
+    if diff is None:
+        diff = os.name != "nt" and sys.stdout.isatty() and os.environ.get("OTAKU_DIFF", "1") != "0"
+    if not diff:
+        run_blocking(GameSession(write=sys.stdout.write, clear=terminal_clear, pacing=pacing, pool=pool))
+        return
+
+    import shutil
+    screen = ScreenBuffer()
+
+    def flush():
+        size = shutil.get_terminal_size((0, 0))
+        sys.stdout.write(screen.render_ansi(size.columns, size.lines))
+        sys.stdout.flush()
+
+    def read(prompt):
+        screen.write(prompt)
+        flush()
+        try:
+            line = input()
+        except (KeyboardInterrupt, EOFError):
+            screen.invalidate()
+            raise
+        screen.echo(line + "\n")
+        return line
+
+    run_blocking(GameSession(write=screen.write, clear=screen.clear, pacing=pacing, pool=pool),
+                 read=read, flush=flush)
+
+
+async def menu_loop():
     save = load_save()
 
     while True:
         kawaii_banner(save)
         kawaii_menu(save)
         try:
-            option = normalize(input("Option: "))
+            option = normalize(await ask("Option: ", kind="option"))
         except KeyboardInterrupt:
             clear_screen()
-            print("\n\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  (Interrupted)\n")
+            say("\n\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  (Interrupted)\n")
             break
 
 
@@ -882,21 +2523,22 @@ def main():
 
         # -------------------------
         # LOCKED MENU MAPPING
-        # 1 Play / 3 Stats / 4 Quit
+        # 1 Play / 3 Stats / 4 Quit / 5 Franchise
         # (Challenge is hidden; typing 2 shows sealed door)
         # -------------------------
         if not unlocked:
             if option == "1":
                 clear_screen()
-                print("\n✨ New run! ✨\n")
-                input("Press Enter to start...")
+                say("\n✨ New run! ✨\n")
+                await ack("Press Enter to start...")
 
-                result = play_round(
+                result = await play_round(
                     max_lives=BASE_LIVES,
                     level_name="LEVEL 1",
                     frames=FRAMES_L1,
                     save=save,
-                    allow_sigil=True
+                    allow_sigil=True,
+                    pool=session_pool(),
                 )
 
                 save = load_save()
@@ -909,59 +2551,64 @@ def main():
                     save["sigil_collected"] = []
                     write_save(save)
                     clear_screen()
-                    print("\nCongratulations Dazy✨！You unlocked the challenge mode 🔥！！\n")
-                    input("Press Enter...")
+                    say("\nCongratulations Dazy✨！You unlocked the challenge mode 🔥！！\n")
+                    await ack("Press Enter...")
                     save = load_save()
                     clear_screen()
 
                 if result.get("won"):
-                    print(f"\n🎉 YOU WIN!! The word was: {result.get('word')}  ✧٩(ˊωˋ*)و✧\n")
-                    print(f"WORD:：{result.get('word')}！\n")
+                    say(f"\n🎉 YOU WIN!! The word was: {result.get('word')}  ✧٩(ˊωˋ*)و✧\n")
+                    say(f"WORD:：{result.get('word')}！\n")
                 else:
-                    print(f"\n💀 YOU LOSE... The word was: {result.get('word')}  (っ˘̩╭╮˘̩)っ\n")
-                input("Press Enter to return to menu...")
+                    say(f"\n💀 YOU LOSE... The word was: {result.get('word')}  (っ˘̩╭╮˘̩)っ\n")
+                await ack("Press Enter to return to menu...")
 
             elif option == "2":
                 clear_screen()
-                print("…the door doesn't move. ◆◇◇◇\n")
-                input("Press Enter...")
+                say("…the door doesn't move. ◆◇◇◇\n")
+                await ack("Press Enter...")
 
             elif option == "3":
-                show_stats(save)
+                await show_stats(save)
                 save = load_save()
 
             elif option == "4":
-                print("\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  See you next time!\n")
+                say("\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  See you next time!\n")
                 break
 
+            elif option == "5":
+                await franchise_mode(save)
+                save = load_save()
+
             elif option in ("reset", "99"):
                 save = reset_save_to_locked()
                 clear_screen()
-                print("✅ Save reset to LOCKED state.\n")
-                print("SAVE FILE:", SAVE_FILE)
-                input("Press Enter...")
+                say("✅ Save reset to LOCKED state.\n")
+                say("SAVE FILE:", save_path())
+                await ack("Press Enter...")
 
             else:
-                print("⚠️  Please choose 1/3/4.\n")
-                time.sleep(0.7)
+                say("⚠️  Please choose 1/3/4/5.\n")
+                await pause(0.7)
 
             continue
 
         # -------------------------
         # UNLOCKED MENU MAPPING
-        # 1 Play / 2 Challenge / 3 Stats / 4 Quit
+        # 1 Play / 2 Challenge / 3 Stats / 4 Quit / 5 Franchise
         # -------------------------
         if option == "1":
             clear_screen()
-            print("\n✨ New run! ✨\n")
-            input("Press Enter to start...")
+            say("\n✨ New run! ✨\n")
+            await ack("Press Enter to start...")
 
-            result = play_round(
+            result = await play_round(
                 max_lives=BASE_LIVES,
                 level_name="LEVEL 1",
                 frames=FRAMES_L1,
                 save=save,
-                allow_sigil=True
+                allow_sigil=True,
+                pool=session_pool(),
             )
 
             save = load_save()
@@ -974,45 +2621,100 @@ def main():
                 save["sigil_collected"] = []
                 write_save(save)
                 clear_screen()
-                print("\nCongratulations Dazy✨！You unlocked the challenge mode 🔥！！\n")
-                input("Press Enter...")
+                say("\nCongratulations Dazy✨！You unlocked the challenge mode 🔥！！\n")
+                await ack("Press Enter...")
                 save = load_save()
                 clear_screen()
 
             if result.get("won"):
-                print(f"\n🎉 YOU WIN!! The word was: {result.get('word')}  ✧٩(ˊωˋ*)و✧\n")
-                print(f"WORD：{result.get('word')}！\n")
+                say(f"\n🎉 YOU WIN!! The word was: {result.get('word')}  ✧٩(ˊωˋ*)و✧\n")
+                say(f"WORD：{result.get('word')}！\n")
             else:
-                print(f"\n💀 YOU LOSE... The word was: {result.get('word')}  (っ˘̩╭╮˘̩)っ\n")
-            input("Press Enter to return to menu...")
+                say(f"\n💀 YOU LOSE... The word was: {result.get('word')}  (っ˘̩╭╮˘̩)っ\n")
+            await ack("Press Enter to return to menu...")
 
         elif option == "2":
-            cleared = challenge_mode(save)
+            cleared = await challenge_mode(save)
             save = load_save()
 
             if cleared:
                 unlock_secret_note_if_eligible(save)
                 save = load_save()
                 if save.get("secret_note_unlocked"):
-                    show_secret_note(save)
+                    await show_secret_note(save)
                     save = load_save()
 
         elif option == "3":
-            show_stats(save)
+            await show_stats(save)
             save = load_save()
 
         elif option == "4":
-            print("\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  See you next time!\n")
+            say("\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  See you next time!\n")
             break
 
+        elif option == "5":
+            await franchise_mode(save)
+            save = load_save()
+
         else:
-            print("⚠️  Please choose 1/2/3/4.\n")
-            time.sleep(0.7)
+            say("⚠️  Please choose 1/2/3/4/5.\n")
+            await pause(0.7)
+
+
+def _flag_value(flag, usage):
+    """Value after `flag` on the command line, None if the flag is absent.
+
+    Exits with a usage message when the flag is last or followed by another flag.
+    """
+    args = sys.argv[1:]
+    if flag not in args:
+        return None
+    i = args.index(flag) + 1
+    if i >= len(args) or args[i].startswith("--"):
+        print(f"{flag} needs a value (use: {usage})", file=sys.stderr)
+        sys.exit(2)
+    return args[i]
 
 
 if __name__ == "__main__":
+    words = _flag_value("--words", "a word pack built by otaku_wordpack.py")
+    try:
+        if words is not None:
+            use_word_pack(words)
+        else:
+            use_word_pack_from_env()
+    except (OSError, ValueError) as e:
+        print(f"word pack not loaded: {e}", file=sys.stderr)
+        sys.exit(2)
+    if "--sigil-report" in sys.argv[1:]:
+        print(sigil_index().report())
+        sys.exit(0)
+    # GUI warm standby: imports are paid up front, the run starts on a GO line
+    if "--standby" in sys.argv[1:]:
+        if sys.stdin.readline().strip() != "GO":
+            sys.exit(0)
+    # --pacing MODE (same values as OTAKU_PACING), --fast = --pacing fast
+    pacing = None
+    if "--fast" in sys.argv[1:]:
+        pacing = Pacing("fast")
+    spec = _flag_value("--pacing", PACING_USAGE)
+    if spec is not None:
+        try:
+            pacing = Pacing.parse(spec)
+        except ValueError:
+            print(f"bad --pacing {spec!r} (use: {PACING_USAGE})", file=sys.stderr)
+            sys.exit(2)
+    # --franchise NAME: every Play round draws from that franchise ("titles" / "characters" too)
+    pool = None
+    name = _flag_value("--franchise", "a franchise name, titles or characters")
+    if name is not None:
+        pool = franchise_index().pool(name)
+        if pool is None:
+            names = ", ".join(n for n, _ in franchise_index().franchises())
+            print(f"unknown franchise {name!r} (try: titles, characters, {names})", file=sys.stderr)
+            sys.exit(2)
     try:
-        main()
+        main(pacing, pool=pool)
     except KeyboardInterrupt:
         clear_screen()
-        print("\n\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  (Interrupted)\n")
\ No newline at end of file
+        say("\n\nBye bye~ (｡•́‿•̀｡)ﾉﾞ  (Interrupted)\n")
\ No newline at end of file
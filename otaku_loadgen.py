@@ -0,0 +1,406 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import otaku_hang_man as game
+
+# ============================================================
+#  OTAKU HANGMAN - LOAD GENERATOR
+#
+#  N simulated players against the TCP session server (otaku_server.py) or straight
+#  against the engine (GameSession, no network). Reports throughput and latency
+#  percentiles as JSON.
+#
+#    python otaku_loadgen.py --target engine --players 500 --rounds 5 --procs 4
+#    python otaku_loadgen.py --target tcp --port 7878 --players 200 --think-ms 300
+#
+#  Latency = time from sending an answer until the next prompt arrives.
+#  "guess" only counts letter answers; "prompt" counts every answer.
+# ============================================================
+
+
+# ======================
+#  HDR-style histogram
+# ======================
+
+class Histogram:
+    """Log-linear latency histogram (microseconds), HdrHistogram-style.
+
+    Values are bucketed by power of two, each split into 2**sub_bits linear
+    sub-buckets, so every recorded value keeps ~1/2**sub_bits relative precision
+    with a few KB of memory no matter how many samples are recorded.
+    """
+
+    def __init__(self, sub_bits=7):
+        self.sub_bits = sub_bits
+        self.sub_count = 1 << sub_bits
+        self.counts = {}
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, v):
+        if v < self.sub_count:
+            return v
+        shift = v.bit_length() - self.sub_bits - 1
+        return ((shift + 1) << self.sub_bits) + ((v >> shift) - self.sub_count)
+
+    def _value_at(self, idx):
+        """Highest value that maps into bucket `idx` (reported percentile value)."""
+        if idx < self.sub_count:
+            return idx
+        shift = (idx >> self.sub_bits) - 1
+        sub = (idx & (self.sub_count - 1)) + self.sub_count
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value_us):
+        v = max(0, int(value_us))
+        idx = self._index(v)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.total += 1
+        self.sum += v
+        self.max = max(self.max, v)
+        self.min = v if self.min is None else min(self.min, v)
+
+    def merge(self, other):
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def percentile(self, p):
+        if not self.total:
+            return 0
+        rank = max(1, math.ceil(self.total * p / 100.0))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._value_at(idx), self.max)
+        return self.max
+
+    def summary(self):
+        ms = lambda us: round(us / 1000.0, 3)
+        return {
+            "count": self.total,
+            "min_ms": ms(self.min or 0),
+            "mean_ms": ms(self.sum / self.total) if self.total else 0.0,
+            "p50_ms": ms(self.percentile(50)),
+            "p90_ms": ms(self.percentile(90)),
+            "p99_ms": ms(self.percentile(99)),
+            "p999_ms": ms(self.percentile(99.9)),
+            "max_ms": ms(self.max),
+        }
+
+    def to_dict(self):
+        return {"sub_bits": self.sub_bits, "counts": self.counts, "total": self.total,
+                "sum": self.sum, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, d):
+        h = cls(d["sub_bits"])
+        h.counts = {int(k): v for k, v in d["counts"].items()}
+        h.total, h.sum, h.min, h.max = d["total"], d["sum"], d["min"], d["max"]
+        return h
+
+
+# ======================
+#  Simulated players
+# ======================
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+class Player:
+    """Answers prompts from the game's own output.
+
+    strategy "scripted": random untried letters.
+    strategy "solver": most common untried letter among catalog words that still fit
+    the revealed pattern (and the "From:" hint, when shown).
+    """
+
+    def __init__(self, rng, rounds, strategy="scripted"):
+        self.rng = rng
+        self.rounds = rounds
+        self.strategy = strategy
+        self.played = 0
+        self.wins = 0
+        self.guessed = set()
+        self.pattern = None
+        self.hint = None
+
+    def observe(self, text):
+        for line in text.splitlines():
+            if line.startswith("🧩 Word: "):
+                # one char per slot, joined by single spaces (a space in the answer stays a slot)
+                self.pattern = list(line[len("🧩 Word: "):][::2])
+            elif line.startswith("📺 From:"):
+                self.hint = line[len("📺 From:"):].strip()
+            elif "YOU WIN" in line:
+                self.wins += 1
+
+    def reply(self, kind):
+        if kind == "option":
+            if self.played >= self.rounds:
+                return "4"
+            self.played += 1
+            self.guessed = set()
+            self.pattern = None
+            self.hint = None
+            return "1"
+        if kind == "letter":
+            letter = self._solve() if self.strategy == "solver" else None
+            if letter is None:
+                left = [c for c in ALPHABET if c not in self.guessed]
+                letter = self.rng.choice(left) if left else "a"
+            self.guessed.add(letter)
+            return letter
+        if kind == "password":
+            return "tomoe"
+        return ""
+
+    def _solve(self):
+        if not self.pattern:
+            return None
+        pat = self.pattern
+        wrong = {c for c in self.guessed if c not in pat}
+        counts = {}
+        for entry in game.WORDS:
+            w = entry["word"]
+            if len(w) != len(pat) or (self.hint and entry.get("hint") != self.hint):
+                continue
+            if any(p != "_" and p != ch for p, ch in zip(pat, w)):
+                continue
+            if any(ch in wrong for ch in w) or any(p == "_" and ch in self.guessed for p, ch in zip(pat, w)):
+                continue
+            for ch in set(w):
+                if ch not in self.guessed:
+                    counts[ch] = counts.get(ch, 0) + 1
+        if not counts:
+            return None
+        return max(sorted(counts), key=counts.get)
+
+
+class Stats:
+    def __init__(self):
+        self.guess = Histogram()
+        self.prompt = Histogram()
+        self.sessions = 0
+        self.rounds = 0
+        self.wins = 0
+        self.errors = 0
+        self.first_error = None  # repr of the first player failure
+
+    def record(self, kind, seconds):
+        us = seconds * 1e6
+        self.prompt.record(us)
+        if kind == "letter":
+            self.guess.record(us)
+
+
+async def _think(rng, think_ms, jitter):
+    if think_ms > 0:
+        await asyncio.sleep(max(0.0, think_ms * rng.uniform(1 - jitter, 1 + jitter)) / 1000.0)
+
+
+async def engine_player(cfg, idx, rng, stats, saves_dir):
+    """Drive a GameSession directly (no network). Pauses are skipped unless honor_pauses."""
+    player = Player(rng, cfg["rounds"], cfg["strategy"])
+    # acks stay with the player so they count as prompts, like over TCP
+    pacing = game.Pacing("realtime" if cfg["honor_pauses"] else "skip", auto_ack=False)
+    session = game.GameSession(save_path=os.path.join(saves_dir, f"p{idx}{game.SAVE_EXT}"), pacing=pacing)
+    req = session.start()
+    while req is not None:
+        player.observe(session.drain())
+        if isinstance(req, game.Pause):
+            # only reaches us with honor_pauses (skip pacing settles pauses in the session)
+            await asyncio.sleep(req.seconds)
+            req = session.resume()
+            continue
+        answer = player.reply(req.kind)
+        await _think(rng, cfg["think_ms"], cfg["think_jitter"])
+        kind = req.kind
+        t = time.perf_counter()
+        req = session.feed(answer)
+        stats.record(kind, time.perf_counter() - t)
+        if cfg["think_ms"] <= 0 and not cfg["honor_pauses"]:
+            await asyncio.sleep(0)  # let other players run
+    player.observe(session.drain())
+    stats.sessions += 1
+    stats.rounds += player.played
+    stats.wins += player.wins
+
+
+async def tcp_player(cfg, idx, rng, stats):
+    """Framed-mode client against otaku_server.py."""
+    player = Player(rng, cfg["rounds"], cfg["strategy"])
+    reader, writer = await asyncio.open_connection(cfg["host"], cfg["port"], limit=1 << 16)
+    try:
+        await reader.readuntil(b"PROFILE? ")
+        writer.write(f"HELLO {cfg['profile_prefix']}{idx} framed\n".encode())
+        await writer.drain()
+        sent_kind = None
+        sent_at = 0.0
+        buf = []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace")
+            if not text.startswith("?>"):
+                buf.append(text)
+                continue
+            now = time.perf_counter()
+            if sent_kind is not None:
+                stats.record(sent_kind, now - sent_at)
+            player.observe("".join(buf))
+            buf = []
+            kind = text[2:].strip()
+            answer = player.reply(kind)
+            await _think(rng, cfg["think_ms"], cfg["think_jitter"])
+            sent_kind = kind
+            sent_at = time.perf_counter()
+            writer.write((answer + "\n").encode())
+            await writer.drain()
+        player.observe("".join(buf))
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+    stats.sessions += 1
+    stats.rounds += player.played
+    stats.wins += player.wins
+
+
+async def _run_players(cfg, first, count, stats, saves_dir):
+    rng = random.Random(cfg["seed"] * 1_000_003 + first if cfg["seed"] is not None else None)
+
+    async def one(i):
+        prng = random.Random(rng.random())
+        try:
+            if cfg["target"] == "engine":
+                await engine_player(cfg, i, prng, stats, saves_dir)
+            else:
+                await tcp_player(cfg, i, prng, stats)
+        except Exception as e:
+            stats.errors += 1
+            if stats.first_error is None:
+                stats.first_error = repr(e)
+
+    await asyncio.gather(*(one(i) for i in range(first, first + count)))
+
+
+def run_shard(args):
+    """One worker process: `count` players on its own event loop. Returns a plain dict."""
+    cfg, first, count = args
+    stats = Stats()
+    saves_dir = tempfile.mkdtemp(prefix="otaku_loadgen_")
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    try:
+        asyncio.run(_run_players(cfg, first, count, stats, saves_dir))
+    finally:
+        shutil.rmtree(saves_dir, ignore_errors=True)
+    return {
+        "wall_s": time.perf_counter() - t0,
+        "cpu_s": time.process_time() - cpu0,
+        "sessions": stats.sessions,
+        "rounds": stats.rounds,
+        "wins": stats.wins,
+        "errors": stats.errors,
+        "first_error": stats.first_error,
+        "guess": stats.guess.to_dict(),
+        "prompt": stats.prompt.to_dict(),
+    }
+
+
+def run_load(cfg):
+    procs = max(1, min(cfg["procs"], cfg["players"]))
+    per = [cfg["players"] // procs + (1 if i < cfg["players"] % procs else 0) for i in range(procs)]
+    shards = []
+    first = 0
+    for n in per:
+        shards.append((cfg, first, n))
+        first += n
+
+    t0 = time.perf_counter()
+    if procs == 1:
+        results = [run_shard(shards[0])]
+    else:
+        import multiprocessing
+        with multiprocessing.Pool(procs) as pool:
+            results = pool.map(run_shard, shards)
+    wall = time.perf_counter() - t0
+
+    guess = Histogram()
+    prompt = Histogram()
+    for r in results:
+        guess.merge(Histogram.from_dict(r["guess"]))
+        prompt.merge(Histogram.from_dict(r["prompt"]))
+    cpu = sum(r["cpu_s"] for r in results)
+    sessions = sum(r["sessions"] for r in results)
+    rounds = sum(r["rounds"] for r in results)
+    return {
+        "target": cfg["target"],
+        "strategy": cfg["strategy"],
+        "players": cfg["players"],
+        "procs": procs,
+        "think_ms": cfg["think_ms"],
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "sessions": sessions,
+        "rounds": rounds,
+        "wins": sum(r["wins"] for r in results),
+        "errors": sum(r["errors"] for r in results),
+        "first_error": next((r["first_error"] for r in results if r["first_error"]), None),
+        "throughput": {
+            "guesses_per_s": round(guess.total / wall, 1) if wall else 0.0,
+            "rounds_per_s": round(rounds / wall, 1) if wall else 0.0,
+            "sessions_per_cpu_s": round(sessions / cpu, 2) if cpu else 0.0,
+        },
+        "latency": {"guess": guess.summary(), "prompt": prompt.summary()},
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Otaku Hangman load generator")
+    ap.add_argument("--target", choices=("engine", "tcp"), default="engine")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=7878)
+    ap.add_argument("--players", type=int, default=100)
+    ap.add_argument("--rounds", type=int, default=3, help="rounds per player")
+    ap.add_argument("--strategy", choices=("scripted", "solver"), default="solver")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="mean think time per answer")
+    ap.add_argument("--think-jitter", type=float, default=0.5, help="uniform +/- fraction of think time")
+    ap.add_argument("--procs", type=int, default=1, help="worker processes (cores)")
+    ap.add_argument("--honor-pauses", action="store_true", help="engine: sleep through animation pauses")
+    ap.add_argument("--profile-prefix", default="load", help="tcp: profile name prefix")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--out", default=None, help="write the JSON report here too")
+    args = ap.parse_args(argv)
+
+    cfg = {k.replace("-", "_"): v for k, v in vars(args).items()}
+    report = run_load(cfg)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import random
+import re
+import sys
+import time
+
+import otaku_hang_man as game
+
+# ============================================================
+#  OTAKU HANGMAN - SESSION SERVER
+#
+#  Many independent games over plain TCP on one asyncio event loop; game steps (and
+#  their save / journal I/O) run on a small thread pool so disk never stalls the loop.
+#
+#    python otaku_server.py [--host 127.0.0.1] [--port 7878] [--saves DIR]
+#    python otaku_server.py client --players 50 --rounds 3      (smoke/load client)
+#
+#  Protocol (line based, UTF-8):
+#    1. server sends "PROFILE? "; client answers one line:
+#         <name>                 plain mode (telnet / nc: text exactly like the terminal)
+#         HELLO <name> framed    framed mode for bots: after each prompt the server
+#                                sends a line "?>" + kind (option/letter/ack/password/text)
+#    2. every following client line answers the pending prompt.
+#  Each profile gets its own save file (<saves>/<name>.dat; an old <name>.json is migrated).
+# ============================================================
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7878
+DEFAULT_SAVES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saves")
+
+# per-session bounds
+MAX_LINE_BYTES = 1024        # StreamReader limit: longer lines close the session
+IDLE_TIMEOUT = 600.0         # seconds without input before the session is dropped
+MAX_SESSIONS = 10000
+IO_THREADS = 16              # game steps run here: save / journal I/O never blocks the loop
+
+PROMPT_MARK = "?>"
+
+
+def profile_name(raw):
+    """Sanitize a profile name into a safe save-file stem."""
+    name = re.sub(r"[^a-z0-9_-]", "", (raw or "").strip().lower())[:32]
+    return name or "guest"
+
+
+def parse_hello(line):
+    """-> (profile, framed) from the first client line."""
+    parts = (line or "").split()
+    if parts and parts[0].upper() == "HELLO":
+        framed = any(p.lower() == "framed" for p in parts[2:])
+        return profile_name(parts[1] if len(parts) > 1 else ""), framed
+    return profile_name(line), False
+
+
+# ======================
+#  Server
+# ======================
+
+class SessionServer:
+    def __init__(self, saves_dir=DEFAULT_SAVES_DIR, max_sessions=MAX_SESSIONS, idle_timeout=IDLE_TIMEOUT, pacing=None,
+                 io_threads=IO_THREADS):
+        self.saves_dir = saves_dir
+        self.executor = concurrent.futures.ThreadPoolExecutor(io_threads, thread_name_prefix="otaku-io")
+        self.pacing = pacing
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.active = 0
+        self.total = 0
+        os.makedirs(saves_dir, exist_ok=True)
+
+    async def handle(self, reader, writer):
+        if self.active >= self.max_sessions:
+            writer.write(b"Server full, try again later.\n")
+            await self._close(writer)
+            return
+        self.active += 1
+        self.total += 1
+        try:
+            await self._serve(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.active -= 1
+            await self._close(writer)
+
+    async def _serve(self, reader, writer):
+        writer.write(b"PROFILE? ")
+        await writer.drain()
+        first = await self._readline(reader)
+        if first is None:
+            return
+        name, framed = parse_hello(first)
+        session = game.GameSession(save_path=os.path.join(self.saves_dir, name + game.SAVE_EXT), pacing=self.pacing)
+
+        async def lines():
+            while True:
+                line = await self._readline(reader)
+                if line is None:
+                    return
+                yield line
+
+        try:
+            async for out, req in game.stream_session(session, lines(), executor=self.executor):
+                if isinstance(req, game.Ask):
+                    out += req.prompt
+                    if framed:
+                        out += "\n" + PROMPT_MARK + req.kind + "\n"
+                if out:
+                    writer.write(out.encode("utf-8", errors="replace"))
+                    await writer.drain()
+        finally:
+            session.close()
+
+    async def _readline(self, reader):
+        """One input line (without newline), or None on EOF/idle timeout."""
+        try:
+            raw = await asyncio.wait_for(reader.readline(), timeout=self.idle_timeout)
+        except asyncio.TimeoutError:
+            return None
+        if not raw:
+            return None
+        return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    async def _close(self, writer):
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, saves_dir=DEFAULT_SAVES_DIR, max_sessions=MAX_SESSIONS,
+                ready=None, pacing=None):
+    server = SessionServer(saves_dir=saves_dir, max_sessions=max_sessions, pacing=pacing)
+    tcp = await asyncio.start_server(server.handle, host, port, limit=MAX_LINE_BYTES, backlog=1024)
+    addrs = ", ".join(str(s.getsockname()) for s in tcp.sockets)
+    print(f"OTAKU HANGMAN server on {addrs}  (saves: {saves_dir})", flush=True)
+    if ready is not None:
+        ready.set_result(tcp)
+    try:
+        async with tcp:
+            await tcp.serve_forever()
+    finally:
+        server.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ======================
+#  Bundled client (smoke / load)
+# ======================
+
+async def bot_player(host, port, name, rounds, rng):
+    """Framed-mode bot: plays `rounds` normal rounds with random letters, then quits.
+
+    Returns (rounds_played, wins, prompts_answered).
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 16)
+    played = wins = answered = 0
+    letters = []
+    try:
+        await reader.readuntil(b"PROFILE? ")
+        writer.write(f"HELLO {name} framed\n".encode())
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace")
+            if "YOU WIN" in text:
+                wins += 1
+            if not text.startswith(PROMPT_MARK):
+                continue
+            kind = text[len(PROMPT_MARK):].strip()
+            if kind == "option":
+                if played >= rounds:
+                    reply = "4"
+                else:
+                    played += 1
+                    letters = list("abcdefghijklmnopqrstuvwxyz")
+                    rng.shuffle(letters)
+                    reply = "1"
+            elif kind == "letter":
+                reply = letters.pop() if letters else "a"
+            elif kind == "password":
+                reply = "tomoe"
+            else:
+                reply = ""
+            writer.write((reply + "\n").encode())
+            answered += 1
+            await writer.drain()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+    return played, wins, answered
+
+
+async def run_client(host, port, players, rounds, seed=None):
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    results = await asyncio.gather(
+        *(bot_player(host, port, f"bot{i}", rounds, random.Random(rng.random())) for i in range(players)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - t0
+    ok = [r for r in results if not isinstance(r, BaseException)]
+    errors = [r for r in results if isinstance(r, BaseException)]
+    played = sum(r[0] for r in ok)
+    print(f"players={players} ok={len(ok)} errors={len(errors)} rounds={played} "
+          f"wins={sum(r[1] for r in ok)} prompts={sum(r[2] for r in ok)} "
+          f"elapsed={elapsed:.2f}s rounds/s={played / elapsed if elapsed else 0:.1f}")
+    if errors:
+        print("first error:", repr(errors[0]))
+    return 1 if errors else 0
+
+
+# ======================
+#  Main
+# ======================
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Otaku Hangman multi-session TCP server")
+    ap.add_argument("mode", nargs="?", choices=("serve", "client"), default="serve")
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--saves", default=DEFAULT_SAVES_DIR, help="directory for per-profile saves")
+    ap.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    ap.add_argument("--words", default=None, help="word pack from otaku_wordpack.py (default: $OTAKU_WORDPACK)")
+    ap.add_argument("--pacing", default=None, help="realtime | fast[:scale] | skip [+ack|-ack] (default: $OTAKU_PACING)")
+    ap.add_argument("--players", type=int, default=10, help="client: concurrent bots")
+    ap.add_argument("--rounds", type=int, default=2, help="client: rounds per bot")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    if args.mode == "client":
+        return asyncio.run(run_client(args.host, args.port, args.players, args.rounds, args.seed))
+    try:
+        if args.words:
+            game.use_word_pack(args.words)
+        else:
+            game.use_word_pack_from_env()
+    except (OSError, ValueError) as e:
+        print(f"word pack not loaded: {e}", file=sys.stderr)
+        return 2
+    try:
+        pacing = game.Pacing.parse(args.pacing) if args.pacing else None
+    except ValueError:
+        print(f"bad --pacing {args.pacing!r} (use: {game.PACING_USAGE})", file=sys.stderr)
+        return 2
+    try:
+        asyncio.run(serve(args.host, args.port, args.saves, args.max_sessions, pacing=pacing))
+    except KeyboardInterrupt:
+        print("\nBye bye~ (server stopped)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import otaku_hang_man as game
+
+# ============================================================
+#  OTAKU HANGMAN - WORD-PACK COMPILER
+#
+#  Raw word lists in, compact runtime pack out (loaded with --words / OTAKU_WORDPACK).
+#
+#    python otaku_wordpack.py raw1.txt raw2.jsonl -o pack.json
+#    cat huge.txt | python otaku_wordpack.py - -o pack.json
+#    python otaku_wordpack.py --builtin -o pack.json          (the WORDS literal)
+#
+#  Input, one entry per line (streamed, any mix):
+#    word                      anime title (no hint)
+#    word<TAB>hint | word|hint character + the anime it is from
+#    {"word": ..., "hint": ...}
+#    # comment / blank         skipped
+#
+#  Words go through game.normalize (inner whitespace collapsed) and are deduplicated
+#  (first one wins). Spaces, digits and punctuation are fine (rounds pre-reveal
+#  them), accented Latin letters fold to a-z; other letters (kana, kanji, Cyrillic...)
+#  and words with no letter to guess are flagged and left out unless --keep-unguessable.
+# ============================================================
+
+PACK_FORMAT = "otaku-wordpack"
+PACK_VERSION = 1
+
+_SPACES = re.compile(r"\s+")
+MAX_SAMPLES = 10           # problem entries kept for the report (the rest are only counted)
+
+
+def normalize_hint(hint):
+    """'  Chainsaw   Man ' -> 'chainsaw man'; empty -> None."""
+    if hint is None:
+        return None
+    hint = _SPACES.sub(" ", str(hint)).strip().lower()
+    return hint or None
+
+
+def parse_line(line):
+    """-> (word, hint) or None for blank / comment lines. Raises ValueError on bad JSON."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        obj = json.loads(line)
+        return str(obj.get("word") or ""), obj.get("hint")
+    for sep in ("\t", "|"):
+        if sep in line:
+            word, hint = line.split(sep, 1)
+            return word, hint
+    return line, None
+
+
+def unguessable_chars(word):
+    """None if a round can be played with `word`, else the offending chars ("" = no letter at all)."""
+    if word.isascii():
+        return None if any(ch.isalpha() for ch in word) else ""
+    bad = {ch for ch in word if ch.isalpha() and game.letter_of(ch) is None}
+    if bad:
+        return "".join(sorted(bad))
+    return None if any(game.is_guessable_char(ch) for ch in word) else ""
+
+
+def _where(where):
+    """(source, line) -> 'source:line' (formatted only when reported)."""
+    return f"{where[0]}:{where[1]}" if isinstance(where, tuple) else str(where)
+
+
+class PackCompiler:
+    """Streaming compiler: feed entries with add(), then pack() / report()."""
+
+    def __init__(self, keep_unguessable=False):
+        self.keep_unguessable = keep_unguessable
+        self.seen = {}          # word -> hint (the dedup hash set, remembering the hint)
+        self.groups = {}        # hint -> [words], in first-seen order (None = titles)
+        self.read = 0
+        self.skipped = 0
+        self.duplicates = 0
+        self.hint_conflicts = 0
+        self.invalid = 0
+        self.unguessable = 0
+        self.invalid_samples = []       # first MAX_SAMPLES (where, reason)
+        self.unguessable_samples = []   # first MAX_SAMPLES (word, bad chars)
+        self._hints = {}        # raw hint -> normalized (hint lists repeat a lot)
+
+    def add(self, word, hint=None, where=""):
+        self.read += 1
+        word = game.normalize(word)
+        if "  " in word or "\t" in word:
+            word = _SPACES.sub(" ", word)
+        if not word:
+            self._invalid(where, "empty word")
+            return False
+        try:
+            hint = self._hints[hint]
+        except KeyError:
+            hint = self._hints[hint] = normalize_hint(hint)
+        except TypeError:
+            hint = normalize_hint(hint)
+        prev = self.seen.get(word, self)
+        if prev is not self:
+            self.duplicates += 1
+            if prev != hint:
+                self.hint_conflicts += 1
+            return False
+        self.seen[word] = hint
+        bad = unguessable_chars(word)
+        if bad is not None:
+            self.unguessable += 1
+            if len(self.unguessable_samples) < MAX_SAMPLES:
+                self.unguessable_samples.append((word, bad))
+            if not self.keep_unguessable:
+                return False
+        group = self.groups.get(hint)
+        if group is None:
+            group = self.groups[hint] = []
+        group.append(word)
+        return True
+
+    def _invalid(self, where, reason):
+        self.invalid += 1
+        if len(self.invalid_samples) < MAX_SAMPLES:
+            self.invalid_samples.append((where, reason))
+
+    def add_lines(self, lines, source="-"):
+        add = self.add
+        for n, line in enumerate(lines, 1):
+            try:
+                entry = parse_line(line)
+            except ValueError as e:
+                self.read += 1
+                self._invalid((source, n), f"bad JSON ({e.msg})")
+                continue
+            if entry is None:
+                self.skipped += 1
+                continue
+            add(entry[0], entry[1], (source, n))
+
+    @property
+    def count(self):
+        return sum(len(words) for words in self.groups.values())
+
+    def pack(self):
+        """Runtime format: words grouped by hint, titles (no hint) first."""
+        groups = sorted(self.groups.items(), key=lambda kv: kv[0] is not None)
+        return {
+            "format": PACK_FORMAT,
+            "version": PACK_VERSION,
+            "count": self.count,
+            "groups": [[hint, words] for hint, words in groups],
+        }
+
+    def report(self):
+        lines = [
+            f"read {self.read}  skipped {self.skipped}  emitted {self.count}"
+            f" ({len(self.groups)} hint groups)",
+            f"duplicates {self.duplicates}  (with a different hint: {self.hint_conflicts})",
+        ]
+        if self.unguessable:
+            action = "kept" if self.keep_unguessable else "dropped"
+            sample = ", ".join(f"{w} [{bad or 'no letters'}]" for w, bad in self.unguessable_samples)
+            lines.append(f"unguessable {self.unguessable} ({action}): {sample}")
+        if self.invalid:
+            sample = ", ".join(f"{_where(where)} {why}" for where, why in self.invalid_samples)
+            lines.append(f"invalid {self.invalid}: {sample}")
+        return "\n".join(lines)
+
+
+def write_pack(pack, path):
+    data = json.dumps(pack, ensure_ascii=False, separators=(",", ":"))
+    if path == "-":
+        sys.stdout.write(data + "\n")
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data + "\n")
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compile raw word lists into an Otaku Hangman word pack")
+    ap.add_argument("inputs", nargs="*", help="raw list files ('-' = stdin)")
+    ap.add_argument("-o", "--out", default="-", help="pack file (default: stdout)")
+    ap.add_argument("--builtin", action="store_true", help="also compile the built-in WORDS list")
+    ap.add_argument("--keep-unguessable", action="store_true", help="keep words a round can never reveal")
+    ap.add_argument("--strict", action="store_true", help="exit 1 on invalid or unguessable entries")
+    args = ap.parse_args(argv)
+    if not args.inputs and not args.builtin:
+        ap.error("no input (give files, '-' for stdin, or --builtin)")
+
+    t0 = time.perf_counter()
+    compiler = PackCompiler(keep_unguessable=args.keep_unguessable)
+    if args.builtin:
+        for i, entry in enumerate(game.WORDS):
+            compiler.add(str(entry["word"]), entry.get("hint"), f"WORDS[{i}]")
+    for path in args.inputs:
+        if path == "-":
+            compiler.add_lines(sys.stdin, "-")
+            continue
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            compiler.add_lines(f, path)
+    write_pack(compiler.pack(), args.out)
+    elapsed = time.perf_counter() - t0
+
+    rate = compiler.read / elapsed if elapsed else 0.0
+    print(compiler.report() + f"\n{elapsed:.2f}s ({rate:,.0f} entries/s)", file=sys.stderr)
+    if args.strict and (compiler.invalid or compiler.unguessable):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import functools
+import string
+
+import otaku_hang_man as game
+
+
+def _headers(entry, label, save_path):
+    """Play one filtered round of `entry` under a pool labelled `label`; -> its HP/level lines."""
+    out = []
+    pool = game.WordPool(label, [entry])
+    session = game.GameSession(
+        entry=functools.partial(
+            game.play_round, max_lives=game.BASE_LIVES, level_name="LEVEL 1",
+            frames=game.FRAMES_L1, save=game.default_save(), pool=pool, mode="franchise",
+        ),
+        write=out.append,
+        save_path=save_path,
+        pacing=game.Pacing("skip", auto_ack=True),
+    )
+    letters = iter(string.ascii_lowercase * 2)
+    req = session.start()
+    while req is not None:
+        req = session.feed(next(letters)) if isinstance(req, game.Ask) else session.resume()
+    return [line for line in "".join(out).splitlines() if "HP:" in line]
+
+
+def test_round_header_never_contains_the_answer(tmp_path):
+    index = game.franchise_index()
+    names = [name for name, _size in index.franchises()] + list(index.KINDS)
+    save_path = str(tmp_path / "save.dat")
+    for name in names:
+        pool = index.pool(name)
+        for entry in pool.seq[pool.start:pool.end]:
+            answer = game._squash(entry["word"])
+            headers = _headers(entry, pool.label, save_path)
+            assert headers
+            for line in headers:
+                assert answer not in game._squash(line.split("🌟", 1)[1]), (name, entry["word"], line)
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import otaku_hang_man as game
+
+
+@pytest.fixture
+def save_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "otaku_save.dat")
+    monkeypatch.setattr(game, "SAVE_FILE", path)
+    return path
+
+
+def _played(save_file):
+    save = game.load_save()
+    save["challenge_clears"] = 3
+    assert game.write_save(save)
+    return save
+
+
+def test_lock_failure_reads_the_save_instead_of_defaults(save_file, monkeypatch):
+    _played(save_file)
+
+    def no_lock(self):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(game.SaveLock, "__enter__", no_lock)
+    assert game.load_save()["challenge_clears"] == 3
+
+
+def test_read_error_is_raised_not_defaulted(save_file, monkeypatch):
+    _played(save_file)
+
+    def unreadable(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(game, "_read_save", unreadable)
+    with pytest.raises(PermissionError):
+        game.load_save()
+    assert os.path.exists(save_file)
+    assert not os.path.exists(save_file + ".bad")
+
+
+def test_corrupt_save_is_quarantined_and_recovered(save_file):
+    _played(save_file)
+    save = game.load_save()
+    save["challenge_clears"] = 4
+    assert game.write_save(save)
+    with open(save_file, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"\0")
+    assert game.load_save()["challenge_clears"] == 3
+    assert os.path.exists(save_file + ".bad")
@@ -0,0 +1,39 @@
+import otaku_hang_man as game
+
+
+def test_pump_answers_queued_input_without_waiting():
+    async def entry():
+        first = await game.ask("1? ")
+        second = await game.ask("2? ")
+        game.say(first + second)
+
+    session = game.GameSession(entry=entry, pacing=game.Pacing("realtime"))
+    before = game.metrics.snapshot().get("input_latency", {}).get("count", 0)
+    assert isinstance(session.start(), game.Ask)
+    session.inputs.put("a")
+    session.inputs.put("b")
+    assert session.pump() is None
+    assert session.finished
+    assert session.drain() == "ab\n"
+    latency = game.metrics.snapshot()["input_latency"]
+    assert latency["count"] == before + 2
+    assert latency["max_ms"] < 10.0
+
+
+def test_cancel_during_pause_closes_the_session():
+    cleaned = []
+
+    async def entry():
+        try:
+            await game.pause(60)
+            game.say("not reached")
+        finally:
+            cleaned.append(True)
+
+    session = game.GameSession(entry=entry, pacing=game.Pacing("realtime"))
+    assert isinstance(session.start(), game.Pause)
+    session.token.cancel()
+    assert session.resume() is None
+    assert session.finished
+    assert cleaned == [True]
+    assert session.drain() == ""